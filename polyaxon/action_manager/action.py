@@ -12,10 +12,16 @@ class Action(object):
     name = None
     description = ''
     event_type = None
+    # The event types the action is executed for by the notifier, None for all the event types
+    event_types = None
     raise_empty_context = True
     check_config = True
     logger = logger
 
+    @classmethod
+    def can_handle(cls, event_type):
+        return cls.event_types is None or event_type in cls.event_types
+
     @classmethod
     def _validate_config(cls, config):
         """Validate that a given config is valid for the current config."""
@@ -57,16 +63,17 @@ class Action(object):
 
     @classmethod
     def execute(cls, context, config=None, from_user=None, from_event=False):
+        # The config is checked first, the events are not serialized for unconfigured actions
+        config = cls.get_config(config=config)
+        if cls.check_config and not config:
+            return False
+
         if from_event:
             context = cls.serialize_event_to_context(event=context)
             if not context:
                 logger.warning('%s could not serializer event.', cls.name)
                 return False
 
-        config = cls.get_config(config=config)
-        if cls.check_config and not config:
-            return False
-
         data = cls._prepare(context)
         try:
             result = cls._execute(data=data, config=config)
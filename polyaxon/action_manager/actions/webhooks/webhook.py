@@ -1,14 +1,15 @@
-from requests import RequestException
+import copy
 
 from django.conf import settings
 
 from action_manager.action import Action, logger
 from action_manager.action_event import ActionExecutedEvent
+from action_manager.dispatcher import webhook_dispatcher
 from action_manager.exceptions import PolyaxonActionException
 from event_manager.event_actions import EXECUTED
 from event_manager.event_context import get_event_context, get_readable_event
 from libs.date_utils import to_timestamp
-from libs.http import safe_request, validate_url
+from libs.http import validate_url
 from schemas.utils import to_list
 
 WEBHOOK_ACTION_EXECUTED = 'webhook_action.{}'.format(EXECUTED)
@@ -92,12 +93,16 @@ class WebHookAction(Action):
 
     @classmethod
     def _execute(cls, data, config):
+        """Schedule the delivery of the web hooks, see `WebHookDispatcher`."""
         for web_hook in config:
             data = cls._pre_execute_web_hook(data=data, config=web_hook)
-            try:
-                if web_hook['method'] == 'POST':
-                    safe_request(url=web_hook['url'], method=web_hook['method'], json=data)
-                else:
-                    safe_request(url=web_hook['url'], method=web_hook['method'], params=data)
-            except RequestException:
-                logger.warning("Could not send web hook, execption.", exc_info=True)
+            # The next web hooks alter the data before this payload is sent
+            payload = copy.deepcopy(data)
+            if web_hook['method'] == 'POST':
+                webhook_dispatcher.dispatch(url=web_hook['url'],
+                                            method=web_hook['method'],
+                                            json=payload)
+            else:
+                webhook_dispatcher.dispatch(url=web_hook['url'],
+                                            method=web_hook['method'],
+                                            params=payload)
@@ -0,0 +1,232 @@
+import heapq
+import itertools
+import os
+import requests
+import threading
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.utils import timezone
+
+from action_manager.action import logger
+from db.redis.webhooks import RedisWebHookDeadLetters
+from libs.date_utils import to_timestamp
+from libs.http import safe_request
+
+
+class RateLimiter(object):
+    """Spaces the slots acquired with `acquire` by at least 1 / rate seconds."""
+
+    def __init__(self, rate):
+        self.interval = 1. / rate
+        self._next_slot = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take the next slot if it is available, otherwise return the seconds before it is."""
+        with self._lock:
+            now = time.monotonic()
+            if self._next_slot > now:
+                return self._next_slot - now
+            self._next_slot = now + self.interval
+            return 0
+
+
+class Delivery(object):
+    def __init__(self, url, method, json=None, params=None):
+        self.url = url
+        self.host = urlparse(url).netloc
+        self.method = method
+        self.json = json
+        self.params = params
+        self.attempts = 0
+        self.error = None
+        self.future = Future()
+
+
+class WebHookDispatcher(object):
+    """Delivers the web hooks from a pool of workers, without blocking the callers.
+
+    Every host has a session keeping its connections alive and a rate limit.
+    The deliveries failing with a connection error, a timeout, a 429 or a 5xx status
+    are retried with an exponential backoff, and recorded as dead letters
+    when all retries failed.
+
+    The workers never wait: a scheduler thread hands the deliveries to the workers
+    when they are due, and reschedules the ones over the rate limit of their host.
+    The web hooks dispatched while `queue_size` deliveries are pending
+    are recorded as dead letters without being sent.
+    """
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, workers, rate_limit, max_retries, backoff, timeout, queue_size):
+        self.workers = workers
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.queue_size = queue_size
+        self._executor = None
+        self._sessions = {}
+        self._rate_limiters = {}
+        self._scheduled = []
+        self._counter = itertools.count()
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get_executor(self):
+        # The pool and the scheduler are created by the first delivery of every process,
+        # e.g. after a fork
+        with self._lock:
+            if self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+                self._sessions = {}
+                self._rate_limiters = {}
+                self._scheduled = []
+                self._pending = 0
+                self._condition = threading.Condition()
+                self._pid = os.getpid()
+                threading.Thread(target=self.run_scheduler, daemon=True).start()
+            return self._executor
+
+    def get_session(self, host):
+        with self._lock:
+            if host not in self._sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+            return self._sessions[host]
+
+    def get_rate_limiter(self, host):
+        with self._lock:
+            if host not in self._rate_limiters:
+                self._rate_limiters[host] = RateLimiter(rate=self.rate_limit)
+            return self._rate_limiters[host]
+
+    def dispatch(self, url, method, json=None, params=None):
+        """Schedule the delivery of a web hook and return its future."""
+        delivery = Delivery(url=url, method=method, json=json, params=params)
+        self.get_executor()
+        with self._condition:
+            is_full = self._pending >= self.queue_size
+            if not is_full:
+                self._pending += 1
+                self._schedule(delivery=delivery, delay=0)
+        if is_full:
+            delivery.error = 'The web hooks queue is full.'
+            self.fail(delivery=delivery)
+            delivery.future.set_result(None)
+        return delivery.future
+
+    def _schedule(self, delivery, delay):
+        heapq.heappush(self._scheduled,
+                       (time.monotonic() + delay, next(self._counter), delivery))
+        self._condition.notify()
+
+    def schedule(self, delivery, delay):
+        with self._condition:
+            self._schedule(delivery=delivery, delay=delay)
+
+    def get_due_delivery(self):
+        with self._condition:
+            while True:
+                timeout = None
+                if self._scheduled:
+                    timeout = self._scheduled[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        return heapq.heappop(self._scheduled)[2]
+                self._condition.wait(timeout)
+
+    def run_scheduler(self):
+        while True:
+            delivery = self.get_due_delivery()
+            delay = self.get_rate_limiter(delivery.host).acquire()
+            if delay:
+                self.schedule(delivery=delivery, delay=delay)
+            else:
+                self._executor.submit(self.deliver, delivery=delivery)
+
+    def deliver(self, delivery):
+        """Send a delivery once, and reschedule it if it can be retried."""
+        try:
+            response = self.send(delivery=delivery)
+        except Exception as e:
+            self.complete(delivery=delivery)
+            delivery.future.set_exception(e)
+            return
+        if delivery.error is None:
+            self.complete(delivery=delivery)
+            delivery.future.set_result(response)
+            return
+        if response is None or response.status_code in self.RETRY_STATUSES:
+            if delivery.attempts <= self.max_retries:
+                self.schedule(delivery=delivery,
+                              delay=self.backoff * 2 ** (delivery.attempts - 1))
+                return
+
+        self.fail(delivery=delivery)
+        self.complete(delivery=delivery)
+        delivery.future.set_result(None)
+
+    def send(self, delivery):
+        delivery.attempts += 1
+        delivery.error = None
+        try:
+            response = safe_request(url=delivery.url,
+                                    method=delivery.method,
+                                    json=delivery.json,
+                                    params=delivery.params,
+                                    timeout=self.timeout,
+                                    session=self.get_session(delivery.host))
+        except RequestException as e:
+            delivery.error = str(e)
+            return None
+        if response.status_code >= 400:
+            delivery.error = 'Received status {}.'.format(response.status_code)
+        return response
+
+    def complete(self, delivery):
+        with self._condition:
+            self._pending -= 1
+
+    def fail(self, delivery):
+        logger.warning('Could not deliver web hook to `%s` after %s attempts: %s',
+                       delivery.url, delivery.attempts, delivery.error)
+        self.record_dead_letter(url=delivery.url,
+                                method=delivery.method,
+                                payload=delivery.json or delivery.params,
+                                error=delivery.error,
+                                attempts=delivery.attempts)
+
+    @staticmethod
+    def record_dead_letter(url, method, payload, error, attempts):
+        try:
+            RedisWebHookDeadLetters.add({
+                'url': url,
+                'method': method,
+                'payload': payload,
+                'error': error,
+                'attempts': attempts,
+                'datetime': to_timestamp(timezone.now()),
+            })
+        except Exception:
+            logger.error('Could not record the web hook dead letter.', exc_info=True)
+
+
+webhook_dispatcher = WebHookDispatcher(
+    workers=settings.WebHooksDispatcher.WORKERS,
+    rate_limit=settings.WebHooksDispatcher.RATE_LIMIT,
+    max_retries=settings.WebHooksDispatcher.MAX_RETRIES,
+    backoff=settings.WebHooksDispatcher.BACKOFF / 1000.,
+    timeout=settings.WebHooksDispatcher.TIMEOUT,
+    queue_size=settings.WebHooksDispatcher.QUEUE_SIZE,
+)
@@ -1,3 +1,5 @@
+from django.conf import settings
+
 from activitylogs.manager import default_manager
 from activitylogs.service import ActivityLogService
 from libs.services import LazyServiceWrapper
@@ -5,7 +7,12 @@ from libs.services import LazyServiceWrapper
 backend = LazyServiceWrapper(
     backend_base=ActivityLogService,
     backend_path='activitylogs.service.ActivityLogService',
-    options={}
+    options={
+        'write_window': settings.AuditorWriteBuffer.WINDOW / 1000.,
+        'write_size': settings.AuditorWriteBuffer.SIZE,
+        'views_window': settings.ActivityLogsViews.WINDOW,
+        'views_sample_rate': settings.ActivityLogsViews.SAMPLE_RATE / 100.,
+    }
 )
 backend.expose(locals())
 
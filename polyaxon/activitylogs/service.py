@@ -1,25 +1,79 @@
+import random
+
+from functools import partial
+
+from django.db import transaction
+
 from activitylogs.manager import default_manager
 from constants import user_system
+from db.redis.activity_views import RedisActivityViews
+from event_manager.buffered_writer import BufferedWriter, get_content_type_id
+from event_manager.event_actions import VIEW_ACTIONS
 from event_manager.event_service import EventService
 
 
 class ActivityLogService(EventService):
     event_manager = default_manager
+    stats_key = 'activitylogs'
 
-    def __init__(self):
+    def __init__(self, write_window=0, write_size=500, views_window=0, views_sample_rate=1.):
         self.activity_log = None
+        self.write_window = write_window
+        self.write_size = write_size
+        self.writer = None
+        self.views_window = views_window
+        self.views_sample_rate = views_sample_rate
 
-    def record_event(self, event):
+    def filter_views(self, events):
+        """Drop the views not sampled and the views already recorded in their window.
+
+        The other events are all kept.
+        """
+        if not self.views_window and self.views_sample_rate >= 1:
+            return events
+
+        keep = []
+        views = []
+        for i, event in enumerate(events):
+            is_view = event.get_event_action() in VIEW_ACTIONS
+            keep.append(not is_view or random.random() < self.views_sample_rate)
+            if is_view and keep[i] and self.views_window:
+                views.append(i)
+        if views:
+            marked = RedisActivityViews.mark_views(
+                [(events[i].event_type, events[i].instance.pk, events[i].data[events[i].actor_id])
+                 for i in views],
+                ttl=self.views_window)
+            for i, is_new in zip(views, marked):
+                keep[i] = is_new
+        return [event for event, is_kept in zip(events, keep) if is_kept]
+
+    def get_activity_log(self, event):
         assert event.actor_id is not None
         actor_id = event.data[event.actor_id]
-        return self.activity_log.objects.create(
+        return self.activity_log(
             event_type=event.event_type,
             actor_id=actor_id if actor_id != user_system.USER_SYSTEM_ID else None,
             context=event.data,
             created_at=event.datetime,
-            content_object=event.instance,
+            content_type_id=get_content_type_id(event.instance),
+            object_id=event.instance.pk,
         )
 
+    def record_event(self, event):
+        if not self.filter_views([event]):
+            return None
+        activity_log = self.get_activity_log(event)
+        if self.writer:
+            transaction.on_commit(partial(self.writer.add, activity_log))
+        else:
+            activity_log.save()
+        return activity_log
+
+    def record_events(self, events):
+        return self.activity_log.objects.bulk_create(
+            [self.get_activity_log(event) for event in self.filter_views(events)])
+
     def setup(self):
         super().setup()
         # Load default event types
@@ -28,3 +82,7 @@ class ActivityLogService(EventService):
         from db.models.activitylogs import ActivityLog
 
         self.activity_log = ActivityLog
+        if self.write_window:
+            self.writer = BufferedWriter(write=self.activity_log.objects.bulk_create,
+                                         size=self.write_size,
+                                         window=self.write_window)
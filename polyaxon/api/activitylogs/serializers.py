@@ -1,16 +1,20 @@
 from rest_framework import serializers
 
+from api.utils.serializers.eager_loading import EagerLoadingMixin
 from constants import user_system
 from db.models.activitylogs import ActivityLog
 from event_manager import event_context
 
 
-class ActivityLogsSerializer(serializers.ModelSerializer):
+class ActivityLogsSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     object_name = serializers.SerializerMethodField()
     event_action = serializers.SerializerMethodField()
     event_subject = serializers.SerializerMethodField()
     actor = serializers.SerializerMethodField()
 
+    select_related_fields = ('actor', 'content_type')
+    prefetch_related_fields = ('content_object',)
+
     class Meta:
         model = ActivityLog
         fields = [
@@ -6,12 +6,13 @@ from django.db.models import Q
 import activitylogs
 
 from api.activitylogs.serializers import ActivityLogsSerializer
+from api.utils.views.eager_loading import EagerLoadingMixinView
 from constants import content_types
 from db.models.activitylogs import ActivityLog
 from db.models.projects import Project
 
 
-class HistoryLogsView(ListAPIView):
+class HistoryLogsView(EagerLoadingMixinView, ListAPIView):
     """Activity logs list view."""
     # Filter only for user write events
     queryset = ActivityLog.objects.order_by('-created_at').filter(
@@ -19,13 +20,14 @@ class HistoryLogsView(ListAPIView):
     )
     serializer_class = ActivityLogsSerializer
     permission_classes = (IsAuthenticated,)
+    cursor_ordering = ('-created_at', '-id')
 
     def filter_queryset(self, queryset):
         queryset = queryset.filter(actor=self.request.user)
         return super().filter_queryset(queryset=queryset)
 
 
-class ActivityLogsView(ListAPIView):
+class ActivityLogsView(EagerLoadingMixinView, ListAPIView):
     """Activity logs list view."""
     # Filter only for user write events
     queryset = ActivityLog.objects.order_by('-created_at').filter(
@@ -33,6 +35,7 @@ class ActivityLogsView(ListAPIView):
     )
     serializer_class = ActivityLogsSerializer
     permission_classes = (IsAuthenticated,)
+    cursor_ordering = ('-created_at', '-id')
 
 
 class ProjectActivityLogsView(ActivityLogsView):
@@ -5,44 +5,61 @@ from api.experiment_groups.serializers import ExperimentGroupSerializer
 from api.experiments.serializers import ExperimentSerializer
 from api.jobs.serializers import JobSerializer
 from api.projects.serializers import ProjectSerializer
+from api.utils.serializers.eager_loading import EagerLoadingMixin
 from db.models.bookmarks import Bookmark
 
 
-class BuildJobBookmarkSerializer(serializers.ModelSerializer):
+def get_content_object_prefetch(serializer_class):
+    # The bookmarked objects are prefetched with the related objects read by their serializer
+    return ('content_object',) + tuple(
+        'content_object__{}'.format(field) for field in serializer_class.select_related_fields)
+
+
+class BuildJobBookmarkSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     content_object = BuildJobSerializer()
 
+    prefetch_related_fields = get_content_object_prefetch(BuildJobSerializer)
+
     class Meta:
         model = Bookmark
         fields = ['content_object']
 
 
-class JobBookmarkSerializer(serializers.ModelSerializer):
+class JobBookmarkSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     content_object = JobSerializer()
 
+    prefetch_related_fields = get_content_object_prefetch(JobSerializer)
+
     class Meta:
         model = Bookmark
         fields = ['content_object']
 
 
-class ExperimentBookmarkSerializer(serializers.ModelSerializer):
+class ExperimentBookmarkSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     content_object = ExperimentSerializer()
 
+    prefetch_related_fields = get_content_object_prefetch(ExperimentSerializer)
+
     class Meta:
         model = Bookmark
         fields = ['content_object']
 
 
-class ExperimentGroupBookmarkSerializer(serializers.ModelSerializer):
+class ExperimentGroupBookmarkSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     content_object = ExperimentGroupSerializer()
 
+    prefetch_related_fields = get_content_object_prefetch(ExperimentGroupSerializer)
+
     class Meta:
         model = Bookmark
         fields = ['content_object']
 
 
-class ProjectBookmarkSerializer(serializers.ModelSerializer):
+class ProjectBookmarkSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     content_object = ProjectSerializer()
 
+    prefetch_related_fields = get_content_object_prefetch(ProjectSerializer)
+
     class Meta:
         model = Bookmark
         fields = ['content_object']
@@ -15,6 +15,7 @@ from api.bookmarks.serializers import (
     ProjectBookmarkSerializer
 )
 from api.filters import OrderingFilter
+from api.utils.views.eager_loading import EagerLoadingMixinView
 from api.utils.views.post import PostAPIView
 from constants import content_types
 from db.models.bookmarks import Bookmark
@@ -41,7 +42,7 @@ from event_manager.events.project import PROJECT_BOOKMARKED, PROJECT_UNBOOKMARKE
 from libs.permissions.projects import IsProjectOwnerOrPublicReadOnly, get_permissible_project
 
 
-class BookmarkListView(ListAPIView):
+class BookmarkListView(EagerLoadingMixinView, ListAPIView):
     """Base Bookmark list view."""
     queryset = Bookmark.objects.all()
     permission_classes = (IsAuthenticated,)
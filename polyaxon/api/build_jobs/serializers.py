@@ -1,6 +1,7 @@
 from rest_framework import fields, serializers
 
 from api.utils.serializers.bookmarks import BookmarkedSerializerMixin
+from api.utils.serializers.eager_loading import EagerLoadingMixin
 from api.utils.serializers.tags import TagsSerializerMixin
 from db.models.build_jobs import BuildJob, BuildJobStatus
 from db.models.experiments import Experiment
@@ -17,13 +18,15 @@ class BuildJobStatusSerializer(serializers.ModelSerializer):
         exclude = []
 
 
-class BuildJobSerializer(serializers.ModelSerializer):
+class BuildJobSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     uuid = fields.UUIDField(format='hex', read_only=True)
     user = fields.SerializerMethodField()
     project = fields.SerializerMethodField()
     started_at = fields.DateTimeField(read_only=True)
     finished_at = fields.DateTimeField(read_only=True)
 
+    select_related_fields = ('user', 'project__user', 'status')
+
     class Meta:
         model = BuildJob
         fields = (
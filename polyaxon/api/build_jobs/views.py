@@ -30,6 +30,7 @@ from api.build_jobs.serializers import (
 from api.filters import OrderingFilter, QueryFilter
 from api.utils.views.auditor_mixin import AuditorMixinView
 from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
+from api.utils.views.eager_loading import EagerLoadingMixinView
 from api.utils.views.list_create import ListCreateAPIView
 from db.models.build_jobs import BuildJob, BuildJobStatus
 from db.redis.tll import RedisTTL
@@ -52,7 +53,7 @@ from polyaxon.settings import SchedulerCeleryTasks
 _logger = logging.getLogger("polyaxon.views.builds")
 
 
-class ProjectBuildListView(BookmarkedListMixinView, ListCreateAPIView):
+class ProjectBuildListView(BookmarkedListMixinView, EagerLoadingMixinView, ListCreateAPIView):
     """
     get:
         List builds under a project.
@@ -2,6 +2,7 @@ from rest_framework import fields, serializers
 from rest_framework.exceptions import ValidationError
 
 from api.utils.serializers.bookmarks import BookmarkedSerializerMixin
+from api.utils.serializers.eager_loading import EagerLoadingMixin
 from api.utils.serializers.tags import TagsSerializerMixin
 from db.models.experiment_groups import (
     ExperimentGroup,
@@ -20,11 +21,13 @@ class ExperimentGroupStatusSerializer(serializers.ModelSerializer):
         exclude = []
 
 
-class ExperimentGroupSerializer(serializers.ModelSerializer):
+class ExperimentGroupSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     uuid = fields.UUIDField(format='hex', read_only=True)
     project = fields.SerializerMethodField()
     user = fields.SerializerMethodField()
 
+    select_related_fields = ('user', 'project__user', 'status')
+
     class Meta:
         model = ExperimentGroup
         fields = (
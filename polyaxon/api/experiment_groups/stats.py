@@ -0,0 +1,156 @@
+import re
+
+from rest_framework.exceptions import ValidationError
+
+from django.contrib.postgres.fields.jsonb import KeyTextTransform, KeyTransform
+from django.db.models import (
+    Avg,
+    Case,
+    CharField,
+    Count,
+    F,
+    FloatField,
+    Func,
+    Max,
+    Min,
+    StdDev,
+    When
+)
+from django.db.models.functions import Cast
+
+from db.redis.group_stats import RedisGroupStats
+from libs.aggregates import Percentiles
+
+DEFAULT_PERCENTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+DEFAULT_TOP_K = 10
+MAX_TOP_K = 100
+MAX_KEYS = 20
+# The names are used as json keys in the queries, the key transforms do not escape them
+NAME_PATTERN = re.compile(r'^[\w.\-]+$')
+
+
+def _get_names_param(query_params, key):
+    names = query_params.get(key)
+    names = [name.strip() for name in names.split(',') if name.strip()] if names else []
+    if len(names) > MAX_KEYS:
+        raise ValidationError('`{}` accepts at most {} names.'.format(key, MAX_KEYS))
+    for name in names:
+        if not NAME_PATTERN.match(name):
+            raise ValidationError('`{}` received an invalid name `{}`.'.format(key, name))
+    return sorted(set(names))
+
+
+def get_group_stats_params(query_params):
+    """Validate and return the group statistics query params.
+
+    Query params:
+        * metrics: comma separated metric names.
+        * declarations: comma separated declaration names.
+        * percentiles: comma separated percentiles between 0 and 1.
+        * top_k: the number of best and worst experiments per metric.
+    """
+    percentiles = query_params.get('percentiles')
+    if percentiles:
+        try:
+            percentiles = sorted({float(p) for p in percentiles.split(',') if p.strip()})
+        except ValueError:
+            raise ValidationError(
+                '`percentiles` must be numbers, received `{}`.'.format(percentiles))
+        if not percentiles or not all(0 <= p <= 1 for p in percentiles):
+            raise ValidationError('`percentiles` must be between 0 and 1.')
+    else:
+        percentiles = list(DEFAULT_PERCENTILES)
+    top_k = query_params.get('top_k', DEFAULT_TOP_K)
+    try:
+        top_k = int(top_k)
+    except (TypeError, ValueError):
+        raise ValidationError('`top_k` must be an integer, received `{}`.'.format(top_k))
+    if not 0 <= top_k <= MAX_TOP_K:
+        raise ValidationError('`top_k` must be between 0 and {}.'.format(MAX_TOP_K))
+    return {
+        'metrics': _get_names_param(query_params, 'metrics'),
+        'declarations': _get_names_param(query_params, 'declarations'),
+        'percentiles': percentiles,
+        'top_k': top_k,
+    }
+
+
+def get_metric_stats(queryset, metric, percentiles, top_k):
+    """Return the distribution of a metric's last values and the best and worst experiments.
+
+    Only the numeric values are cast, the experiments with other values are skipped.
+    """
+    queryset = queryset.annotate(
+        value_type=Func(KeyTransform(metric, 'last_metric'),
+                        function='jsonb_typeof',
+                        output_field=CharField())
+    ).annotate(
+        value=Case(When(value_type='number',
+                        then=Cast(KeyTextTransform(metric, 'last_metric'), FloatField())),
+                   output_field=FloatField())
+    ).filter(value__isnull=False)
+    stats = queryset.aggregate(count=Count('value'),
+                               min=Min('value'),
+                               max=Max('value'),
+                               mean=Avg('value'),
+                               stddev=StdDev('value'),
+                               percentiles=Percentiles('value', percentiles))
+    stats['percentiles'] = dict(zip([str(p) for p in percentiles],
+                                    stats['percentiles'] or [None] * len(percentiles)))
+    for key, order_by in [('top', F('value').desc()), ('bottom', F('value').asc())]:
+        stats[key] = [
+            {'id': experiment_id, 'value': value} for experiment_id, value in
+            queryset.order_by(order_by, 'id').values_list('id', 'value')[:top_k]
+        ] if top_k else []
+    return stats
+
+
+def get_declaration_counts(queryset, declaration):
+    """Return the number of experiments per value of a declaration, most frequent first."""
+    counts = queryset.annotate(
+        value=KeyTransform(declaration, 'declarations')
+    ).filter(value__isnull=False).values('value').annotate(count=Count('id'))
+    return [{'value': row['value'], 'count': row['count']}
+            for row in counts.order_by('-count', 'value')]
+
+
+def get_status_counts(queryset):
+    counts = queryset.filter(status__isnull=False).values('status__status').annotate(
+        count=Count('id'))
+    return {row['status__status']: row['count'] for row in counts}
+
+
+def get_group_stats(experiment_group, metrics, declarations, percentiles, top_k):
+    """Return the aggregate statistics of a group's experiments.
+
+    The statistics are computed by the database, and cached per group until
+    one of its experiments reports new metrics or a new status.
+    """
+    params = {
+        'metrics': metrics,
+        'declarations': declarations,
+        'percentiles': percentiles,
+        'top_k': top_k,
+    }
+    stats, generation = RedisGroupStats.get_stats(experiment_group_id=experiment_group.id,
+                                                  params=params)
+    if stats is not None:
+        return stats
+
+    queryset = experiment_group.experiments.order_by()
+    stats = {
+        'num_experiments': queryset.count(),
+        'statuses': get_status_counts(queryset),
+        'metrics': {metric: get_metric_stats(queryset=queryset,
+                                             metric=metric,
+                                             percentiles=percentiles,
+                                             top_k=top_k) for metric in metrics},
+        'declarations': {declaration: get_declaration_counts(queryset=queryset,
+                                                             declaration=declaration)
+                         for declaration in declarations},
+    }
+    RedisGroupStats.set_stats(experiment_group_id=experiment_group.id,
+                              params=params,
+                              stats=stats,
+                              generation=generation)
+    return stats
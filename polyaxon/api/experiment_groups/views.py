@@ -1,6 +1,7 @@
 from rest_framework import status
 from rest_framework.generics import (
     CreateAPIView,
+    GenericAPIView,
     ListAPIView,
     RetrieveUpdateDestroyAPIView,
     get_object_or_404
@@ -19,11 +20,13 @@ from api.experiment_groups.serializers import (
     ExperimentGroupSerializer,
     ExperimentGroupStatusSerializer
 )
+from api.experiment_groups.stats import get_group_stats, get_group_stats_params
 from api.experiments.serializers import ExperimentMetricSerializer
 from api.filters import OrderingFilter, QueryFilter
 from api.paginator import LargeLimitOffsetPagination
 from api.utils.views.auditor_mixin import AuditorMixinView
 from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
+from api.utils.views.eager_loading import EagerLoadingMixinView
 from api.utils.views.list_create import ListCreateAPIView
 from db.models.experiment_groups import (
     ExperimentGroup,
@@ -47,7 +50,7 @@ from polyaxon.celery_api import app as celery_app
 from polyaxon.settings import SchedulerCeleryTasks
 
 
-class ExperimentGroupListView(BookmarkedListMixinView, ListCreateAPIView):
+class ExperimentGroupListView(BookmarkedListMixinView, EagerLoadingMixinView, ListCreateAPIView):
     """
     get:
         List experiment groups under a project.
@@ -182,6 +185,7 @@ class ExperimentGroupMetricsListView(ExperimentGroupViewMixin, ListAPIView):
     serializer_class = ExperimentMetricSerializer
     permission_classes = (IsAuthenticated,)
     pagination_class = LargeLimitOffsetPagination
+    cursor_ordering = ('created_at', 'id')
     project = None
     group = None
 
@@ -199,6 +203,35 @@ class ExperimentGroupMetricsListView(ExperimentGroupViewMixin, ListAPIView):
         return response
 
 
+class ExperimentGroupStatsView(ExperimentGroupViewMixin, GenericAPIView):
+    """
+    get:
+        Get the aggregate statistics of the experiments under a group.
+
+        The metrics are selected with `metrics`, the declarations with `declarations`,
+        the percentiles with `percentiles` and the number of best and worst experiments
+        with `top_k`.
+    """
+    queryset = ExperimentGroup.objects.all()
+    permission_classes = (IsAuthenticated,)
+    project = None
+    group = None
+
+    def get(self, request, *args, **kwargs):
+        params = get_group_stats_params(request.query_params)
+        group = self.get_experiment_group()
+        stats = get_group_stats(experiment_group=group,
+                                metrics=params['metrics'],
+                                declarations=params['declarations'],
+                                percentiles=params['percentiles'],
+                                top_k=params['top_k'])
+        auditor.record(event_type=EXPERIMENT_GROUP_METRICS_VIEWED,
+                       instance=group,
+                       actor_id=request.user.id,
+                       actor_name=request.user.username)
+        return Response(stats, status=status.HTTP_200_OK)
+
+
 class ExperimentGroupChartViewListView(ExperimentGroupViewMixin, ListCreateAPIView):
     """
     get:
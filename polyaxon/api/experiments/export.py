@@ -0,0 +1,244 @@
+import csv
+import io
+import json
+import math
+
+from collections import OrderedDict
+
+from rest_framework.exceptions import ValidationError
+
+from django.db import connection
+
+from constants.exports import ExportContents, ExportFormats
+from db.models.metric_series import ExperimentMetricSeries, unpack
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# The number of rows fetched per round trip of the server side cursors
+CHUNK_SIZE = 2000
+# The number of rows per csv write and per parquet row group
+BATCH_SIZE = 10000
+
+EXPERIMENT_FIELDS = (
+    ('id', 'id', 'integer'),
+    ('uuid', 'uuid', 'string'),
+    ('name', 'name', 'string'),
+    ('experiment_group', 'experiment_group_id', 'integer'),
+    ('last_status', 'status__status', 'string'),
+    ('created_at', 'created_at', 'datetime'),
+    ('started_at', 'started_at', 'datetime'),
+    ('finished_at', 'finished_at', 'datetime'),
+)
+METRIC_COLUMNS = (
+    ('experiment', 'integer'),
+    ('name', 'string'),
+    ('timestamp', 'number'),
+    ('step', 'number'),
+    ('value', 'number'),
+)
+JSON_FIELD_PREFIXES = (('declarations', 'declarations'), ('last_metric', 'metric'))
+EXPORT_CONTENT_TYPES = {
+    ExportFormats.CSV: 'text/csv',
+    ExportFormats.PARQUET: 'application/octet-stream',
+}
+
+
+def get_export_params(query_params):
+    """Validate and return the export query params.
+
+    Query params:
+        * format: `csv` (default) or `parquet`.
+        * content: `experiments` (default) or `metrics`.
+    """
+    export_format = query_params.get('format', ExportFormats.CSV)
+    if export_format not in ExportFormats.VALUES:
+        raise ValidationError('`format` must be one of {}.'.format(sorted(ExportFormats.VALUES)))
+    if export_format == ExportFormats.PARQUET and pyarrow is None:
+        raise ValidationError('Parquet exports require `pyarrow` to be installed.')
+    content = query_params.get('content', ExportContents.EXPERIMENTS)
+    if content not in ExportContents.VALUES:
+        raise ValidationError(
+            '`content` must be one of {}.'.format(sorted(ExportContents.VALUES)))
+    return {'format': export_format, 'content': content}
+
+
+def get_json_keys(queryset, field):
+    """Return the keys of a json field across the rows and the type of their values.
+
+    The type is the json type of the values, or `string` if the values have different types.
+    """
+    sql, params = queryset.order_by().values(field).query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT DISTINCT e.key, jsonb_typeof(e.value) FROM ({sql}) q, '
+            'jsonb_each(q."{field}") e '
+            'WHERE jsonb_typeof(q."{field}") = \'object\' '
+            'AND jsonb_typeof(e.value) != \'null\' '
+            'ORDER BY e.key'.format(sql=sql, field=field),
+            params)
+        keys = OrderedDict()
+        for key, value_type in cursor.fetchall():
+            keys[key] = value_type if key not in keys else 'string'
+    return keys
+
+
+def to_column_value(value, column_type):
+    if value is None:
+        return None
+    if column_type == 'number':
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+    if column_type == 'boolean':
+        return value if isinstance(value, bool) else None
+    if column_type == 'datetime':
+        return value
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def get_experiments_rows(queryset):
+    """Return the columns and a generator of the rows of the experiments.
+
+    The declarations and last metrics are flattened to a column per key.
+    """
+    columns = [(name, column_type) for name, _, column_type in EXPERIMENT_FIELDS]
+    json_keys = []
+    for field, prefix in JSON_FIELD_PREFIXES:
+        keys = get_json_keys(queryset=queryset, field=field)
+        json_keys.append(keys)
+        columns += [('{}.{}'.format(prefix, key), column_type)
+                    for key, column_type in keys.items()]
+
+    def rows():
+        values = queryset.values_list(
+            *[lookup for _, lookup, _ in EXPERIMENT_FIELDS],
+            *[field for field, _ in JSON_FIELD_PREFIXES])
+        n_fields = len(EXPERIMENT_FIELDS)
+        for row in values.iterator(chunk_size=CHUNK_SIZE):
+            experiment_values = list(row[:n_fields])
+            experiment_values[1] = experiment_values[1].hex
+            for keys, data in zip(json_keys, row[n_fields:]):
+                data = data if isinstance(data, dict) else {}
+                experiment_values += [to_column_value(data.get(key), column_type)
+                                      for key, column_type in keys.items()]
+            yield experiment_values
+
+    return columns, rows()
+
+
+def get_metrics_rows(queryset):
+    """Return the columns and a generator of the points of the experiments' metrics."""
+
+    def rows():
+        chunks = ExperimentMetricSeries.objects.filter(
+            experiment__in=queryset.order_by().values('id')
+        ).order_by('experiment_id', 'name', 'chunk').values_list(
+            'experiment_id', 'name', 'timestamps', 'steps', 'values')
+        for experiment_id, name, timestamps, steps, values in chunks.iterator(
+                chunk_size=CHUNK_SIZE):
+            for timestamp, step, value in zip(unpack(timestamps).tolist(),
+                                              unpack(steps).tolist(),
+                                              unpack(values).tolist()):
+                yield [experiment_id, name, timestamp, None if math.isnan(step) else step, value]
+
+    return list(METRIC_COLUMNS), rows()
+
+
+def get_batches(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def to_csv_value(value):
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(columns, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+    for batch in get_batches(rows):
+        writer.writerows([to_csv_value(value) for value in row] for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+class _ParquetSink(object):
+    """A write only file collecting the bytes written by the parquet writer until popped."""
+
+    def __init__(self):
+        self.closed = False
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def pop(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def get_parquet_type(column_type):
+    return {
+        'integer': pyarrow.int64(),
+        'number': pyarrow.float64(),
+        'boolean': pyarrow.bool_(),
+        'datetime': pyarrow.timestamp('us', tz='UTC'),
+    }.get(column_type, pyarrow.string())
+
+
+def stream_parquet(columns, rows):
+    schema = pyarrow.schema([pyarrow.field(name, get_parquet_type(column_type))
+                             for name, column_type in columns])
+    sink = _ParquetSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    for batch in get_batches(rows):
+        arrays = [pyarrow.array([row[i] for row in batch], type=field.type)
+                  for i, field in enumerate(schema)]
+        writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+        yield sink.pop()
+    writer.close()
+    yield sink.pop()
+
+
+def stream_export(queryset, export_format, content):
+    """Return a generator of the export of the experiments, written a batch of rows at a time.
+
+    The rows are read with server side cursors, the memory used is bounded by the batch size
+    whatever the number of experiments.
+    """
+    if content == ExportContents.METRICS:
+        columns, rows = get_metrics_rows(queryset=queryset)
+    else:
+        columns, rows = get_experiments_rows(queryset=queryset)
+    if export_format == ExportFormats.PARQUET:
+        return stream_parquet(columns=columns, rows=rows)
+    return stream_csv(columns=columns, rows=rows)
@@ -0,0 +1,117 @@
+import numpy as np
+
+from rest_framework.exceptions import ValidationError
+
+from constants.metrics import Downsampling, MetricSeriesX
+from db.models.metric_series import ExperimentMetricSeries
+from libs.downsampling import align, downsample
+
+DEFAULT_N_POINTS = 500
+MAX_N_POINTS = 10000
+MAX_EXPERIMENTS = 100
+
+
+def _get_float_param(query_params, key):
+    value = query_params.get(key)
+    if value in (None, ''):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValidationError('`{}` must be a number, received `{}`.'.format(key, value))
+
+
+def get_metric_series_params(query_params, default_x=MetricSeriesX.TIMESTAMP):
+    """Validate and return the metric series query params.
+
+    Query params:
+        * names: comma separated metric names.
+        * x: `timestamp` or `step`, `default_x` by default.
+        * start, end: the range of x.
+        * n_points: the maximum number of points per series.
+        * downsampling: `lttb` (default) or `min_max`.
+    """
+    names = query_params.get('names')
+    names = [name.strip() for name in names.split(',') if name.strip()] if names else None
+    x = query_params.get('x', default_x)
+    if x not in MetricSeriesX.VALUES:
+        raise ValidationError('`x` must be one of {}.'.format(sorted(MetricSeriesX.VALUES)))
+    downsampling = query_params.get('downsampling', Downsampling.LTTB)
+    if downsampling not in Downsampling.VALUES:
+        raise ValidationError(
+            '`downsampling` must be one of {}.'.format(sorted(Downsampling.VALUES)))
+    n_points = query_params.get('n_points', DEFAULT_N_POINTS)
+    try:
+        n_points = int(n_points)
+    except (TypeError, ValueError):
+        raise ValidationError('`n_points` must be an integer, received `{}`.'.format(n_points))
+    if not 2 <= n_points <= MAX_N_POINTS:
+        raise ValidationError('`n_points` must be between 2 and {}.'.format(MAX_N_POINTS))
+    return {
+        'names': names,
+        'x': x,
+        'start': _get_float_param(query_params, 'start'),
+        'end': _get_float_param(query_params, 'end'),
+        'n_points': n_points,
+        'downsampling': downsampling,
+    }
+
+
+def get_metric_series(experiment_id, name, x, start, end, n_points, downsampling):
+    xs, ys = ExperimentMetricSeries.get_series(experiment_id=experiment_id,
+                                               name=name,
+                                               x=x,
+                                               start=start,
+                                               end=end)
+    data = {'name': name, 'count': len(ys)}
+    if len(ys):
+        data.update({'min': float(ys.min()), 'max': float(ys.max()), 'last': float(ys[-1])})
+    xs, ys = downsample(xs, ys, n_points=n_points, method=downsampling)
+    data.update({'x': xs.tolist(), 'y': ys.tolist()})
+    return data
+
+
+def get_experiment_metric_series(experiment_id, names, x, start, end, n_points, downsampling):
+    """Return the downsampled series of an experiment's metrics, all metrics by default."""
+    if names is None:
+        names = ExperimentMetricSeries.get_names(experiment_id=experiment_id)
+    return [get_metric_series(experiment_id=experiment_id,
+                              name=name,
+                              x=x,
+                              start=start,
+                              end=end,
+                              n_points=n_points,
+                              downsampling=downsampling) for name in names]
+
+
+def _to_list(values):
+    return [None if np.isnan(value) else value for value in values.tolist()]
+
+
+def get_experiments_aligned_metric_series(experiment_ids, names, x, start, end, n_points):
+    """Return the series of several experiments' metrics aligned on a common x grid.
+
+    The grid splits the x range of all series, or [start, end] if provided,
+    in `n_points` buckets, every series is the mean of its points per bucket.
+    Experiments without points for any of the metrics are omitted.
+    """
+    series = ExperimentMetricSeries.get_experiments_series(experiment_ids=experiment_ids,
+                                                           names=names,
+                                                           x=x,
+                                                           start=start,
+                                                           end=end)
+    series = {key: value for key, value in series.items() if len(value[0])}
+    data = {'x': x, 'names': names, 'grid': [], 'experiments': []}
+    if not series:
+        return data
+
+    lower = start if start is not None else min(xs[0] for xs, _ in series.values())
+    upper = end if end is not None else max(xs[-1] for xs, _ in series.values())
+    edges = np.linspace(lower, upper, n_points + 1)
+    data['grid'] = ((edges[:-1] + edges[1:]) / 2).tolist()
+    for experiment_id in experiment_ids:
+        metrics = {name: _to_list(align(*series[(experiment_id, name)], edges=edges))
+                   for name in names if (experiment_id, name) in series}
+        if metrics:
+            data['experiments'].append({'id': experiment_id, 'metrics': metrics})
+    return data
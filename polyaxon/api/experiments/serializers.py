@@ -3,6 +3,7 @@ from rest_framework.exceptions import ValidationError
 
 from api.utils.serializers.bookmarks import BookmarkedSerializerMixin
 from api.utils.serializers.data_refs import DataRefsSerializerMixin
+from api.utils.serializers.eager_loading import EagerLoadingMixin
 from api.utils.serializers.job_resources import JobResourcesSerializer
 from api.utils.serializers.tags import TagsSerializerMixin
 from db.models.experiment_jobs import ExperimentJob, ExperimentJobStatus
@@ -63,6 +64,25 @@ class ExperimentStatusSerializer(serializers.ModelSerializer):
         extra_kwargs = {'experiment': {'read_only': True}}
 
 
+class ExperimentMetricListSerializer(serializers.ListSerializer):
+    """Creates the metrics with a single bulk insert.
+
+    Bulk inserts do not send the `post_save` signals,
+    each experiment's metrics are added once with all its new metrics.
+    """
+
+    def create(self, validated_data):
+        metrics = ExperimentMetric.objects.bulk_create(
+            [ExperimentMetric(**attrs) for attrs in validated_data])
+
+        experiments = {}
+        for metric in metrics:
+            experiments.setdefault(metric.experiment_id, (metric.experiment, []))[1].append(metric)
+        for experiment, experiment_metrics in experiments.values():
+            experiment.add_metrics(metrics=experiment_metrics)
+        return metrics
+
+
 class ExperimentMetricSerializer(serializers.ModelSerializer):
     uuid = fields.UUIDField(format='hex', read_only=True)
 
@@ -70,6 +90,7 @@ class ExperimentMetricSerializer(serializers.ModelSerializer):
         model = ExperimentMetric
         exclude = []
         extra_kwargs = {'experiment': {'read_only': True}}
+        list_serializer_class = ExperimentMetricListSerializer
 
 
 class ExperimentChartViewSerializer(serializers.ModelSerializer):
@@ -81,9 +102,14 @@ class ExperimentChartViewSerializer(serializers.ModelSerializer):
         extra_kwargs = {'experiment': {'read_only': True}}
 
 
-class ExperimentLastMetricSerializer(serializers.ModelSerializer):
+class ExperimentLastMetricSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     uuid = fields.UUIDField(format='hex', read_only=True)
 
+    select_related_fields = (
+        'project__user',
+        'experiment_group__project__user',
+    )
+
     class Meta:
         model = Experiment
         fields = (
@@ -97,9 +123,14 @@ class ExperimentLastMetricSerializer(serializers.ModelSerializer):
         )
 
 
-class ExperimentDeclarationsSerializer(serializers.ModelSerializer):
+class ExperimentDeclarationsSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     uuid = fields.UUIDField(format='hex', read_only=True)
 
+    select_related_fields = (
+        'project__user',
+        'experiment_group__project__user',
+    )
+
     class Meta:
         model = Experiment
         fields = (
@@ -111,7 +142,7 @@ class ExperimentDeclarationsSerializer(serializers.ModelSerializer):
         )
 
 
-class ExperimentSerializer(serializers.ModelSerializer):
+class ExperimentSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     uuid = fields.UUIDField(format='hex', read_only=True)
     original = fields.SerializerMethodField()
     user = fields.SerializerMethodField()
@@ -121,6 +152,16 @@ class ExperimentSerializer(serializers.ModelSerializer):
     started_at = fields.DateTimeField(read_only=True)
     finished_at = fields.DateTimeField(read_only=True)
 
+    select_related_fields = (
+        'user',
+        'project__user',
+        'experiment_group__project__user',
+        'build_job__project__user',
+        'original_experiment__project__user',
+        'original_experiment__experiment_group__project__user',
+        'status',
+    )
+
     class Meta:
         model = Experiment
         fields = (
@@ -25,6 +25,13 @@ import auditor
 
 from api.code_reference.serializers import CodeReferenceSerializer
 from api.experiments import queries
+from api.experiments.export import EXPORT_CONTENT_TYPES, get_export_params, stream_export
+from api.experiments.metric_series import (
+    MAX_EXPERIMENTS,
+    get_experiment_metric_series,
+    get_experiments_aligned_metric_series,
+    get_metric_series_params
+)
 from api.experiments.serializers import (
     BookmarkedExperimentSerializer,
     ExperimentChartViewSerializer,
@@ -42,10 +49,13 @@ from api.experiments.serializers import (
 from api.filters import OrderingFilter, QueryFilter
 from api.paginator import LargeLimitOffsetPagination
 from api.utils.views.auditor_mixin import AuditorMixinView
+from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
+from api.utils.views.eager_loading import EagerLoadingMixinView
 from api.utils.views.list_create import ListCreateAPIView
 from api.utils.views.post import PostAPIView
 from api.utils.views.protected import ProtectedView
 from constants.experiments import ExperimentLifeCycle
+from constants.metrics import MetricSeriesX
 from db.models.experiment_groups import ExperimentGroup
 from db.models.experiment_jobs import ExperimentJob, ExperimentJobStatus
 from db.models.experiments import (
@@ -93,14 +103,51 @@ from polyaxon.settings import SchedulerCeleryTasks
 _logger = logging.getLogger("polyaxon.views.experiments")
 
 
-class ExperimentListView(ListAPIView):
+class ExperimentListView(EagerLoadingMixinView, ListAPIView):
     """List all experiments for a user."""
     queryset = Experiment.objects.all()
     serializer_class = ExperimentSerializer
     permission_classes = (IsAuthenticated,)
 
 
-class ProjectExperimentListView(ListCreateAPIView):
+class ProjectExperimentFilterMixin(object):
+    """Filters the experiments of a project, and optionally of a group or independent ones."""
+
+    def get_group(self, project, group_id):
+        group = get_object_or_404(ExperimentGroup, project=project, id=group_id)
+        auditor.record(event_type=EXPERIMENT_GROUP_EXPERIMENTS_VIEWED,
+                       instance=group,
+                       actor_id=self.request.user.id,
+                       actor_name=self.request.user.username)
+
+        return group
+
+    def filter_queryset(self, queryset):
+        independent = to_bool(self.request.query_params.get('independent', None),
+                              handle_none=True,
+                              exception=ValidationError)
+        group_id = self.request.query_params.get('group', None)
+        if independent and group_id:
+            raise ValidationError('You cannot filter for independent experiments and '
+                                  'group experiments at the same time.')
+        project = get_permissible_project(view=self)
+        queryset = queryset.filter(project=project)
+        if independent:
+            queryset = queryset.filter(experiment_group__isnull=True)
+        if group_id:
+            group = self.get_group(project=project, group_id=group_id)
+            queryset = queryset.filter(experiment_group=group)
+        auditor.record(event_type=PROJECT_EXPERIMENTS_VIEWED,
+                       instance=project,
+                       actor_id=self.request.user.id,
+                       actor_name=self.request.user.username)
+        return super().filter_queryset(queryset=queryset)
+
+
+class ProjectExperimentListView(BookmarkedListMixinView,
+                                EagerLoadingMixinView,
+                                ProjectExperimentFilterMixin,
+                                ListCreateAPIView):
     """
     get:
         List experiments under a project.
@@ -108,7 +155,7 @@ class ProjectExperimentListView(ListCreateAPIView):
     post:
         Create an experiment under a project.
     """
-    queryset = queries.experiments
+    queryset = Experiment.objects.all()
     serializer_class = BookmarkedExperimentSerializer
     metrics_serializer_class = ExperimentLastMetricSerializer
     declarations_serializer_class = ExperimentDeclarationsSerializer
@@ -119,6 +166,7 @@ class ProjectExperimentListView(ListCreateAPIView):
     ordering = ('-updated_at',)
     ordering_fields = ('created_at', 'updated_at', 'started_at', 'finished_at')
     ordering_proxy_fields = {'metric': 'last_metric'}
+    cursor_ordering = ('-created_at', '-id')
 
     def get_serializer_class(self):
         if self.create_serializer_class and self.request.method.lower() == 'post':
@@ -138,36 +186,6 @@ class ProjectExperimentListView(ListCreateAPIView):
 
         return self.serializer_class
 
-    def get_group(self, project, group_id):
-        group = get_object_or_404(ExperimentGroup, project=project, id=group_id)
-        auditor.record(event_type=EXPERIMENT_GROUP_EXPERIMENTS_VIEWED,
-                       instance=group,
-                       actor_id=self.request.user.id,
-                       actor_name=self.request.user.username)
-
-        return group
-
-    def filter_queryset(self, queryset):
-        independent = to_bool(self.request.query_params.get('independent', None),
-                              handle_none=True,
-                              exception=ValidationError)
-        group_id = self.request.query_params.get('group', None)
-        if independent and group_id:
-            raise ValidationError('You cannot filter for independent experiments and '
-                                  'group experiments at the same time.')
-        project = get_permissible_project(view=self)
-        queryset = queryset.filter(project=project)
-        if independent:
-            queryset = queryset.filter(experiment_group__isnull=True)
-        if group_id:
-            group = self.get_group(project=project, group_id=group_id)
-            queryset = queryset.filter(experiment_group=group)
-        auditor.record(event_type=PROJECT_EXPERIMENTS_VIEWED,
-                       instance=project,
-                       actor_id=self.request.user.id,
-                       actor_name=self.request.user.username)
-        return super().filter_queryset(queryset=queryset)
-
     def perform_create(self, serializer):
         ttl = self.request.data.get(RedisTTL.TTL_KEY)
         if ttl:
@@ -185,6 +203,69 @@ class ProjectExperimentListView(ListCreateAPIView):
             RedisTTL.set_for_experiment(experiment_id=instance.id, value=ttl)
 
 
+class ProjectExperimentMetricSeriesView(ProjectExperimentFilterMixin, ListAPIView):
+    """
+    get:
+        Get the metric series of a project's experiments aligned on a common x grid.
+
+        The experiments can be filtered with `group`, `independent` and `query`,
+        the metrics are selected with `names`.
+        The series are aligned on their steps unless `x=timestamp`,
+        the experiments' timestamps rarely overlap.
+    """
+    queryset = Experiment.objects.all()
+    permission_classes = (IsAuthenticated,)
+    filter_backends = (QueryFilter, OrderingFilter,)
+    query_manager = 'experiment'
+    ordering = ('-updated_at',)
+    ordering_fields = ('created_at', 'updated_at', 'started_at', 'finished_at')
+    ordering_proxy_fields = {'metric': 'last_metric'}
+
+    def list(self, request, *args, **kwargs):
+        params = get_metric_series_params(request.query_params, default_x=MetricSeriesX.STEP)
+        if not params['names']:
+            raise ValidationError('`names` is required.')
+        experiment_ids = list(self.filter_queryset(self.get_queryset()).values_list(
+            'id', flat=True)[:MAX_EXPERIMENTS])
+        return Response(get_experiments_aligned_metric_series(experiment_ids=experiment_ids,
+                                                              names=params['names'],
+                                                              x=params['x'],
+                                                              start=params['start'],
+                                                              end=params['end'],
+                                                              n_points=params['n_points']),
+                        status=status.HTTP_200_OK)
+
+
+class ProjectExperimentExportView(ProjectExperimentFilterMixin, ListAPIView):
+    """
+    get:
+        Export a project's experiments as a csv or a parquet file.
+
+        The experiments can be filtered with `group`, `independent` and `query`,
+        the file has a row per experiment, with its declarations and last metrics,
+        or a row per point of the experiments' metrics if `content` is `metrics`.
+    """
+    queryset = Experiment.objects.all()
+    permission_classes = (IsAuthenticated,)
+    filter_backends = (QueryFilter, OrderingFilter,)
+    query_manager = 'experiment'
+    ordering = ('-updated_at',)
+    ordering_fields = ('created_at', 'updated_at', 'started_at', 'finished_at')
+    ordering_proxy_fields = {'metric': 'last_metric'}
+
+    def list(self, request, *args, **kwargs):
+        params = get_export_params(request.query_params)
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(
+            stream_export(queryset=queryset,
+                          export_format=params['format'],
+                          content=params['content']),
+            content_type=EXPORT_CONTENT_TYPES[params['format']])
+        response['Content-Disposition'] = 'attachment; filename={}_{}.{}'.format(
+            self.kwargs['name'], params['content'], params['format'])
+        return response
+
+
 class ExperimentDetailView(AuditorMixinView, RetrieveUpdateDestroyAPIView):
     """
     get:
@@ -386,6 +467,7 @@ class ExperimentMetricListView(ExperimentViewMixin, ListCreateAPIView):
     ]
     permission_classes = (IsAuthenticatedOrInternal,)
     pagination_class = LargeLimitOffsetPagination
+    cursor_ordering = ('created_at', 'id')
     throttle_scope = 'high'
 
     def perform_create(self, serializer):
@@ -422,6 +504,24 @@ class ExperimentMetricListView(ExperimentViewMixin, ListCreateAPIView):
         return response
 
 
+class ExperimentMetricSeriesView(ExperimentViewMixin, RetrieveAPIView):
+    """
+    get:
+        Get the downsampled series of an experiment's metrics.
+    """
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, *args, **kwargs):
+        experiment = self.get_experiment()
+        params = get_metric_series_params(request.query_params)
+        series = get_experiment_metric_series(experiment_id=experiment.id, **params)
+        auditor.record(event_type=EXPERIMENT_METRICS_VIEWED,
+                       instance=self.experiment,
+                       actor_id=request.user.id,
+                       actor_name=request.user.username)
+        return Response(data={'x': params['x'], 'series': series}, status=status.HTTP_200_OK)
+
+
 class ExperimentStatusDetailView(ExperimentViewMixin, RetrieveAPIView):
     """Get experiment status details."""
     queryset = ExperimentStatus.objects.all()
@@ -11,6 +11,7 @@ import query
 
 from libs.string_utils import strip_spaces
 from query.exceptions import QueryError
+from query.indexes import record_json_key
 
 
 class QueryFilter(BaseFilterBackend):
@@ -67,6 +68,7 @@ class OrderingFilter(BaseOrderingFilter):
             if field in proxy_fields:
                 result_fields.append('{}{}'.format(negation, suffix))
                 annotation[suffix] = KeyTransform(suffix, proxy_fields[field])
+                record_json_key(model=queryset.model, field=proxy_fields[field], key=suffix)
 
         return result_fields, annotation
 
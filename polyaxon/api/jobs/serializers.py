@@ -2,6 +2,7 @@ from rest_framework import fields, serializers
 
 from api.utils.serializers.bookmarks import BookmarkedSerializerMixin
 from api.utils.serializers.data_refs import DataRefsSerializerMixin
+from api.utils.serializers.eager_loading import EagerLoadingMixin
 from api.utils.serializers.tags import TagsSerializerMixin
 from db.models.jobs import Job, JobStatus
 from libs.spec_validation import validate_job_spec_config
@@ -16,12 +17,14 @@ class JobStatusSerializer(serializers.ModelSerializer):
         exclude = []
 
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     uuid = fields.UUIDField(format='hex', read_only=True)
     user = fields.SerializerMethodField()
     project = fields.SerializerMethodField()
     build_job = fields.SerializerMethodField()
 
+    select_related_fields = ('user', 'project__user', 'build_job__project__user', 'status')
+
     class Meta:
         model = Job
         fields = (
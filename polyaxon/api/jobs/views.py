@@ -29,6 +29,8 @@ from api.jobs.serializers import (
     JobStatusSerializer
 )
 from api.utils.views.auditor_mixin import AuditorMixinView
+from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
+from api.utils.views.eager_loading import EagerLoadingMixinView
 from api.utils.views.list_create import ListCreateAPIView
 from api.utils.views.protected import ProtectedView
 from db.models.jobs import Job, JobStatus
@@ -56,7 +58,7 @@ from polyaxon.settings import SchedulerCeleryTasks
 _logger = logging.getLogger("polyaxon.views.jobs")
 
 
-class ProjectJobListView(ListCreateAPIView):
+class ProjectJobListView(BookmarkedListMixinView, EagerLoadingMixinView, ListCreateAPIView):
     """
     get:
         List jobs under a project.
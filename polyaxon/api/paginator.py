@@ -1,5 +1,183 @@
-from rest_framework.pagination import LimitOffsetPagination
+import base64
+import json
 
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import LimitOffsetPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
-class LargeLimitOffsetPagination(LimitOffsetPagination):
+from django.db import connection, models
+from django.utils.dateparse import parse_datetime
+
+
+class KeysetLimitOffsetPagination(LimitOffsetPagination):
+    """Limit offset pagination with an opt-in keyset pagination.
+
+    Passing the `cursor` query param, empty for the first page, paginates the results
+    on the view's `cursor_ordering`, a (key, unique key) ordering, e.g. ('-created_at', '-id').
+    Every page is then a range scan of the index of these keys instead of an offset scan,
+    and the count is only computed if requested with `count=exact` or `count=estimate`.
+
+    The key must not change once a row is created, a row whose key changes between two pages
+    would be skipped or repeated, and the cursor can not be combined with a `sort`.
+    """
+    cursor_query_param = 'cursor'
+    ordering_query_param = 'sort'
+    count_query_param = 'count'
+    cursor_default_limit = 100
+    cursor_max_limit = 1000
+
+    EXACT_COUNT = 'exact'
+    ESTIMATED_COUNT = 'estimate'
+
+    def __init__(self):
+        self.use_cursor = False
+        self.ordering = None
+        self.position = None
+        self.reverse = False
+        self.has_more = False
+        self.page = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_cursor = self.cursor_query_param in request.query_params
+        if not self.use_cursor:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.ordering = getattr(view, 'cursor_ordering', None)
+        if not self.ordering:
+            raise ValidationError('This endpoint does not support cursor pagination.')
+        if request.query_params.get(self.ordering_query_param):
+            raise ValidationError('`{}` can not be combined with `{}`.'.format(
+                self.ordering_query_param, self.cursor_query_param))
+
+        self.request = request
+        self.limit = self.get_cursor_limit(request)
+        self.count = self.get_cursor_count(queryset, request)
+        self.position, self.reverse = self.decode_cursor(request, queryset.model)
+        if self.position:
+            queryset = self.filter_position(queryset)
+        ordering = self.ordering
+        if self.reverse:
+            ordering = [self.invert(field) for field in ordering]
+
+        page = list(queryset.order_by(*ordering)[:self.limit + 1])
+        self.has_more = len(page) > self.limit
+        page = page[:self.limit]
+        if self.reverse:
+            page.reverse()
+        self.page = page
+        return page
+
+    def get_paginated_response(self, data):
+        if not self.use_cursor:
+            return super().get_paginated_response(data)
+
+        return Response({
+            'count': self.count,
+            'next': self.get_cursor_next_link(),
+            'previous': self.get_cursor_previous_link(),
+            'results': data
+        })
+
+    def get_cursor_limit(self, request):
+        try:
+            return _positive_int(request.query_params[self.limit_query_param],
+                                 strict=True,
+                                 cutoff=self.cursor_max_limit)
+        except (KeyError, ValueError):
+            return self.cursor_default_limit
+
+    def get_cursor_count(self, queryset, request):
+        count = request.query_params.get(self.count_query_param)
+        if not count:
+            return None
+        if count == self.EXACT_COUNT:
+            return queryset.count()
+        if count == self.ESTIMATED_COUNT:
+            return self.get_estimated_count(queryset)
+        raise ValidationError('`{}` must be one of `{}` or `{}`.'.format(
+            self.count_query_param, self.EXACT_COUNT, self.ESTIMATED_COUNT))
+
+    @staticmethod
+    def get_estimated_count(queryset):
+        """Return the planner's estimate of the number of rows, without scanning them."""
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]['Plan']['Plan Rows']
+
+    @staticmethod
+    def invert(field):
+        return field[1:] if field.startswith('-') else '-' + field
+
+    def filter_position(self, queryset):
+        """Keep the rows after the position, in the direction of the page.
+
+        `key <= value` is a range condition on the index, the rows of the same key
+        at or before the unique key are then excluded.
+        """
+        (key, unique_key), (value, unique_value) = self.ordering, self.position
+        key_descending = key.startswith('-') != self.reverse
+        unique_descending = unique_key.startswith('-') != self.reverse
+        key = key.lstrip('-')
+        unique_key = unique_key.lstrip('-')
+        queryset = queryset.filter(
+            **{'{}__{}'.format(key, 'lte' if key_descending else 'gte'): value})
+        return queryset.exclude(**{
+            key: value,
+            '{}__{}'.format(unique_key, 'gte' if unique_descending else 'lte'): unique_value})
+
+    def get_position(self, instance):
+        values = []
+        for field in self.ordering:
+            value = getattr(instance, field.lstrip('-'))
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return values
+
+    def decode_cursor(self, request, model):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            position = data['p']
+            reverse = bool(data.get('r', False))
+            if len(position) != len(self.ordering):
+                raise ValueError
+            for i, field in enumerate(self.ordering):
+                if isinstance(model._meta.get_field(field.lstrip('-')), models.DateTimeField):
+                    position[i] = parse_datetime(position[i])
+                    if position[i] is None:
+                        raise ValueError
+        except (TypeError, ValueError, KeyError):
+            raise ValidationError('Invalid cursor.')
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        data = {'p': position}
+        if reverse:
+            data['r'] = True
+        cursor = base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_cursor_next_link(self):
+        if not self.page or not (self.has_more or self.reverse):
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_cursor_previous_link(self):
+        if not self.page:
+            return None
+        if self.reverse and not self.has_more:
+            return None
+        if not self.reverse and not self.position:
+            return None
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+
+class LargeLimitOffsetPagination(KeysetLimitOffsetPagination):
     default_limit = 300000
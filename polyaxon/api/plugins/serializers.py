@@ -1,5 +1,6 @@
 from rest_framework import fields, serializers
 
+from api.utils.serializers.eager_loading import EagerLoadingMixin
 from db.models.notebooks import NotebookJob
 from db.models.tensorboards import TensorboardJob
 from libs.spec_validation import validate_notebook_spec_config, validate_tensorboard_spec_config
@@ -50,11 +51,13 @@ class NotebookJobSerializer(PluginJobBaseSerializer):
         fields = PluginJobBaseSerializer.Meta.fields + ('data_refs',)
 
 
-class ProjectTensorboardJobSerializer(serializers.ModelSerializer):
+class ProjectTensorboardJobSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     uuid = fields.UUIDField(format='hex', read_only=True)
     user = fields.SerializerMethodField()
     project = fields.SerializerMethodField()
 
+    select_related_fields = ('user', 'project__user', 'status')
+
     class Meta:
         model = TensorboardJob
         fields = (
@@ -14,6 +14,7 @@ from api.plugins.serializers import (
     ProjectTensorboardJobSerializer,
     TensorboardJobSerializer
 )
+from api.utils.views.eager_loading import EagerLoadingMixinView
 from api.utils.views.post import PostAPIView
 from api.utils.views.protected import ProtectedView
 from constants.experiments import ExperimentLifeCycle
@@ -353,7 +354,7 @@ class TensorboardView(PluginJobView):
                        actor_name=self.request.user.username)
 
 
-class ProjectTensorboardListView(ListAPIView):
+class ProjectTensorboardListView(EagerLoadingMixinView, ListAPIView):
     """List an tensorboards under a project."""
     queryset = TensorboardJob.objects.all()
     serializer_class = ProjectTensorboardJobSerializer
@@ -1,14 +1,17 @@
 from rest_framework import fields, serializers
 
 from api.utils.serializers.bookmarks import BookmarkedSerializerMixin
+from api.utils.serializers.eager_loading import EagerLoadingMixin
 from api.utils.serializers.tags import TagsSerializerMixin
 from db.models.projects import Project
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(serializers.ModelSerializer, EagerLoadingMixin):
     uuid = fields.UUIDField(format='hex', read_only=True)
     user = fields.SerializerMethodField()
 
+    select_related_fields = ('user',)
+
     class Meta:
         model = Project
         fields = (
@@ -22,6 +22,10 @@ projects_urlpatterns = [
             groups_views.ExperimentGroupListView.as_view()),
     re_path(r'^{}/{}/experiments/?$'.format(USERNAME_PATTERN, NAME_PATTERN),
             experiments_views.ProjectExperimentListView.as_view()),
+    re_path(r'^{}/{}/experiments/metrics/series/?$'.format(USERNAME_PATTERN, NAME_PATTERN),
+            experiments_views.ProjectExperimentMetricSeriesView.as_view()),
+    re_path(r'^{}/{}/experiments/export/?$'.format(USERNAME_PATTERN, NAME_PATTERN),
+            experiments_views.ProjectExperimentExportView.as_view()),
     re_path(r'^{}/{}/jobs/?$'.format(USERNAME_PATTERN, NAME_PATTERN),
             jobs_views.ProjectJobListView.as_view()),
     re_path(r'^{}/{}/builds/?$'.format(USERNAME_PATTERN, NAME_PATTERN),
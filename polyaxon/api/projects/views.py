@@ -11,6 +11,8 @@ from api.projects.serializers import (
     ProjectSerializer
 )
 from api.utils.views.auditor_mixin import AuditorMixinView
+from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
+from api.utils.views.eager_loading import EagerLoadingMixinView
 from db.models.projects import Project
 from event_manager.events.project import (
     PROJECT_CREATED,
@@ -36,7 +38,7 @@ class ProjectCreateView(CreateAPIView):
         auditor.record(event_type=PROJECT_CREATED, instance=instance)
 
 
-class ProjectListView(ListAPIView):
+class ProjectListView(BookmarkedListMixinView, EagerLoadingMixinView, ListAPIView):
     """List projects for a user."""
     queryset = queries.projects.order_by('-updated_at')
     serializer_class = BookmarkedProjectSerializer
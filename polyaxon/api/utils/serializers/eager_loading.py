@@ -0,0 +1,16 @@
+class EagerLoadingMixin(object):
+    """Declares the related objects read by a serializer.
+
+    The list views load them with their queryset, see `EagerLoadingMixinView`,
+    so that serializing a page takes the same number of queries whatever its size.
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
@@ -5,7 +5,8 @@ from db.models.bookmarks import Bookmark
 class BookmarkedListMixinView(object):
     def get_serializer(self, *args, **kwargs):
         serializer_class = self.get_serializer_class()
-        if not isinstance(serializer_class, BookmarkedSerializerMixin):
+        if (not args or not kwargs.get('many') or
+                not issubclass(serializer_class, BookmarkedSerializerMixin)):
             return super().get_serializer(*args, **kwargs)
 
         queryset = args[0]
@@ -19,11 +20,11 @@ class BookmarkedListMixinView(object):
         # and pass them on to the serializer
         bookmarks = Bookmark.objects.filter(
             user=self.request.user,
-            content_type__model=self.serializer_class.bookmarked_model,
+            content_type__model=serializer_class.bookmarked_model,
             object_id__in=object_ids,
-            enabled=True).values_list('id', flat=True)
+            enabled=True).values_list('object_id', flat=True)
 
         context = self.get_serializer_context()
-        context['bookmarks'] = list(bookmarks)
+        context['bookmarks'] = set(bookmarks)
         kwargs['context'] = context
         return serializer_class(*args, **kwargs)
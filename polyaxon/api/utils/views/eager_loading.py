@@ -0,0 +1,10 @@
+from api.utils.serializers.eager_loading import EagerLoadingMixin
+
+
+class EagerLoadingMixinView(object):
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if issubclass(serializer_class, EagerLoadingMixin):
+            queryset = serializer_class.setup_eager_loading(queryset)
+        return queryset
@@ -1,11 +1,31 @@
+from django.conf import settings
+
 from auditor.manager import default_manager
 from auditor.service import AuditorService
 from libs.services import LazyServiceWrapper
 
+
+def get_auditor_backend():
+    if settings.AUDITOR_BACKEND == settings.AUDITOR_BACKEND_ASYNC:
+        return 'auditor.async_service.AsyncAuditorService'
+    return 'auditor.service.AuditorService'
+
+
+def get_backend_options():
+    if settings.AUDITOR_BACKEND == settings.AUDITOR_BACKEND_ASYNC:
+        return {
+            'buffer_size': settings.AuditorBuffer.SIZE,
+            'batch_size': settings.AuditorBuffer.BATCH_SIZE,
+            'put_timeout': settings.AuditorBuffer.PUT_TIMEOUT / 1000.,
+            'shutdown_timeout': settings.AuditorBuffer.SHUTDOWN_TIMEOUT,
+        }
+    return {}
+
+
 backend = LazyServiceWrapper(
     backend_base=AuditorService,
-    backend_path='auditor.service.AuditorService',
-    options={}
+    backend_path=get_auditor_backend(),
+    options=get_backend_options()
 )
 backend.expose(locals())
 
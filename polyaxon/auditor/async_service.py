@@ -0,0 +1,141 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from collections import Counter
+from functools import partial
+
+from celery.signals import worker_process_shutdown, worker_shutdown
+
+from django.db import close_old_connections, transaction
+
+import stats
+
+from auditor.service import AuditorService
+
+_logger = logging.getLogger('polyaxon.auditor')
+
+
+class AsyncAuditorService(AuditorService):
+    """An auditor service recording the events off the caller's path.
+
+    The events of the notifier, tracker and activitylogs services are built once in the caller,
+    while the instance is at hand, and put in a bounded buffer when the caller's transaction
+    is committed. A consumer thread records them in batches,
+    every service receives all its events of a batch at once.
+
+    When the buffer is full the caller waits up to `put_timeout` seconds,
+    and then records its events itself: a burst of events slows down the producers
+    instead of growing the memory.
+
+    The buffer is best-effort: it is drained for up to 5 seconds when the process exits,
+    and up to `shutdown_timeout` seconds when a celery worker or pool process shuts down,
+    the events still buffered after that, or when a process is killed, are lost.
+    """
+
+    def __init__(self, buffer_size=10000, batch_size=500, put_timeout=0.1, shutdown_timeout=30):
+        super().__init__()
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.put_timeout = put_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self._queue = None
+        self._consumer = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get_services_events(self, event):
+        """Return the (service, service event) of the services handling the event."""
+        services_events = []
+        for service in self.get_services(event['event_type']):
+            if not service.is_setup:
+                continue
+            services_events.append((service, service.get_event(event_type=event['event_type'],
+                                                               instance=event['instance'],
+                                                               **event['kwargs'])))
+        return services_events
+
+    def record_event(self, event):
+        services_events = self.get_services_events(event)
+        if services_events:
+            # Events of rolled back transactions are not recorded
+            transaction.on_commit(partial(self.put, services_events))
+
+    def record_services_events(self, services_events):
+        for service in self.services:
+            events = [e for s, e in services_events if s is service]
+            if not events:
+                continue
+            for event_type, count in Counter(e.event_type for e in events).items():
+                stats.incr('{}.events.{}'.format(service.stats_key, event_type), amount=count)
+            try:
+                with stats.timer('{}.record_events'.format(service.stats_key)):
+                    service.record_events(events)
+            except Exception as e:
+                _logger.warning('Failed to record %s events: %s', len(events), e, exc_info=True)
+
+    def start_consumer(self):
+        # The consumer is started by the first event of every process, e.g. after a fork
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.buffer_size)
+            self._consumer = threading.Thread(target=self.consume,
+                                              args=(self._queue,),
+                                              name='auditor-consumer',
+                                              daemon=True)
+            self._consumer.start()
+            self._pid = os.getpid()
+
+    def put(self, services_events):
+        self.start_consumer()
+        try:
+            self._queue.put(services_events, timeout=self.put_timeout)
+        except queue.Full:
+            stats.incr('auditor.buffer_full')
+            _logger.debug('The auditor buffer is full, recording the events in the caller.')
+            self.record_services_events(services_events)
+
+    def consume(self, events_queue):
+        while True:
+            batch = [events_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(events_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stats.histogram('auditor.batch_size', len(batch))
+            stats.gauge('auditor.buffer_size', events_queue.qsize())
+            try:
+                self.record_services_events(
+                    [service_event for services_events in batch
+                     for service_event in services_events])
+            finally:
+                close_old_connections()
+                stats.flush()
+                for _ in batch:
+                    events_queue.task_done()
+
+    def flush(self, timeout=5):
+        """Wait for the buffered events to be recorded, at most `timeout` seconds."""
+        if self._queue is None or self._pid != os.getpid():
+            return
+        deadline = time.time() + timeout
+        while self._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+
+    def drain(self, **kwargs):
+        """Block the shutdown of a celery worker until the buffered events are recorded."""
+        self.flush(timeout=self.shutdown_timeout)
+
+    def setup(self):
+        super().setup()
+        atexit.register(self.flush)
+        # The celery pool processes exit without running the `atexit` hooks
+        worker_process_shutdown.connect(self.drain, weak=False)
+        worker_shutdown.connect(self.drain, weak=False)
@@ -20,6 +20,7 @@ auditor.subscribe(experiment_group.ExperimentGroupRandomEvent)
 auditor.subscribe(experiment_group.ExperimentGroupGridEvent)
 auditor.subscribe(experiment_group.ExperimentGroupHyperbandEvent)
 auditor.subscribe(experiment_group.ExperimentGroupBOEvent)
+auditor.subscribe(experiment_group.ExperimentGroupTPEEvent)
 auditor.subscribe(experiment_group.ExperimentGroupDeletedTriggeredEvent)
 auditor.subscribe(experiment_group.ExperimentGroupStoppedTriggeredEvent)
 auditor.subscribe(experiment_group.ExperimentGroupResumedTriggeredEvent)
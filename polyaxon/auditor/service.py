@@ -3,14 +3,21 @@ from event_manager.event_service import EventService
 
 
 class AuditorService(EventService):
-    """An service that just passes the event to author services."""
+    """An service that just passes the event to author services.
+
+    The services handling every event type are routed once at setup,
+    an event is only passed to the services handling it.
+    """
 
     event_manager = default_manager
+    stats_key = 'auditor'
 
     def __init__(self):
         self.notifier = None
         self.tracker = None
         self.activitylogs = None
+        self.services = []
+        self.routes = {}
 
     def get_event(self, event_type, instance, **kwargs):
         return {
@@ -19,16 +26,23 @@ class AuditorService(EventService):
             'kwargs': kwargs
         }
 
+    def get_services(self, event_type):
+        """Return the services handling the event type."""
+        return self.routes.get(event_type, [])
+
+    def build_routes(self):
+        self.services = [self.notifier.backend, self.tracker.backend, self.activitylogs.backend]
+        self.routes = {
+            event_type: [service for service in self.services
+                         if service.event_manager.knows(event_type)]
+            for event_type in self.event_manager.keys
+        }
+
     def record_event(self, event):
-        self.notifier.record(event_type=event['event_type'],
-                             instance=event['instance'],
-                             **event['kwargs'])
-        self.tracker.record(event_type=event['event_type'],
-                            instance=event['instance'],
-                            **event['kwargs'])
-        self.activitylogs.record(event_type=event['event_type'],
-                                 instance=event['instance'],
-                                 **event['kwargs'])
+        for service in self.get_services(event['event_type']):
+            service.record(event_type=event['event_type'],
+                           instance=event['instance'],
+                           **event['kwargs'])
 
     def setup(self):
         super().setup()
@@ -42,3 +56,9 @@ class AuditorService(EventService):
         self.notifier = notifier
         self.tracker = tracker
         self.activitylogs = activitylogs
+
+        # Load the services' event types to route the events
+        import notifier.events  # noqa
+        import tracker.events  # noqa
+        import activitylogs.events  # noqa
+        self.build_routes()
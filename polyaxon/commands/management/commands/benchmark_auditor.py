@@ -0,0 +1,96 @@
+import json
+import statistics
+import time
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+import auditor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.experiments.views import ProjectExperimentListView
+from auditor.async_service import AsyncAuditorService
+from auditor.service import AuditorService
+from db.models.activitylogs import ActivityLog
+from db.models.notification import NotificationEvent
+from db.models.projects import Project
+
+
+class Command(BaseCommand):
+    """Benchmarks the latency of a project's experiments list with the auditor backends, in ms.
+
+    The list is requested without auditing, with the sync auditor and with the async auditor,
+    the async auditor is flushed before the next backend is benchmarked.
+    The activity logs and notification events recorded are deleted.
+    """
+    help = 'Benchmarks the latency of an API view without and with the auditor backends.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project',
+            dest='project',
+            type=int,
+            required=True,
+            help='The id of the project to list the experiments of.',
+        )
+        parser.add_argument(
+            '--repeat',
+            dest='repeat',
+            type=int,
+            default=200,
+            help='The number of requests per backend.',
+        )
+
+    @staticmethod
+    def get_backends():
+        # A service that is not set up records nothing
+        backends = [('disabled', AuditorService()),
+                    ('sync', AuditorService()),
+                    ('async', AsyncAuditorService())]
+        for _, backend in backends[1:]:
+            backend.setup()
+        return backends
+
+    @staticmethod
+    def run(project, repeat):
+        factory = APIRequestFactory()
+        view = ProjectExperimentListView.as_view()
+        durations = []
+        for _ in range(repeat):
+            request = factory.get('/')
+            force_authenticate(request, user=project.user)
+            start = time.perf_counter()
+            response = view(request, username=project.user.username, name=project.name)
+            response.render()
+            durations.append((time.perf_counter() - start) * 1000)
+        durations.sort()
+        return {
+            'median': statistics.median(durations),
+            'p95': durations[int(0.95 * (len(durations) - 1))],
+        }
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.select_related('user').get(id=options['project'])
+        except Project.DoesNotExist:
+            raise CommandError('Project `{}` does not exist.'.format(options['project']))
+        if options['repeat'] < 1:
+            raise CommandError('The number of repetitions must be positive.')
+
+        last_ids = {
+            model: model.objects.order_by('-id').values_list('id', flat=True).first() or 0
+            for model in (ActivityLog, NotificationEvent)
+        }
+        wrapped = auditor.backend._wrapped
+        report = {'repeat': options['repeat']}
+        try:
+            for name, backend in self.get_backends():
+                auditor.backend._wrapped = backend
+                report[name] = self.run(project=project, repeat=options['repeat'])
+                if hasattr(backend, 'flush'):
+                    backend.flush(timeout=60)
+        finally:
+            auditor.backend._wrapped = wrapped
+            for model, last_id in last_ids.items():
+                model.objects.filter(id__gt=last_id).delete()
+        self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
@@ -0,0 +1,116 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from activitylogs.service import ActivityLogService
+from db.models.experiments import Experiment
+from event_manager.events.experiment import EXPERIMENT_SUCCEEDED, EXPERIMENT_VIEWED
+from notifier.service import NotifierService
+
+
+class Command(BaseCommand):
+    """Benchmarks the activity logs and notifications writes, in events per second.
+
+    The events of the project's last experiment are written an insert per event,
+    and in batches of bulk inserts. All writes are rolled back.
+    """
+    help = 'Benchmarks the activity logs and notifications writers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project',
+            dest='project',
+            type=int,
+            required=True,
+            help='The id of the project of the experiment to write the events of.',
+        )
+        parser.add_argument(
+            '--n_events',
+            dest='n_events',
+            type=int,
+            default=10000,
+            help='The number of events written by each writer.',
+        )
+        parser.add_argument(
+            '--batch_size',
+            dest='batch_size',
+            type=int,
+            default=500,
+            help='The number of events per bulk insert.',
+        )
+
+    @staticmethod
+    def get_rate(write, rows, batch_size):
+        start = time.perf_counter()
+        for i in range(0, len(rows), batch_size):
+            write(rows[i:i + batch_size])
+        return len(rows) / (time.perf_counter() - start)
+
+    def run(self, experiment, n_events, batch_size):
+        activity_logs = ActivityLogService()
+        activity_logs.setup()
+        notifier = NotifierService()
+        notifier.setup()
+
+        viewed_events = [
+            activity_logs.get_event(event_type=EXPERIMENT_VIEWED,
+                                    instance=experiment,
+                                    actor_id=experiment.user_id,
+                                    actor_name=experiment.user.username)
+            for _ in range(n_events)]
+        succeeded_events = [
+            notifier.get_event(event_type=EXPERIMENT_SUCCEEDED, instance=experiment)
+            for _ in range(n_events)]
+        recipients = notifier.get_recipients(succeeded_events[0])
+
+        def get_notification_events():
+            # Model instances can only be inserted once
+            return [(notifier.get_notification_event(event), recipients)
+                    for event in succeeded_events]
+
+        def create_activity_logs(events):
+            for event in events:
+                activity_logs.record_event(event)
+
+        def create_notifications(events):
+            for notification_event in events:
+                notifier.create_notifications([notification_event])
+
+        return {
+            'activity_logs': {
+                'create': self.get_rate(create_activity_logs, viewed_events, batch_size),
+                'bulk_create': self.get_rate(activity_logs.record_events,
+                                             viewed_events,
+                                             batch_size),
+            },
+            'notifications': {
+                'create': self.get_rate(create_notifications,
+                                        get_notification_events(),
+                                        batch_size),
+                'bulk_create': self.get_rate(notifier.create_notifications,
+                                             get_notification_events(),
+                                             batch_size),
+            },
+        }
+
+    def handle(self, *args, **options):
+        experiment = Experiment.objects.filter(
+            project_id=options['project']).select_related('user', 'project__user').last()
+        if experiment is None:
+            raise CommandError('Project `{}` does not exist or has no experiments.'.format(
+                options['project']))
+        if options['n_events'] < 1 or options['batch_size'] < 1:
+            raise CommandError('The number of events and the batch size must be positive.')
+
+        with transaction.atomic():
+            report = {
+                'n_events': options['n_events'],
+                'batch_size': options['batch_size'],
+                'events_per_second': self.run(experiment=experiment,
+                                              n_events=options['n_events'],
+                                              batch_size=options['batch_size']),
+            }
+            transaction.set_rollback(True)
+        self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
@@ -0,0 +1,93 @@
+import json
+import statistics
+import timeit
+import uuid
+
+from functools import partial
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from auditor.manager import default_manager
+
+
+class Command(BaseCommand):
+    """Benchmarks the creation and serialization of the registered events, in microseconds.
+
+    Every event is created from an instance holding all its attributes.
+    """
+    help = 'Benchmarks the creation and serialization of the registered events.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--number',
+            dest='number',
+            type=int,
+            default=1000,
+            help='The number of events created per measure.',
+        )
+        parser.add_argument(
+            '--repeat',
+            dest='repeat',
+            type=int,
+            default=5,
+            help='The number of measures per event.',
+        )
+
+    @staticmethod
+    def get_value(attribute):
+        if attribute.is_datetime:
+            return timezone.now()
+        if attribute.is_uuid:
+            return uuid.uuid4()
+        if attribute.attr_type in (int, float):
+            return attribute.attr_type(1)
+        if attribute.attr_type is bool:
+            return True
+        return 'value'
+
+    def get_instance(self, event):
+        """Return an instance with the values of all the event's attributes."""
+        instance = SimpleNamespace()
+        for attribute in event.get_event_attributes():
+            *path, name = attribute.name.split('.')
+            value = instance
+            for key in path:
+                if not hasattr(value, key):
+                    setattr(value, key, SimpleNamespace())
+                value = getattr(value, key)
+            setattr(value, name, self.get_value(attribute))
+        return instance
+
+    @staticmethod
+    def measure(func, number, repeat):
+        return statistics.median(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+    def handle(self, *args, **options):
+        if options['number'] < 1 or options['repeat'] < 1:
+            raise CommandError('The number of events and of measures must be positive.')
+        # Load the registered events
+        import auditor.events  # noqa
+
+        number = options['number']
+        repeat = options['repeat']
+        events = {}
+        for event_type, event in sorted(default_manager.items):
+            instance = self.get_instance(event)
+            created = event.from_instance(instance)
+            events[event_type] = {
+                'from_instance': self.measure(partial(event.from_instance, instance),
+                                              number=number,
+                                              repeat=repeat),
+                'serialize': self.measure(partial(created.serialize, include_actor_name=False),
+                                          number=number,
+                                          repeat=repeat),
+            }
+        report = {
+            'n_events': len(events),
+            'from_instance': statistics.mean(e['from_instance'] for e in events.values()),
+            'serialize': statistics.mean(e['serialize'] for e in events.values()),
+            'events': events,
+        }
+        self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
@@ -0,0 +1,105 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from api.experiments.serializers import ExperimentMetricSerializer
+from db.models.experiments import Experiment
+from db.redis.group_metrics import RedisGroupMetrics
+
+
+class Command(BaseCommand):
+    """Benchmarks the metrics ingestion of an experiment, in rows per second.
+
+    The metrics are created one by one, like the single metric api,
+    and in batches, like the list metrics api.
+    All writes are rolled back, the experiment is left unchanged.
+    """
+    help = 'Benchmarks the metrics ingestion of an experiment.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--experiment',
+            dest='experiment',
+            type=int,
+            required=True,
+            help='The id of the experiment to create the metrics for.',
+        )
+        parser.add_argument(
+            '--n_metrics',
+            dest='n_metrics',
+            type=int,
+            default=1000,
+            help='The number of metrics to create.',
+        )
+        parser.add_argument(
+            '--batch_size',
+            dest='batch_size',
+            type=int,
+            default=100,
+            help='The number of metrics per batch.',
+        )
+        parser.add_argument(
+            '--n_values',
+            dest='n_values',
+            type=int,
+            default=5,
+            help='The number of values per metric.',
+        )
+
+    @staticmethod
+    def get_data(n_metrics, n_values):
+        return [{'values': {'metric{}'.format(i): random.random() for i in range(n_values)}}
+                for _ in range(n_metrics)]
+
+    @staticmethod
+    def create_metrics(experiment, data, many):
+        serializer = ExperimentMetricSerializer(data=data, many=many)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(experiment=experiment)
+
+    def run(self, experiment, data, batch_size):
+        with transaction.atomic():
+            start = time.perf_counter()
+            if batch_size > 1:
+                for i in range(0, len(data), batch_size):
+                    self.create_metrics(experiment, data[i:i + batch_size], many=True)
+            else:
+                for metric in data:
+                    self.create_metrics(experiment, metric, many=False)
+            duration = time.perf_counter() - start
+            transaction.set_rollback(True)
+        return {
+            'batch_size': batch_size,
+            'duration': duration,
+            'rows_per_second': len(data) / duration if duration else None,
+        }
+
+    def handle(self, *args, **options):
+        try:
+            experiment = Experiment.objects.get(id=options['experiment'])
+        except Experiment.DoesNotExist:
+            raise CommandError('Experiment `{}` does not exist.'.format(options['experiment']))
+        if options['n_metrics'] < 1 or options['batch_size'] < 1:
+            raise CommandError('The number of metrics and the batch size must be positive.')
+
+        last_metric = experiment.last_metric
+        data = self.get_data(n_metrics=options['n_metrics'], n_values=options['n_values'])
+        try:
+            report = {
+                'n_metrics': options['n_metrics'],
+                'single': self.run(Experiment.objects.get(id=experiment.id), data, batch_size=1),
+                'bulk': self.run(Experiment.objects.get(id=experiment.id),
+                                 data,
+                                 batch_size=options['batch_size']),
+            }
+        finally:
+            # The metrics cache is not part of the rolled back transaction
+            if experiment.experiment_group_id:
+                RedisGroupMetrics.set_experiment_metrics(
+                    experiment_group_id=experiment.experiment_group_id,
+                    experiment_id=experiment.id,
+                    last_metric=last_metric)
+        self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
@@ -0,0 +1,93 @@
+import json
+import time
+
+from datetime import timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from db.models.activitylogs import ActivityLog
+from db.models.projects import Project
+from libs.purge import delete_in_batches
+
+
+class Command(BaseCommand):
+    """Benchmarks the purge of the activity logs older than the retention, in seconds.
+
+    The activity logs are created over twice the retention, half of them are purged
+    in batches, and optionally by the ORM's delete, from the same rows.
+    The benchmark runs against a scratch database, created with the migrations
+    and destroyed at the end, every batch of the purge is committed as in production.
+    """
+    help = 'Benchmarks the purge of the activity logs.'
+
+    RETENTION = 30
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--n_rows',
+            dest='n_rows',
+            type=int,
+            default=10000000,
+            help='The number of activity logs to create.',
+        )
+        parser.add_argument(
+            '--batch_size',
+            dest='batch_size',
+            type=int,
+            default=10000,
+            help='The number of rows deleted per batch.',
+        )
+        parser.add_argument(
+            '--with_orm',
+            dest='with_orm',
+            action='store_true',
+            default=False,
+            help='Also benchmark the ORM delete, it loads all the purged rows in memory.',
+        )
+
+    def create_activity_logs(self, n_rows):
+        with connection.cursor() as cursor:
+            cursor.execute('TRUNCATE "{}"'.format(ActivityLog._meta.db_table))
+            cursor.execute(
+                'INSERT INTO "{}" ("event_type", "context", "created_at", '
+                '"content_type_id", "object_id") '
+                'SELECT \'project.viewed\', \'{{}}\'::jsonb, '
+                'now() - (i %% %s) * interval \'1 day\', %s, i '
+                'FROM generate_series(1, %s) i'.format(ActivityLog._meta.db_table),
+                [2 * self.RETENTION, ContentType.objects.get_for_model(Project).id, n_rows])
+            cursor.execute('ANALYZE "{}"'.format(ActivityLog._meta.db_table))
+
+    @staticmethod
+    def measure(purge):
+        start = time.perf_counter()
+        n_deleted = purge()
+        return {'seconds': time.perf_counter() - start, 'n_deleted': n_deleted}
+
+    def handle(self, *args, **options):
+        if options['n_rows'] < 1 or options['batch_size'] < 1:
+            raise CommandError('The number of rows and the batch size must be positive.')
+
+        last_date = timezone.now() - timedelta(days=self.RETENTION)
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            report = {
+                'n_rows': options['n_rows'],
+                'batch_size': options['batch_size'],
+            }
+            # Every purge starts from the same rows
+            self.create_activity_logs(n_rows=options['n_rows'])
+            report['batches'] = self.measure(lambda: delete_in_batches(
+                model=ActivityLog,
+                last_date=last_date,
+                batch_size=options['batch_size']))
+            if options['with_orm']:
+                self.create_activity_logs(n_rows=options['n_rows'])
+                report['orm'] = self.measure(lambda: ActivityLog.objects.filter(
+                    created_at__lte=last_date).delete()[0])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+        self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
@@ -0,0 +1,121 @@
+import json
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.fields.jsonb import KeyTransform
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from db.models.experiments import Experiment
+from db.models.projects import Project
+from query.indexes import create_json_key_index
+
+
+class Command(BaseCommand):
+    """Benchmarks the metric and declaration queries of a project's experiments, in seconds.
+
+    The experiments are created in a project, and the queries are run
+    without and with the indexes of the queried keys.
+    The benchmark runs against a scratch database, created with the migrations
+    and destroyed at the end, the experiments table in use is never locked.
+    """
+    help = 'Benchmarks the metric and declaration queries of experiments.'
+
+    BATCH_SIZE = 5000
+    N_RESULTS = 100
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--n_experiments',
+            dest='n_experiments',
+            type=int,
+            default=100000,
+            help='The number of experiments to create.',
+        )
+        parser.add_argument(
+            '--repeat',
+            dest='repeat',
+            type=int,
+            default=5,
+            help='The number of times each query is run.',
+        )
+
+    @staticmethod
+    def create_project():
+        # The bulk creation skips the signals, they clean the project's files on disk
+        user = get_user_model().objects.bulk_create([
+            get_user_model()(username='benchmark', email='benchmark@polyaxon.com')])[0]
+        return Project.objects.bulk_create([Project(user=user, name='benchmark')])[0]
+
+    def create_experiments(self, project, n_experiments):
+        learning_rates = [0.1, 0.01, 0.001, 0.0001]
+        for i in range(0, n_experiments, self.BATCH_SIZE):
+            Experiment.objects.bulk_create([
+                Experiment(user=project.user,
+                           project=project,
+                           name='benchmark-{}'.format(j),
+                           declarations={'lr': random.choice(learning_rates)},
+                           last_metric={'loss': random.random(), 'accuracy': random.random()})
+                for j in range(i, min(i + self.BATCH_SIZE, n_experiments))])
+
+    def get_queries(self, project):
+        queryset = Experiment.objects.filter(project=project)
+        return {
+            'metric.loss:<0.1': queryset.filter(
+                last_metric__loss__lt=0.1).order_by('-updated_at'),
+            'declarations.lr:0.01': queryset.filter(
+                declarations__lr=0.01).order_by('-updated_at'),
+            'sort=-metric.loss': queryset.annotate(
+                loss=KeyTransform('loss', 'last_metric')).order_by('-loss'),
+        }
+
+    @staticmethod
+    def get_plan(queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN ' + sql, params)
+            return [row[0] for row in cursor.fetchall()]
+
+    def run(self, project, repeat):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE "{}"'.format(Experiment._meta.db_table))
+        report = {}
+        for name, queryset in self.get_queries(project=project).items():
+            durations = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                list(queryset.values_list('id', flat=True)[:self.N_RESULTS])
+                durations.append(time.perf_counter() - start)
+            report[name] = {
+                'median': statistics.median(durations),
+                'plan': self.get_plan(queryset[:self.N_RESULTS])[0],
+            }
+        return report
+
+    def handle(self, *args, **options):
+        if options['n_experiments'] < 1 or options['repeat'] < 1:
+            raise CommandError('The number of experiments and of repetitions must be positive.')
+
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            project = self.create_project()
+            self.create_experiments(project=project, n_experiments=options['n_experiments'])
+            report = {
+                'n_experiments': options['n_experiments'],
+                'without_indexes': self.run(project=project, repeat=options['repeat']),
+            }
+            create_json_key_index(model=Experiment,
+                                  field='last_metric',
+                                  key='loss',
+                                  concurrently=False)
+            create_json_key_index(model=Experiment,
+                                  field='declarations',
+                                  key='lr',
+                                  concurrently=False)
+            report['with_indexes'] = self.run(project=project, repeat=options['repeat'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+        self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
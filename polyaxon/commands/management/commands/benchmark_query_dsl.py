@@ -0,0 +1,69 @@
+import json
+import timeit
+
+from functools import partial
+
+from django.core.management.base import BaseCommand, CommandError
+
+from db.models.experiments import Experiment
+from query.managers.base import compile_query
+from query.managers.experiment import ExperimentQueryManager
+
+
+class Command(BaseCommand):
+    """Micro benchmarks of the query DSL, in microseconds per call.
+
+    * parse: tokenize, parse and build the query spec, what every request did before caching.
+    * compile: the cached compilation of the query spec.
+    * apply: apply the query spec to the experiments queryset and compile its sql.
+
+    Metric and declaration keys are left out, their usage recording goes to redis.
+    """
+    help = 'Micro benchmarks of the query DSL.'
+
+    QUERY_SPECS = [
+        'status:running',
+        'id:1|2|3, status:~failed|stopped, tags:tag1',
+        'created_at:2018-01-01..2018-12-31, started_at:>2018-06-01, status:succeeded, '
+        'independent:true, name:~foo, tags:~tag2|tag3',
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--number',
+            dest='number',
+            type=int,
+            default=10000,
+            help='The number of calls per benchmark.',
+        )
+
+    @staticmethod
+    def parse(query_spec):
+        ExperimentQueryManager.handle_query(query_spec=query_spec)
+
+    @staticmethod
+    def compile(query_spec):
+        ExperimentQueryManager.compile(query_spec=query_spec)
+
+    @staticmethod
+    def apply(query_spec):
+        queryset = ExperimentQueryManager.apply(query_spec=query_spec,
+                                                queryset=Experiment.objects.all())
+        queryset.query.sql_with_params()
+
+    @staticmethod
+    def time(func, query_spec, number):
+        return timeit.timeit(partial(func, query_spec), number=number) / number * 1e6
+
+    def handle(self, *args, **options):
+        number = options['number']
+        if number < 1:
+            raise CommandError('The number of calls must be positive.')
+
+        compile_query.cache_clear()
+        report = {query_spec: {
+            'parse': self.time(self.parse, query_spec, number),
+            'compile': self.time(self.compile, query_spec, number),
+            'apply': self.time(self.apply, query_spec, number),
+        } for query_spec in self.QUERY_SPECS}
+        self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
@@ -0,0 +1,130 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hpsearch.simulator import HPSearchSimulator, get_hptuning_config, get_objective
+from schemas.hptuning import SearchAlgorithms
+
+
+class Command(BaseCommand):
+    """Simulates an hyperparameter search against a synthetic objective, without a cluster.
+
+    The command outputs a json report with the suggestion latency,
+    the simulated time to reach the target, and the utilisation of the concurrency slots,
+    e.g. to compare search algorithms or to detect performance regressions.
+    """
+    help = 'Simulates an hyperparameter search against a synthetic objective.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--search_algorithm',
+            dest='search_algorithm',
+            default=SearchAlgorithms.RANDOM,
+            help='The search algorithm to simulate: '
+                 'grid_search, random_search, hyperband, bo or tpe.',
+        )
+        parser.add_argument(
+            '--objective',
+            dest='objective',
+            default='branin',
+            help='The objective function: branin, hartmann or learning_curve.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            dest='concurrency',
+            type=int,
+            default=2,
+            help='The number of experiments running concurrently.',
+        )
+        parser.add_argument(
+            '--n_experiments',
+            dest='n_experiments',
+            type=int,
+            default=None,
+            help='The number of experiments, or initial trials for bo and tpe.',
+        )
+        parser.add_argument(
+            '--n_iterations',
+            dest='n_iterations',
+            type=int,
+            default=10,
+            help='The number of bo and tpe iterations.',
+        )
+        parser.add_argument(
+            '--grid_size',
+            dest='grid_size',
+            type=int,
+            default=5,
+            help='The number of values per param for grid search.',
+        )
+        parser.add_argument(
+            '--max_iter',
+            dest='max_iter',
+            type=int,
+            default=None,
+            help='The maximum resource of hyperband, by default the objective\'s maximum.',
+        )
+        parser.add_argument(
+            '--eta',
+            dest='eta',
+            type=int,
+            default=3,
+            help='The downsampling rate of hyperband.',
+        )
+        parser.add_argument(
+            '--target',
+            dest='target',
+            type=float,
+            default=None,
+            help='The metric value used to compute the time to target.',
+        )
+        parser.add_argument(
+            '--iteration_overhead',
+            dest='iteration_overhead',
+            type=float,
+            default=0.,
+            help='A simulated delay, in seconds, before each iteration.',
+        )
+        parser.add_argument(
+            '--noise',
+            dest='noise',
+            type=float,
+            default=0.,
+            help='The standard deviation of the noise added to the metrics.',
+        )
+        parser.add_argument(
+            '--seed',
+            dest='seed',
+            type=int,
+            default=None,
+            help='The random seed.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            objective = get_objective(options['objective'],
+                                      noise=options['noise'],
+                                      seed=options['seed'])
+            hptuning_config = get_hptuning_config(
+                search_algorithm=options['search_algorithm'],
+                objective=objective,
+                concurrency=options['concurrency'],
+                n_experiments=options['n_experiments'],
+                grid_size=options['grid_size'],
+                n_iterations=options['n_iterations'],
+                max_iter=options['max_iter'],
+                eta=options['eta'],
+                seed=options['seed'])
+        except ValueError as e:
+            raise CommandError(e)
+
+        simulator = HPSearchSimulator(hptuning_config=hptuning_config,
+                                      objective=objective,
+                                      target=options['target'],
+                                      iteration_overhead=options['iteration_overhead'])
+        report = simulator.simulate()
+        # Suggestions can hold numpy values
+        self.stdout.write(json.dumps(report.to_dict(),
+                                     indent=2,
+                                     sort_keys=True,
+                                     default=lambda value: value.item()))
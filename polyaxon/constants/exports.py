@@ -0,0 +1,17 @@
+class ExportFormats(object):
+    CSV = 'csv'
+    PARQUET = 'parquet'
+
+    VALUES = {CSV, PARQUET}
+
+
+class ExportContents(object):
+    """The content of an export.
+
+    * experiments: a row per experiment, with its flattened declarations and last metrics.
+    * metrics: a row per point of the experiments' metric histories.
+    """
+    EXPERIMENTS = 'experiments'
+    METRICS = 'metrics'
+
+    VALUES = {EXPERIMENTS, METRICS}
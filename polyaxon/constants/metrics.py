@@ -0,0 +1,13 @@
+class MetricSeriesX(object):
+    """The x axis used to index and query the metric series."""
+    TIMESTAMP = 'timestamp'
+    STEP = 'step'
+
+    VALUES = {TIMESTAMP, STEP}
+
+
+class Downsampling(object):
+    LTTB = 'lttb'
+    MIN_MAX = 'min_max'
+
+    VALUES = {LTTB, MIN_MAX}
@@ -1,18 +1,26 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+from django.utils import timezone
 
 from db.models.activitylogs import ActivityLog
-from db.models.notification import NotificationEvent
+from db.models.notification import Notification, NotificationEvent
+from libs.purge import delete_in_batches
 from polyaxon.celery_api import app as celery_app
 from polyaxon.settings import CleaningIntervals, CronsCeleryTasks
 
 
 @celery_app.task(name=CronsCeleryTasks.CLEAN_ACTIVITY_LOGS, ignore_result=True)
 def clean_activity_logs():
-    last_date = datetime.today() - timedelta(days=CleaningIntervals.ACTIVITY_LOGS)
-    ActivityLog.objects.filter(created_at__lte=last_date).delete()
+    last_date = timezone.now() - timedelta(days=CleaningIntervals.ACTIVITY_LOGS)
+    delete_in_batches(model=ActivityLog,
+                      last_date=last_date,
+                      batch_size=CleaningIntervals.BATCH_SIZE)
 
 
 @celery_app.task(name=CronsCeleryTasks.CLEAN_NOTIFICATIONS, ignore_result=True)
 def clean_notifications():
-    last_date = datetime.today() - timedelta(days=CleaningIntervals.NOTIFICATIONS)
-    NotificationEvent.objects.filter(created_at__lte=last_date).delete()
+    last_date = timezone.now() - timedelta(days=CleaningIntervals.NOTIFICATIONS)
+    delete_in_batches(model=NotificationEvent,
+                      last_date=last_date,
+                      batch_size=CleaningIntervals.BATCH_SIZE,
+                      cascades=[(Notification, 'event_id')])
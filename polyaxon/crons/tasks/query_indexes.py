@@ -0,0 +1,13 @@
+from db.models.experiments import Experiment
+from polyaxon.celery_api import app as celery_app
+from polyaxon.settings import CronsCeleryTasks, QueryIndexes
+from query.indexes import index_json_keys
+
+
+@celery_app.task(name=CronsCeleryTasks.QUERY_INDEX_KEYS, ignore_result=True)
+def query_index_keys():
+    for field in ('last_metric', 'declarations'):
+        index_json_keys(model=Experiment,
+                        field=field,
+                        min_hits=QueryIndexes.MIN_HITS,
+                        max_keys=QueryIndexes.MAX_KEYS)
@@ -0,0 +1,99 @@
+import numpy as np
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+CHUNK_SIZE = 1000
+
+
+def get_metrics_points(metrics):
+    points = {}
+    for metric in metrics:
+        timestamp = metric.created_at.timestamp()
+        step = np.nan if metric.step is None else metric.step
+        for name, value in (metric.values or {}).items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            if not np.isfinite(value):
+                continue
+            points.setdefault(name, []).append((timestamp, step, value))
+    return points
+
+
+def get_chunk_fields(points):
+    timestamps, steps, values = (np.asarray(a, dtype=np.float64) for a in zip(*points))
+    has_steps = not np.isnan(steps).all()
+    return {
+        'count': len(values),
+        'timestamps': timestamps.tobytes(),
+        'steps': steps.tobytes(),
+        'values': values.tobytes(),
+        'min_timestamp': float(timestamps.min()),
+        'max_timestamp': float(timestamps.max()),
+        'min_step': float(np.nanmin(steps)) if has_steps else None,
+        'max_step': float(np.nanmax(steps)) if has_steps else None,
+        'min_value': float(values.min()),
+        'max_value': float(values.max()),
+        'last_value': float(values[-1]),
+    }
+
+
+def migrate_experiment_metric_series(apps, schema_editor):
+    Experiment = apps.get_model('db', 'Experiment')
+    ExperimentMetric = apps.get_model('db', 'ExperimentMetric')
+    ExperimentMetricSeries = apps.get_model('db', 'ExperimentMetricSeries')
+    for experiment_id in Experiment.objects.values_list('id', flat=True):
+        metrics = ExperimentMetric.objects.filter(
+            experiment_id=experiment_id).order_by('created_at')
+        for name, points in get_metrics_points(metrics).items():
+            for chunk, i in enumerate(range(0, len(points), CHUNK_SIZE)):
+                ExperimentMetricSeries.objects.create(
+                    experiment_id=experiment_id,
+                    name=name,
+                    chunk=chunk,
+                    **get_chunk_fields(points[i:i + CHUNK_SIZE]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0010_auto_20181005_0920'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experimentmetric',
+            name='step',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ExperimentMetricSeries',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=256)),
+                ('chunk', models.PositiveIntegerField(default=0)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('timestamps', models.BinaryField(default=b'')),
+                ('steps', models.BinaryField(default=b'')),
+                ('values', models.BinaryField(default=b'')),
+                ('min_timestamp', models.FloatField(blank=True, null=True)),
+                ('max_timestamp', models.FloatField(blank=True, null=True)),
+                ('min_step', models.FloatField(blank=True, null=True)),
+                ('max_step', models.FloatField(blank=True, null=True)),
+                ('min_value', models.FloatField(blank=True, null=True)),
+                ('max_value', models.FloatField(blank=True, null=True)),
+                ('last_value', models.FloatField(blank=True, null=True)),
+                ('experiment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='metric_series', to='db.Experiment')),
+            ],
+            options={
+                'ordering': ['chunk'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='experimentmetricseries',
+            unique_together={('experiment', 'name', 'chunk')},
+        ),
+        migrations.RunPython(migrate_experiment_metric_series, migrations.RunPython.noop)
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0011_experimentmetricseries'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='experiment',
+            index=models.Index(fields=['project', 'updated_at', 'id'], name='experiment_project_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experimentmetric',
+            index=models.Index(fields=['experiment', 'created_at', 'id'], name='experimentmetric_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['created_at', 'id'], name='activitylog_created_idx'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0012_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notificationevent',
+            index=models.Index(fields=['created_at', 'id'], name='notificationevent_created_idx'),
+        ),
+    ]
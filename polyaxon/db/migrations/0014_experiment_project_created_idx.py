@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0013_notificationevent_created_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='experiment',
+            name='experiment_project_updated_idx',
+        ),
+        migrations.AddIndex(
+            model_name='experiment',
+            index=models.Index(fields=['project', 'created_at', 'id'], name='experiment_project_created_idx'),
+        ),
+    ]
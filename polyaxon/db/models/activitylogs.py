@@ -27,6 +27,9 @@ class ActivityLog(models.Model):
         app_label = 'db'
         verbose_name = 'activity log'
         verbose_name_plural = 'activities logs'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='activitylog_created_idx'),
+        ]
 
     def __str__(self):
         return '{} - {}'.format(self.event_type, self.created_at)
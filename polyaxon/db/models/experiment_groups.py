@@ -26,6 +26,7 @@ from db.models.utils import (
     RunTimeModel,
     TagModel
 )
+from db.redis.group_metrics import RedisGroupMetrics
 from libs.spec_validation import validate_group_hptuning_config, validate_group_spec_content
 from schemas.hptuning import HPTuningConfig, Optimization
 from schemas.specifications import GroupSpecification
@@ -149,6 +150,22 @@ class ExperimentGroup(DiffModel,
             return None
         return self.hptuning_config.early_stopping or []
 
+    @cached_property
+    def metric_early_stopping(self):
+        from hpsearch.schemas import get_metric_early_stopping_config
+
+        return get_metric_early_stopping_config(self.hptuning)
+
+    @cached_property
+    def has_metric_early_stopping(self):
+        return bool(self.metric_early_stopping)
+
+    @cached_property
+    def warm_start(self):
+        from hpsearch.schemas import get_warm_start_config
+
+        return get_warm_start_config(self.hptuning)
+
     @property
     def scheduled_experiments(self):
         return self.experiments.filter(
@@ -240,16 +257,46 @@ class ExperimentGroup(DiffModel,
         return query.order_by(metric_order_by)
 
     def get_experiments_metrics(self, metric, experiment_ids=None):
-        query = self.get_annotated_experiments_with_metric(
+        if not experiment_ids:
+            query = self.get_annotated_experiments_with_metric(
+                metric=metric,
+                experiment_ids=experiment_ids)
+            return query.values_list('id', metric)
+
+        # Read the cached metrics and only query the experiments missing from the cache
+        experiments_metrics, missing_ids = RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=self.id,
             metric=metric,
             experiment_ids=experiment_ids)
-        return query.values_list('id', metric)
+        if missing_ids:
+            missing_metrics = [
+                (experiment_id, last_metric) for experiment_id, last_metric in
+                self.experiments.filter(id__in=missing_ids).values_list('id', 'last_metric')
+                if last_metric
+            ]
+            RedisGroupMetrics.set_experiments_metrics(experiment_group_id=self.id,
+                                                      experiments_metrics=missing_metrics)
+            missing_metrics = dict(missing_metrics)
+            experiments_metrics += [
+                (experiment_id, (missing_metrics.get(experiment_id) or {}).get(metric))
+                for experiment_id in missing_ids]
+        return experiments_metrics
 
     @cached_property
     def search_manager(self):
         from hpsearch.search_managers import get_search_algorithm_manager
+        from hpsearch.warm_start import get_warm_start_observations
 
-        return get_search_algorithm_manager(hptuning_config=self.hptuning_config)
+        # The warm start observations are stored with the iterations once the search started
+        iteration_config = self.iteration_config
+        if iteration_config and iteration_config.warm_start_observations is not None:
+            warm_start_observations = iteration_config.warm_start_observations
+        else:
+            warm_start_observations = get_warm_start_observations(experiment_group=self)
+
+        return get_search_algorithm_manager(
+            hptuning_config=self.hptuning_config,
+            warm_start_observations=warm_start_observations)
 
     @cached_property
     def iteration_manager(self):
@@ -1,8 +1,9 @@
+import json
 import uuid
 
 from django.conf import settings
 from django.contrib.postgres.fields import JSONField
-from django.db import models
+from django.db import connection, models, transaction
 from django.utils import timezone
 from django.utils.functional import cached_property
 
@@ -13,6 +14,7 @@ from constants.jobs import JobLifeCycle
 from db.models.abstract_jobs import TensorboardJobMixin
 from db.models.charts import ChartViewModel
 from db.models.cloning_strategies import CloningStrategy
+from db.models.metric_series import ExperimentMetricSeries
 from db.models.statuses import LastStatusMixin, StatusModel
 from db.models.unique_names import EXPERIMENT_UNIQUE_NAME_FORMAT
 from db.models.utils import (
@@ -26,12 +28,17 @@ from db.models.utils import (
     RunTimeModel,
     TagModel
 )
+from db.redis.group_metrics import RedisGroupMetrics
+from db.redis.group_stats import RedisGroupStats
 from event_manager.events.experiment import (
     EXPERIMENT_COPIED,
+    EXPERIMENT_NEW_METRIC,
     EXPERIMENT_RESTARTED,
     EXPERIMENT_RESUMED
 )
 from libs.spec_validation import validate_experiment_spec_config
+from polyaxon.celery_api import app as celery_app
+from polyaxon.settings import HPCeleryTasks
 from schemas.specifications import ExperimentSpecification
 from schemas.tasks import TaskType
 
@@ -127,6 +134,10 @@ class Experiment(DiffModel,
     class Meta:
         app_label = 'db'
         unique_together = (('project', 'name'),)
+        indexes = [
+            models.Index(fields=['project', 'created_at', 'id'],
+                         name='experiment_project_created_idx'),
+        ]
 
     @property
     def unique_name(self):
@@ -222,6 +233,83 @@ class Experiment(DiffModel,
                                         message=message,
                                         traceback=traceback)
 
+    def add_metrics(self, metrics):
+        """Append new metrics to the experiment's metric series and update its last metric."""
+        metrics = sorted(metrics, key=lambda metric: metric.created_at)
+        ExperimentMetricSeries.append_metrics(experiment_id=self.id, metrics=metrics)
+        self.update_last_metric(values=[metric.values for metric in metrics])
+
+    @classmethod
+    def merge_last_metric(cls, experiment_id, values):
+        """Merge the values into an experiment's stored last metric and return the result.
+
+        The merge is a single `UPDATE ... RETURNING` statement, concurrent writers
+        of the same experiment don't override each other's values.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'UPDATE "{}" SET "last_metric" = '
+                'COALESCE("last_metric", \'{{}}\'::jsonb) || %s::jsonb '
+                'WHERE "id" = %s RETURNING "last_metric"'.format(cls._meta.db_table),
+                [json.dumps(values), experiment_id])
+            row = cursor.fetchone()
+        if not row:
+            return values
+        return json.loads(row[0]) if isinstance(row[0], str) else row[0]
+
+    def update_last_metric(self, values):
+        """Merge the values of new metrics, in chronological order, into the last metric.
+
+        The values are merged into the stored last metric by the database, not into
+        the possibly stale instance, and a single new metric event is recorded
+        regardless of the number of metrics.
+
+        The group's metrics cache is written while the updated row is locked,
+        concurrent updates write the cache in the same order as the database.
+        """
+        last_metric = {}
+        for value in values:
+            last_metric.update(value)
+        with transaction.atomic():
+            self.last_metric = self.merge_last_metric(experiment_id=self.id, values=last_metric)
+            if self.experiment_group_id:
+                RedisGroupMetrics.set_experiment_metrics(
+                    experiment_group_id=self.experiment_group_id,
+                    experiment_id=self.id,
+                    last_metric=self.last_metric)
+        auditor.record(event_type=EXPERIMENT_NEW_METRIC,
+                       instance=self)
+
+        if self.experiment_group_id:
+            RedisGroupStats.clear(experiment_group_id=self.experiment_group_id)
+
+            # Check if the experiment's group has a metric based early stopping policy
+            if self.experiment_group.has_metric_early_stopping:
+                self.check_metric_early_stopping(values=values)
+
+    def check_metric_early_stopping(self, values):
+        """Add the new metrics to the group's early stopping aggregates,
+        and only check the experiment if it reached a step to evaluate.
+        """
+        from hpsearch.early_stopping import get_metric_early_stopping_policy
+
+        policy = get_metric_early_stopping_policy(
+            config=self.experiment_group.metric_early_stopping)
+        if not policy:
+            return
+
+        steps = policy.add_metrics(experiment_group_id=self.experiment_group_id,
+                                   experiment_id=self.id,
+                                   metrics=values)
+        if not steps:
+            return
+
+        celery_app.send_task(
+            HPCeleryTasks.HP_EARLY_STOPPING,
+            kwargs={'experiment_group_id': self.experiment_group_id,
+                    'experiment_id': self.id,
+                    'step': steps[-1]})
+
     def _clone(self,
                cloning_strategy,
                event_type,
@@ -347,6 +435,7 @@ class ExperimentMetric(models.Model):
         on_delete=models.CASCADE,
         related_name='metrics')
     created_at = models.DateTimeField(default=timezone.now)
+    step = models.IntegerField(null=True, blank=True)
     values = JSONField()
 
     def __str__(self):
@@ -355,6 +444,10 @@ class ExperimentMetric(models.Model):
     class Meta:
         app_label = 'db'
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['experiment', 'created_at', 'id'],
+                         name='experimentmetric_created_idx'),
+        ]
 
 
 class ExperimentChartView(ChartViewModel):
@@ -0,0 +1,224 @@
+import numpy as np
+
+from django.db import models, transaction
+
+from constants.metrics import MetricSeriesX
+
+
+def pack(values):
+    return np.asarray(values, dtype=np.float64).tobytes()
+
+
+def unpack(data):
+    if not data:
+        return np.array([], dtype=np.float64)
+    return np.frombuffer(bytes(data), dtype=np.float64)
+
+
+def get_metrics_points(metrics):
+    """Return the numeric values of the metrics as {name: [(timestamp, step, value), ...]}.
+
+    Missing steps are stored as nan, non finite values are skipped.
+    """
+    points = {}
+    for metric in metrics:
+        timestamp = metric.created_at.timestamp()
+        step = np.nan if metric.step is None else metric.step
+        for name, value in (metric.values or {}).items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            if not np.isfinite(value):
+                continue
+            points.setdefault(name, []).append((timestamp, step, value))
+    return points
+
+
+class ExperimentMetricSeries(models.Model):
+    """A chunk of the points of an experiment's metric.
+
+    The timestamps, steps and values are packed float64 arrays of up to `CHUNK_SIZE` points,
+    the last chunks are small until they are compacted,
+    the chunk's bounds and rollups are used to select the chunks of a range
+    without reading their points.
+    """
+    CHUNK_SIZE = 1000
+    TAIL_SIZE = 50
+
+    experiment = models.ForeignKey(
+        'db.Experiment',
+        on_delete=models.CASCADE,
+        related_name='metric_series')
+    name = models.CharField(max_length=256)
+    chunk = models.PositiveIntegerField(default=0)
+    count = models.PositiveIntegerField(default=0)
+    timestamps = models.BinaryField(default=b'')
+    steps = models.BinaryField(default=b'')
+    values = models.BinaryField(default=b'')
+    min_timestamp = models.FloatField(null=True, blank=True)
+    max_timestamp = models.FloatField(null=True, blank=True)
+    min_step = models.FloatField(null=True, blank=True)
+    max_step = models.FloatField(null=True, blank=True)
+    min_value = models.FloatField(null=True, blank=True)
+    max_value = models.FloatField(null=True, blank=True)
+    last_value = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        app_label = 'db'
+        unique_together = (('experiment', 'name', 'chunk'),)
+        ordering = ['chunk']
+
+    def __str__(self):
+        return '{} <{}:{}>'.format(self.experiment_id, self.name, self.chunk)
+
+    def set_points(self, timestamps, steps, values):
+        self.timestamps = pack(timestamps)
+        self.steps = pack(steps)
+        self.values = pack(values)
+        self.count = len(values)
+        self.min_timestamp = float(timestamps.min())
+        self.max_timestamp = float(timestamps.max())
+        if np.isnan(steps).all():
+            self.min_step = None
+            self.max_step = None
+        else:
+            self.min_step = float(np.nanmin(steps))
+            self.max_step = float(np.nanmax(steps))
+        self.min_value = float(values.min())
+        self.max_value = float(values.max())
+        self.last_value = float(values[-1])
+
+    def get_points(self):
+        return unpack(self.timestamps), unpack(self.steps), unpack(self.values)
+
+    def add_points(self, points):
+        timestamps, steps, values = (np.asarray(a, dtype=np.float64) for a in zip(*points))
+        old_timestamps, old_steps, old_values = self.get_points()
+        self.set_points(timestamps=np.concatenate([old_timestamps, timestamps]),
+                        steps=np.concatenate([old_steps, steps]),
+                        values=np.concatenate([old_values, values]))
+
+    @classmethod
+    def compact(cls, experiment_id, name):
+        """Repack the last chunks into full chunks once they hold `CHUNK_SIZE` points.
+
+        The tail chunks are small to keep the appends cheap,
+        they are merged once in a batch instead of rewriting a full chunk on every append.
+        """
+        query = cls.objects.filter(experiment_id=experiment_id, name=name)
+        last_chunks = query.order_by('-chunk').values_list('chunk', 'count')[
+            :cls.CHUNK_SIZE // cls.TAIL_SIZE + 2]
+        chunk_ids = []
+        count = 0
+        for chunk, chunk_count in last_chunks:
+            if chunk_count >= cls.CHUNK_SIZE:
+                break
+            chunk_ids.append(chunk)
+            count += chunk_count
+        if len(chunk_ids) < 2 or count < cls.CHUNK_SIZE:
+            return
+
+        chunks = list(query.filter(chunk__in=chunk_ids).order_by('chunk'))
+        timestamps, steps, values = (np.concatenate(a) for a in
+                                     zip(*[chunk.get_points() for chunk in chunks]))
+        for i, chunk in enumerate(chunks):
+            start = i * cls.CHUNK_SIZE
+            if start >= count:
+                chunk.delete()
+                continue
+            end = start + cls.CHUNK_SIZE
+            chunk.set_points(timestamps=timestamps[start:end],
+                             steps=steps[start:end],
+                             values=values[start:end])
+            chunk.save()
+
+    @classmethod
+    def append_metrics(cls, experiment_id, metrics):
+        """Append the numeric values of the metrics, ordered by creation, to their series.
+
+        The first chunk of a series is locked while appending, the concurrent writers
+        of a series append one after the other.
+        The points are added to the last chunk while it holds less than `TAIL_SIZE` points,
+        or `CHUNK_SIZE` points when it is empty, the other points are added to new chunks.
+        """
+        for name, points in get_metrics_points(metrics).items():
+            with transaction.atomic():
+                first_chunk, _ = cls.objects.select_for_update().get_or_create(
+                    experiment_id=experiment_id, name=name, chunk=0)
+                series = cls.objects.filter(
+                    experiment_id=experiment_id, name=name).order_by('-chunk').first()
+                if series.pk == first_chunk.pk:
+                    series = first_chunk
+                while points:
+                    if series.count == 0:
+                        n_points = cls.CHUNK_SIZE
+                    elif series.count < cls.TAIL_SIZE:
+                        n_points = cls.TAIL_SIZE - series.count
+                    else:
+                        series = cls(experiment_id=experiment_id,
+                                     name=name,
+                                     chunk=series.chunk + 1)
+                        continue
+                    series.add_points(points[:n_points])
+                    series.save()
+                    points = points[n_points:]
+                cls.compact(experiment_id=experiment_id, name=name)
+
+    @classmethod
+    def get_names(cls, experiment_id):
+        query = cls.objects.filter(experiment_id=experiment_id).order_by('name')
+        return list(query.values_list('name', flat=True).distinct())
+
+    @classmethod
+    def _get_chunks(cls, query, x, start, end):
+        if x not in MetricSeriesX.VALUES:
+            raise ValueError('The metric series x `{}` is not supported.'.format(x))
+        if start is not None:
+            query = query.filter(**{'max_{}__gte'.format(x): start})
+        if end is not None:
+            query = query.filter(**{'min_{}__lte'.format(x): end})
+        return query.values_list('experiment_id', 'name', '{}s'.format(x), 'values')
+
+    @staticmethod
+    def _get_points(chunks, start, end):
+        xs = np.concatenate([unpack(chunk[0]) for chunk in chunks])
+        ys = np.concatenate([unpack(chunk[1]) for chunk in chunks])
+        mask = ~np.isnan(xs)
+        if start is not None:
+            mask &= xs >= start
+        if end is not None:
+            mask &= xs <= end
+        xs = xs[mask]
+        ys = ys[mask]
+        order = np.argsort(xs, kind='mergesort')
+        return xs[order], ys[order]
+
+    @classmethod
+    def get_series(cls, experiment_id, name, x=MetricSeriesX.TIMESTAMP, start=None, end=None):
+        """Return the x and y arrays of the metric's points in [start, end], ordered by x.
+
+        Points without steps are excluded when the x axis is the step.
+        """
+        query = cls.objects.filter(experiment_id=experiment_id, name=name)
+        chunks = [chunk[2:] for chunk in cls._get_chunks(query, x=x, start=start, end=end)]
+        if not chunks:
+            return np.array([], dtype=np.float64), np.array([], dtype=np.float64)
+        return cls._get_points(chunks, start=start, end=end)
+
+    @classmethod
+    def get_experiments_series(cls,
+                               experiment_ids,
+                               names,
+                               x=MetricSeriesX.TIMESTAMP,
+                               start=None,
+                               end=None):
+        """Return the series of several experiments and metrics with a single query.
+
+        Returns:
+            dict: {(experiment_id, name): (x array, y array)} of the series with points.
+        """
+        query = cls.objects.filter(experiment_id__in=experiment_ids, name__in=names)
+        chunks = {}
+        for experiment_id, name, xs, ys in cls._get_chunks(query, x=x, start=start, end=end):
+            chunks.setdefault((experiment_id, name), []).append((xs, ys))
+        return {key: cls._get_points(value, start=start, end=end)
+                for key, value in chunks.items()}
@@ -26,6 +26,9 @@ class NotificationEvent(models.Model):
         app_label = 'db'
         verbose_name = 'notification event'
         verbose_name_plural = 'notification events'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='notificationevent_created_idx'),
+        ]
 
     def __str__(self):
         return '{} - {}'.format(self.event_type, self.created_at)
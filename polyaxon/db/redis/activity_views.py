@@ -0,0 +1,30 @@
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisActivityViews(BaseRedisDb):
+    """
+    RedisActivityViews marks the views of objects by actors for a time window,
+    the views already marked in their window are not recorded as activity logs.
+    """
+    KEY_VIEW = 'activity_views:{}:{}:{}'
+
+    REDIS_POOL = RedisPools.ACTIVITY_VIEWS
+
+    @classmethod
+    def get_key(cls, event_type, object_id, actor_id):
+        return cls.KEY_VIEW.format(event_type, object_id, actor_id)
+
+    @classmethod
+    def mark_views(cls, views, ttl):
+        """Mark the (event_type, object_id, actor_id) views, returns which were not marked yet."""
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        for event_type, object_id, actor_id in views:
+            pipe.set(cls.get_key(event_type, object_id, actor_id), 1, ex=ttl, nx=True)
+        return [bool(result) for result in pipe.execute()]
+
+    @classmethod
+    def clear(cls, event_type, object_id, actor_id):
+        red = cls._get_redis()
+        red.delete(cls.get_key(event_type, object_id, actor_id))
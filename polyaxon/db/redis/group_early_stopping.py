@@ -0,0 +1,67 @@
+import json
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisGroupEarlyStopping(BaseRedisDb):
+    """
+    RedisGroupEarlyStopping keeps the running aggregates of the early stopping metric
+    of the experiments of a group, updated incrementally with every reported metric.
+
+    Each group has a hash mapping experiment ids to their aggregates,
+    and a hash per evaluated step mapping experiment ids to their peer values at this step,
+    the peers of an experiment at a step are read without reading their metrics.
+    """
+    KEY_EXPERIMENTS = 'group_early_stopping:{}:experiments'
+    KEY_STEP = 'group_early_stopping:{}:steps:{}'
+    TTL = 7 * 24 * 60 * 60
+
+    REDIS_POOL = RedisPools.GROUP_METRICS
+
+    @classmethod
+    def get_experiments_key(cls, experiment_group_id):
+        return cls.KEY_EXPERIMENTS.format(experiment_group_id)
+
+    @classmethod
+    def get_step_key(cls, experiment_group_id, step):
+        return cls.KEY_STEP.format(experiment_group_id, step)
+
+    @classmethod
+    def get_experiment_aggregates(cls, experiment_group_id, experiment_id):
+        red = cls._get_redis()
+        value = red.hget(cls.get_experiments_key(experiment_group_id), experiment_id)
+        return json.loads(value.decode()) if value else None
+
+    @classmethod
+    def update_experiment(cls, experiment_group_id, experiment_id, update):
+        """Update the aggregates of an experiment atomically and return its new steps values.
+
+        `update` receives the stored aggregates, or None, and returns the new aggregates
+        and the {step: values} of the steps to store.
+        """
+        red = cls._get_redis()
+        experiments_key = cls.get_experiments_key(experiment_group_id)
+
+        def update_aggregates(pipe):
+            value = pipe.hget(experiments_key, experiment_id)
+            aggregates, steps_values = update(json.loads(value.decode()) if value else None)
+            pipe.multi()
+            pipe.hset(experiments_key, experiment_id, json.dumps(aggregates))
+            pipe.expire(experiments_key, cls.TTL)
+            for step, step_values in steps_values.items():
+                step_key = cls.get_step_key(experiment_group_id, step)
+                pipe.hset(step_key, experiment_id, json.dumps(step_values))
+                pipe.expire(step_key, cls.TTL)
+            return steps_values
+
+        return red.transaction(update_aggregates, experiments_key, value_from_callable=True)
+
+    @classmethod
+    def get_step_values(cls, experiment_group_id, step):
+        """Return the {experiment_id: values} of the experiments that reached the step."""
+        red = cls._get_redis()
+        values = red.hgetall(cls.get_step_key(experiment_group_id, step))
+        return {int(experiment_id): json.loads(value.decode())
+                for experiment_id, value in values.items()}
+
@@ -0,0 +1,64 @@
+import json
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisGroupMetrics(BaseRedisDb):
+    """
+    RedisGroupMetrics provides a per group cache of the experiments' last metrics,
+    updated incrementally every time an experiment of the group reports new metrics.
+
+    Each group has a redis hash mapping experiment ids to their encoded last metrics.
+    """
+    KEY_GROUP_METRICS = 'group_metrics:{}'
+
+    REDIS_POOL = RedisPools.GROUP_METRICS
+
+    @classmethod
+    def get_key(cls, experiment_group_id):
+        return cls.KEY_GROUP_METRICS.format(experiment_group_id)
+
+    @classmethod
+    def set_experiment_metrics(cls, experiment_group_id, experiment_id, last_metric):
+        red = cls._get_redis()
+        red.hset(cls.get_key(experiment_group_id), experiment_id, json.dumps(last_metric))
+
+    @classmethod
+    def set_experiments_metrics(cls, experiment_group_id, experiments_metrics):
+        """Fill the cache with a list of (experiment_id, last_metric) read from the database.
+
+        The experiments already cached are not overwritten, their cached metrics were set
+        by `set_experiment_metrics` and can be newer than the metrics read.
+        """
+        if not experiments_metrics:
+            return
+        key = cls.get_key(experiment_group_id)
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        for experiment_id, last_metric in experiments_metrics:
+            pipe.hsetnx(key, experiment_id, json.dumps(last_metric))
+        pipe.execute()
+
+    @classmethod
+    def get_experiments_metrics(cls, experiment_group_id, metric, experiment_ids):
+        """Return the cached (experiment_id, metric value) and the ids missing from the cache."""
+        experiment_ids = list(experiment_ids)
+        if not experiment_ids:
+            return [], []
+        red = cls._get_redis()
+        values = red.hmget(cls.get_key(experiment_group_id), experiment_ids)
+        experiments_metrics = []
+        missing_ids = []
+        for experiment_id, value in zip(experiment_ids, values):
+            if value is None:
+                missing_ids.append(experiment_id)
+            else:
+                experiments_metrics.append(
+                    (experiment_id, (json.loads(value.decode()) or {}).get(metric)))
+        return experiments_metrics, missing_ids
+
+    @classmethod
+    def clear(cls, experiment_group_id):
+        red = cls._get_redis()
+        red.delete(cls.get_key(experiment_group_id))
@@ -0,0 +1,75 @@
+import json
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisGroupStats(BaseRedisDb):
+    """
+    RedisGroupStats caches the aggregate statistics of a group's experiments,
+    cleared every time an experiment of the group reports new metrics or a new status.
+    Statistics computed while the group's statistics are cleared are not cached.
+
+    Each group has a redis hash mapping the encoded statistics params to the statistics.
+    The statistics are derived from the groups' metrics, they share the same redis db.
+    """
+    KEY_GROUP_STATS = 'group_stats:{}'
+    KEY_GENERATION = 'group_stats:{}:generation'
+    TTL = 24 * 60 * 60
+
+    REDIS_POOL = RedisPools.GROUP_METRICS
+
+    @classmethod
+    def get_key(cls, experiment_group_id):
+        return cls.KEY_GROUP_STATS.format(experiment_group_id)
+
+    @classmethod
+    def get_generation_key(cls, experiment_group_id):
+        return cls.KEY_GENERATION.format(experiment_group_id)
+
+    @staticmethod
+    def get_field(params):
+        return json.dumps(params, sort_keys=True)
+
+    @classmethod
+    def get_stats(cls, experiment_group_id, params):
+        """Return the cached statistics, or None, and the generation of the group's statistics.
+
+        The generation is incremented by every `clear`,
+        the statistics computed after a miss are set with the generation read before computing them.
+        """
+        red = cls._get_redis()
+        pipe = red.pipeline()
+        pipe.get(cls.get_generation_key(experiment_group_id))
+        pipe.hget(cls.get_key(experiment_group_id), cls.get_field(params))
+        generation, value = pipe.execute()
+        generation = int(generation) if generation is not None else 0
+        return json.loads(value.decode()) if value is not None else None, generation
+
+    @classmethod
+    def set_stats(cls, experiment_group_id, params, stats, generation):
+        """Cache the statistics, unless the group's statistics were cleared since `generation`."""
+        key = cls.get_key(experiment_group_id)
+        generation_key = cls.get_generation_key(experiment_group_id)
+        red = cls._get_redis()
+
+        def set_if_unchanged(pipe):
+            current = pipe.get(generation_key)
+            if (int(current) if current is not None else 0) != generation:
+                return
+            pipe.multi()
+            pipe.hset(key, cls.get_field(params), json.dumps(stats))
+            # Bound the lifetime of the stats of the groups that don't change any more
+            pipe.expire(key, cls.TTL)
+
+        red.transaction(set_if_unchanged, generation_key)
+
+    @classmethod
+    def clear(cls, experiment_group_id):
+        generation_key = cls.get_generation_key(experiment_group_id)
+        red = cls._get_redis()
+        pipe = red.pipeline()
+        pipe.incr(generation_key)
+        pipe.expire(generation_key, cls.TTL)
+        pipe.delete(cls.get_key(experiment_group_id))
+        pipe.execute()
@@ -0,0 +1,35 @@
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisQueryKeys(BaseRedisDb):
+    """
+    RedisQueryKeys counts how many times the keys of a json field are used
+    to filter or to sort a table, in order to index the most queried ones.
+
+    Each json field has a redis sorted set mapping its keys to their number of hits.
+    """
+    KEY_QUERY_KEYS = 'query_keys:{}.{}'
+
+    REDIS_POOL = RedisPools.QUERY_KEYS
+
+    @classmethod
+    def get_key(cls, table, field):
+        return cls.KEY_QUERY_KEYS.format(table, field)
+
+    @classmethod
+    def increment(cls, table, field, key):
+        red = cls._get_redis()
+        return red.zincrby(cls.get_key(table, field), key, 1)
+
+    @classmethod
+    def get_keys(cls, table, field, min_hits, count):
+        """Return the most queried keys with at least `min_hits` hits."""
+        red = cls._get_redis()
+        keys = red.zrevrangebyscore(cls.get_key(table, field), '+inf', min_hits, start=0, num=count)
+        return [key.decode() for key in keys]
+
+    @classmethod
+    def clear(cls, table, field):
+        red = cls._get_redis()
+        red.delete(cls.get_key(table, field))
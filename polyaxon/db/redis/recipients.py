@@ -0,0 +1,59 @@
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisRecipients(BaseRedisDb):
+    """
+    RedisRecipients caches the owners of the projects and the emails of the users,
+    to resolve the recipients of the notifications without loading the projects and users.
+
+    The values are cleared when a project or a user is saved or deleted.
+    """
+    KEY_PROJECT_OWNER = 'recipients:project_owner:{}'
+    KEY_USER_EMAIL = 'recipients:user_email:{}'
+    TTL = 24 * 60 * 60
+
+    REDIS_POOL = RedisPools.RECIPIENTS
+
+    @classmethod
+    def _get_values(cls, key, ids):
+        if not ids:
+            return {}
+        red = cls._get_redis()
+        values = red.mget([key.format(_id) for _id in ids])
+        return {_id: value.decode() for _id, value in zip(ids, values) if value is not None}
+
+    @classmethod
+    def _set_values(cls, key, values):
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        for _id, value in values.items():
+            pipe.set(key.format(_id), value, ex=cls.TTL)
+        pipe.execute()
+
+    @classmethod
+    def get_projects_owners(cls, project_ids):
+        return {project_id: int(owner_id) for project_id, owner_id in
+                cls._get_values(cls.KEY_PROJECT_OWNER, project_ids).items()}
+
+    @classmethod
+    def set_projects_owners(cls, projects_owners):
+        cls._set_values(cls.KEY_PROJECT_OWNER, projects_owners)
+
+    @classmethod
+    def get_users_emails(cls, user_ids):
+        return cls._get_values(cls.KEY_USER_EMAIL, user_ids)
+
+    @classmethod
+    def set_users_emails(cls, users_emails):
+        cls._set_values(cls.KEY_USER_EMAIL, users_emails)
+
+    @classmethod
+    def clear_project(cls, project_id):
+        red = cls._get_redis()
+        red.delete(cls.KEY_PROJECT_OWNER.format(project_id))
+
+    @classmethod
+    def clear_user(cls, user_id):
+        red = cls._get_redis()
+        red.delete(cls.KEY_USER_EMAIL.format(user_id))
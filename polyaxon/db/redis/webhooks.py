@@ -0,0 +1,35 @@
+import json
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisWebHookDeadLetters(BaseRedisDb):
+    """
+    RedisWebHookDeadLetters keeps the last web hook deliveries that failed after all retries.
+
+    The dead letters are kept in a capped redis list, the most recent first.
+    """
+    KEY_DEAD_LETTERS = 'webhooks:dead_letters'
+    MAX_SIZE = 1000
+
+    REDIS_POOL = RedisPools.WEBHOOKS
+
+    @classmethod
+    def add(cls, letter):
+        red = cls._get_redis()
+        pipe = red.pipeline()
+        pipe.lpush(cls.KEY_DEAD_LETTERS, json.dumps(letter))
+        pipe.ltrim(cls.KEY_DEAD_LETTERS, 0, cls.MAX_SIZE - 1)
+        pipe.execute()
+
+    @classmethod
+    def get_letters(cls, limit=None):
+        red = cls._get_redis()
+        letters = red.lrange(cls.KEY_DEAD_LETTERS, 0, (limit or cls.MAX_SIZE) - 1)
+        return [json.loads(letter.decode()) for letter in letters]
+
+    @classmethod
+    def clear(cls):
+        red = cls._get_redis()
+        red.delete(cls.KEY_DEAD_LETTERS)
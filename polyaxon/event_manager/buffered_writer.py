@@ -0,0 +1,76 @@
+import atexit
+import logging
+import os
+import threading
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import close_old_connections
+
+import stats
+
+_logger = logging.getLogger('polyaxon.event_manager')
+
+
+def get_content_type_id(instance):
+    """Return the content type id of an instance's model, from the content types cache.
+
+    Setting the `content_type_id` and the `object_id` of the generic foreign keys directly
+    skips the descriptor of the `content_object`.
+    """
+    return ContentType.objects.get_for_model(instance).id
+
+
+class BufferedWriter(object):
+    """Accumulates rows and writes them at once.
+
+    The rows are written by `write` when `size` rows are buffered,
+    or at the latest `window` seconds after they were added, by a flusher thread,
+    and the buffered rows are written when the process exits.
+    """
+
+    def __init__(self, write, size, window):
+        self.write = write
+        self.size = size
+        self.window = window
+        self._rows = []
+        self._lock = threading.Lock()
+        self._pid = None
+        atexit.register(self.flush)
+
+    def start_flusher(self):
+        # The flusher is started by the first row of every process, e.g. after a fork
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._rows = []
+        threading.Thread(target=self.flush_periodically,
+                         name='buffered-writer-flusher',
+                         daemon=True).start()
+
+    def add(self, row):
+        with self._lock:
+            self.start_flusher()
+            self._rows.append(row)
+            is_full = len(self._rows) >= self.size
+        if is_full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return
+        try:
+            self.write(rows)
+        except Exception as e:
+            _logger.warning('Failed to write %s rows: %s', len(rows), e, exc_info=True)
+
+    def flush_periodically(self):
+        while True:
+            time.sleep(self.window)
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+                stats.flush()
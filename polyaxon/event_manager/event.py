@@ -1,5 +1,3 @@
-import copy
-
 from uuid import uuid1
 
 from django.utils import timezone
@@ -28,6 +26,45 @@ class Attribute(object):
             return value.hex
         return self.attr_type(value)
 
+    def get_extractor(self):
+        """Return a function extracting the non None values of the attribute."""
+        if self.is_datetime:
+            return to_timestamp
+        if self.is_uuid:
+            return lambda value: value if isinstance(value, str) else value.hex
+        return self.attr_type
+
+
+def get_instance_getter(attr):
+    """Return a function getting the value of a dotted attribute path from an instance."""
+    path = tuple(attr.split('.'))
+    if len(path) == 1:
+        name = path[0]
+        return lambda instance: getattr(instance, name, None)
+
+    def getter(instance):
+        value = instance
+        for name in path:
+            value = getattr(value, name, None)
+            if value is None:
+                break
+        return value
+
+    return getter
+
+
+class CompiledAttribute(object):
+    __slots__ = ['name', 'kwarg', 'extract', 'get_value', 'is_required']
+
+    def __init__(self, attribute):
+        self.name = attribute.name
+        # Dotted attributes can be passed as keyword arguments with underscores
+        kwarg = attribute.name.replace('.', '_')
+        self.kwarg = kwarg if kwarg != attribute.name else None
+        self.extract = attribute.get_extractor()
+        self.get_value = get_instance_getter(attribute.name)
+        self.is_required = attribute.is_required
+
 
 class Event(object):
     __slots__ = ['uuid', 'data', 'datetime', 'instance']
@@ -45,6 +82,23 @@ class Event(object):
                                      Attribute(cls.actor_name, is_required=False))
         return cls.attributes
 
+    @classmethod
+    def compile(cls):
+        """Compile the event's attributes to their getters and extractors.
+
+        Events are compiled when subscribed, or else when first created.
+        """
+        cls._compiled_attributes = tuple(
+            CompiledAttribute(attr) for attr in cls.get_event_attributes())
+        return cls._compiled_attributes
+
+    @classmethod
+    def get_compiled_attributes(cls):
+        # Subclasses would otherwise use the compiled attributes of their parent
+        if '_compiled_attributes' not in cls.__dict__:
+            return cls.compile()
+        return cls._compiled_attributes
+
     def __init__(self, datetime=None, instance=None, **items):
         self.uuid = uuid1()
         self.datetime = datetime or timezone.now()
@@ -54,18 +108,21 @@ class Event(object):
             raise ValueError('Event is missing a type')
 
         data = {}
-        for attr in self.get_event_attributes():
+        for attr in self.get_compiled_attributes():
             # Check plain attr name
             item_value = items.pop(attr.name, None)
-            if item_value is None:
+            if item_value is None and attr.kwarg:
                 # Convert dot notation
-                item_value = items.pop(attr.name.replace('.', '_'), None)
+                item_value = items.pop(attr.kwarg, None)
 
-            if attr.is_required and item_value is None:
-                raise ValueError('{} is required (cannot be None)'.format(
-                    attr.name,
-                ))
-            data[attr.name] = attr.extract(item_value)
+            if item_value is None:
+                if attr.is_required:
+                    raise ValueError('{} is required (cannot be None)'.format(
+                        attr.name,
+                    ))
+                data[attr.name] = None
+            else:
+                data[attr.name] = attr.extract(item_value)
 
         actor_id = data.get(self.actor_id)
         actor_name = data.get(self.actor_name)
@@ -114,8 +171,8 @@ class Event(object):
     def serialize(self, dumps=False, include_actor_name=True):
         _data = self.data
         if not include_actor_name and self.actor and self.actor_name in _data:
-            _data = copy.deepcopy(self.data)
-            _data.pop(self.actor_name)
+            # The values are extracted scalars, they don't need to be copied
+            _data = {key: value for key, value in _data.items() if key != self.actor_name}
         data = {
             'uuid': self.uuid.hex,
             'timestamp': to_timestamp(self.datetime),
@@ -139,10 +196,10 @@ class Event(object):
     @classmethod
     def from_instance(cls, instance, **kwargs):
         values = {'instance': instance}
-        for attr in cls.get_event_attributes():
+        for attr in cls.get_compiled_attributes():
             # Convert dot notation
-            value = kwargs.get(attr.name.replace('.', '_'))
+            value = kwargs.get(attr.kwarg or attr.name)
             if value is None:
-                value = cls.get_value_from_instance(attr=attr.name, instance=instance)
+                value = attr.get_value(instance)
             values[attr.name] = value
         return cls(**values)
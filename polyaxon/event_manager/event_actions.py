@@ -50,3 +50,17 @@ WRITE_ACTIONS = [
     CLONED,
     STOPPED,
 ]
+
+VIEW_ACTIONS = [
+    VIEWED,
+    RESOURCES_VIEWED,
+    LOGS_VIEWED,
+    STATUSES_VIEWED,
+    JOBS_VIEWED,
+    BUILDS_VIEWED,
+    TENSORBOARDS_VIEWED,
+    METRICS_VIEWED,
+    EXPERIMENTS_VIEWED,
+    EXPERIMENT_GROUPS_VIEWED,
+    PROJECTS_VIEWED,
+]
@@ -11,6 +11,7 @@ class EventManager(ManagerInterface):
         """
         >>> subscribe(SomeEvent)
         """
+        event.compile()
         super().subscribe(obj=event)
 
     def knows(self, event_type):  # pylint:disable=arguments-differ
@@ -1,3 +1,5 @@
+import stats
+
 from libs.services import Service
 
 
@@ -5,6 +7,8 @@ class EventService(Service):
     __all__ = ('record', 'setup')
 
     event_manager = None
+    # The prefix of the service's stats
+    stats_key = 'events'
 
     def can_handle(self, event_type):
         return isinstance(event_type, str) and self.event_manager.knows(event_type)
@@ -24,8 +28,11 @@ class EventService(Service):
         if not self.can_handle(event_type=event_type):
             return
 
-        event = self.get_event(event_type=event_type, instance=instance, **kwargs)
-        self.record_event(event)
+        stats.incr('{}.events.{}'.format(self.stats_key, event_type))
+        with stats.timer('{}.record'.format(self.stats_key),
+                         tags=['event_type:{}'.format(event_type)]):
+            event = self.get_event(event_type=event_type, instance=instance, **kwargs)
+            self.record_event(event)
 
     def record_event(self, event):
         """ Record an event.
@@ -33,3 +40,11 @@ class EventService(Service):
         >>> record_event(Event())
         """
         pass
+
+    def record_events(self, events):
+        """ Record several events at once, services writing to a db should batch them.
+
+        >>> record_events([Event(), Event()])
+        """
+        for event in events:
+            self.record_event(event)
@@ -28,6 +28,7 @@ EXPERIMENT_GROUP_RANDOM = '{}.random'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_GRID = '{}.grid'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_HYPERBAND = '{}.hyperband'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_BO = '{}.bo'.format(event_subjects.EXPERIMENT_GROUP)
+EXPERIMENT_GROUP_TPE = '{}.tpe'.format(event_subjects.EXPERIMENT_GROUP)
 EXPERIMENT_GROUP_STATUSES_VIEWED = '{}.{}'.format(event_subjects.EXPERIMENT_GROUP,
                                                   event_actions.STATUSES_VIEWED)
 EXPERIMENT_GROUP_METRICS_VIEWED = '{}.{}'.format(event_subjects.EXPERIMENT_GROUP,
@@ -256,6 +257,10 @@ class ExperimentGroupBOEvent(Event):
     event_type = EXPERIMENT_GROUP_BO
 
 
+class ExperimentGroupTPEEvent(Event):
+    event_type = EXPERIMENT_GROUP_TPE
+
+
 class ExperimentGroupDeletedTriggeredEvent(Event):
     event_type = EXPERIMENT_GROUP_DELETED_TRIGGERED
     actor = True
@@ -102,6 +102,33 @@ experiment_group_spec_content_early_stopping = """---
       cmd: video_prediction_train --model=DNA --num_masks=1
 """
 
+experiment_group_spec_content_metric_early_stopping = """---
+    version: 1
+
+    kind: group
+
+    tags: [fixtures]
+
+    hptuning:
+      concurrency: 2
+      random_search:
+        n_experiments: 4
+      metric_early_stopping:
+        policy: median
+        metric: loss
+        optimization: minimize
+        min_steps: 2
+      matrix:
+        lr:
+          values: [0.01, 0.1, 0.5]
+
+    build:
+      image: my_image
+
+    run:
+      cmd: video_prediction_train --model=DNA --num_masks=1
+"""
+
 experiment_group_spec_content_hyperband = """---
     version: 1
 
@@ -0,0 +1,159 @@
+import logging
+import numpy as np
+
+from db.redis.group_early_stopping import RedisGroupEarlyStopping
+from hpsearch.schemas.early_stopping import MetricEarlyStoppingPolicies
+from schemas.hptuning import Optimization
+
+_logger = logging.getLogger('polyaxon.hpsearch.early_stopping')
+
+
+class BaseMetricEarlyStoppingPolicy(object):
+    """Compares the metric curve of an experiment with its peers at the same step.
+
+    The step of a metric is the number of times the metric was reported by the experiment.
+    The running mean and best value of every experiment are kept in redis,
+    and stored for every evaluated step, when a metric is reported,
+    an evaluation only reads the peers' values at the evaluated step.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.maximize = Optimization.maximize(config.optimization)
+
+    def get_best_value(self, values):
+        return max(values) if self.maximize else min(values)
+
+    def is_worse(self, value, reference):
+        return value < reference if self.maximize else value > reference
+
+    def should_evaluate(self, step):
+        if step < self.config.min_steps:
+            return False
+        return (step - self.config.min_steps) % self.config.evaluation_interval == 0
+
+    def get_peer_value(self, values):
+        raise NotImplementedError
+
+    def get_peer_aggregate_value(self, mean, best):
+        """Return the peer value from the running mean and best value of a peer."""
+        raise NotImplementedError
+
+    def get_reference_value(self, peers_values):
+        raise NotImplementedError
+
+    def should_stop_at_step(self, step, best_value, peers_values):
+        if not step or not self.should_evaluate(step):
+            return False
+        if not peers_values or len(peers_values) < self.config.min_peers:
+            return False
+
+        reference = self.get_reference_value(np.asarray(peers_values, dtype=float))
+        return self.is_worse(best_value, reference)
+
+    def should_stop(self, history, peers_histories):
+        """Return a boolean to indicate if the experiment's metric history
+        is worse than its peers at its current step.
+
+        Params:
+            history: `list` of metric values reported by the experiment.
+            peers_histories: `list` of lists of metric values reported by the peers.
+        """
+        step = len(history)
+        peers_values = [self.get_peer_value(values[:step])
+                        for values in peers_histories if len(values) >= step]
+        return self.should_stop_at_step(step=step,
+                                        best_value=self.get_best_value(history) if step else None,
+                                        peers_values=peers_values)
+
+    def update_aggregates(self, aggregates, values):
+        """Return the aggregates after the new values and the values of the evaluated steps."""
+        step, total, best = aggregates or (0, 0., None)
+        steps_values = {}
+        for value in values:
+            step += 1
+            total += value
+            best = value if best is None else self.get_best_value([best, value])
+            if self.should_evaluate(step):
+                steps_values[step] = [total / step, best]
+        return [step, total, best], steps_values
+
+    def add_metrics(self, experiment_group_id, experiment_id, metrics):
+        """Add the values, in chronological order, of an experiment's new metrics.
+
+        Returns:
+            list: the new steps of the experiment to evaluate.
+        """
+        values = [metric[self.config.metric] for metric in metrics
+                  if isinstance(metric.get(self.config.metric), (int, float)) and
+                  not isinstance(metric[self.config.metric], bool)]
+        if not values:
+            return []
+        steps_values = RedisGroupEarlyStopping.update_experiment(
+            experiment_group_id=experiment_group_id,
+            experiment_id=experiment_id,
+            update=lambda aggregates: self.update_aggregates(aggregates, values))
+        return sorted(steps_values)
+
+    def should_stop_experiment(self, experiment_group_id, experiment_id, step=None):
+        """Compare the experiment with its peers at the step, by default its last step."""
+        if step is None:
+            aggregates = RedisGroupEarlyStopping.get_experiment_aggregates(
+                experiment_group_id=experiment_group_id, experiment_id=experiment_id)
+            if not aggregates:
+                return False
+            step = aggregates[0]
+        steps_values = RedisGroupEarlyStopping.get_step_values(
+            experiment_group_id=experiment_group_id, step=step)
+        values = steps_values.pop(experiment_id, None)
+        if not values:
+            return False
+        peers_values = [self.get_peer_aggregate_value(mean=mean, best=best)
+                        for mean, best in steps_values.values()]
+        return self.should_stop_at_step(step=step, best_value=values[1], peers_values=peers_values)
+
+
+class MedianStoppingPolicy(BaseMetricEarlyStoppingPolicy):
+    """Stops an experiment if its best value so far is worse than
+    the median of its peers' running averages at the same step.
+    """
+
+    def get_peer_value(self, values):
+        return np.mean(values)
+
+    def get_peer_aggregate_value(self, mean, best):
+        return mean
+
+    def get_reference_value(self, peers_values):
+        return np.median(peers_values)
+
+
+class TruncationStoppingPolicy(BaseMetricEarlyStoppingPolicy):
+    """Stops an experiment if its best value so far is in the worst percentile
+    of its peers' best values at the same step.
+    """
+
+    def get_peer_value(self, values):
+        return self.get_best_value(values)
+
+    def get_peer_aggregate_value(self, mean, best):
+        return best
+
+    def get_reference_value(self, peers_values):
+        percentile = self.config.percentile
+        if not self.maximize:
+            percentile = 100 - percentile
+        return np.percentile(peers_values, percentile)
+
+
+def get_metric_early_stopping_policy(config):
+    if not config:
+        return None
+
+    if MetricEarlyStoppingPolicies.is_median(config.policy):
+        return MedianStoppingPolicy(config=config)
+    if MetricEarlyStoppingPolicies.is_truncation(config.policy):
+        return TruncationStoppingPolicy(config=config)
+
+    _logger.warning('Received an unknown metric early stopping policy `%s`.', config.policy)
+    return None
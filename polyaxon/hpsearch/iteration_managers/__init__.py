@@ -1,5 +1,6 @@
 from hpsearch.iteration_managers.bayesian_optimization import BOIterationManager
 from hpsearch.iteration_managers.hyperband import HyperbandIterationManager
+from hpsearch.iteration_managers.tpe import TPEIterationManager
 from schemas.hptuning import SearchAlgorithms
 
 
@@ -8,5 +9,7 @@ def get_search_iteration_manager(experiment_group):
         return HyperbandIterationManager(experiment_group=experiment_group)
     if SearchAlgorithms.is_bo(experiment_group.search_algorithm):
         return BOIterationManager(experiment_group=experiment_group)
+    if SearchAlgorithms.is_tpe(experiment_group.search_algorithm):
+        return TPEIterationManager(experiment_group=experiment_group)
 
     return None
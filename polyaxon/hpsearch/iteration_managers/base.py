@@ -19,6 +19,23 @@ class BaseIterationManger(object):
             return None
         return iteration_config
 
+    def get_warm_start_observations(self, iteration_config):
+        """The warm start observations are queried for the first iteration,
+        the next iterations carry them over.
+        """
+        if iteration_config is not None:
+            return iteration_config.warm_start_observations
+        if not self.experiment_group.warm_start:
+            return None
+        return self.experiment_group.search_manager.warm_start_observations
+
+    def _create_iteration(self, iteration_config):
+        from db.models.experiment_groups import ExperimentGroupIteration
+
+        return ExperimentGroupIteration.objects.create(
+            experiment_group=self.experiment_group,
+            data=iteration_config.to_dict())
+
     def _update_config(self, iteration_config):
         iteration = self.experiment_group.iteration
         iteration.data = iteration_config.to_dict()
@@ -8,9 +8,8 @@ class BOIterationManager(BaseIterationManger):
 
     def create_iteration(self, experiment_ids, experiments_configs):
         """Create an iteration for the experiment group."""
-        from db.models.experiment_groups import ExperimentGroupIteration
-
         iteration_config = self.experiment_group.iteration_config
+        warm_start_observations = self.get_warm_start_observations(iteration_config)
 
         if iteration_config is None:
             iteration = 0
@@ -31,7 +30,6 @@ class BOIterationManager(BaseIterationManger):
             old_experiments_metrics=old_experiments_metrics,
             experiment_ids=experiment_ids,
             experiments_configs=experiments_configs,
+            warm_start_observations=warm_start_observations,
         )
-        return ExperimentGroupIteration.objects.create(
-            experiment_group=self.experiment_group,
-            data=iteration_config.to_dict())
+        return self._create_iteration(iteration_config)
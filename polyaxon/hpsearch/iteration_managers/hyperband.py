@@ -13,10 +13,9 @@ class HyperbandIterationManager(BaseIterationManger):
 
     def create_iteration(self, experiment_ids=None):
         """Create an iteration for the experiment group."""
-        from db.models.experiment_groups import ExperimentGroupIteration
-
         search_manager = self.experiment_group.search_manager
         iteration_config = self.experiment_group.iteration_config
+        warm_start_observations = self.get_warm_start_observations(iteration_config)
 
         if iteration_config is None:
             iteration = 0
@@ -42,12 +41,11 @@ class HyperbandIterationManager(BaseIterationManger):
         # Create a new iteration config
         iteration_config = HyperbandIterationConfig(
             iteration=iteration,
-            bracket_iteration=bracket_iteration)
+            bracket_iteration=bracket_iteration,
+            warm_start_observations=warm_start_observations)
         if experiment_ids:
             iteration_config.experiment_ids = experiment_ids
-        return ExperimentGroupIteration.objects.create(
-            experiment_group=self.experiment_group,
-            data=iteration_config.to_dict())
+        return self._create_iteration(iteration_config)
 
     def get_reduced_configs(self):
         """Reduce the experiments to restart."""
@@ -0,0 +1,8 @@
+from hpsearch.iteration_managers.bayesian_optimization import BOIterationManager
+
+
+class TPEIterationManager(BOIterationManager):
+    """TPE iterations have the same structure as the bayesian optimization iterations."""
+
+    def get_metric_name(self):
+        return self.experiment_group.hptuning_config.tpe.metric.name
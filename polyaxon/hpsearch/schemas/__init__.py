@@ -1,6 +1,15 @@
 from hpsearch.schemas.bayesian_optimization import BOIterationConfig
+from hpsearch.schemas.early_stopping import MetricEarlyStoppingConfig
 from hpsearch.schemas.hyperband import HyperbandIterationConfig
-from schemas.hptuning import SearchAlgorithms
+from hpsearch.schemas.warm_start import WarmStartConfig
+from schemas.hptuning import SearchAlgorithms, TPEConfig
+
+# Hptuning sections handled by hpsearch and not by the polyaxonfile's hptuning schema
+HPTUNING_EXTENSIONS = {
+    MetricEarlyStoppingConfig.IDENTIFIER: MetricEarlyStoppingConfig,
+    WarmStartConfig.IDENTIFIER: WarmStartConfig,
+    TPEConfig.IDENTIFIER: TPEConfig,
+}
 
 
 def get_iteration_config(search_algorithm, iteration=None):
@@ -8,8 +17,46 @@ def get_iteration_config(search_algorithm, iteration=None):
         if not iteration:
             raise ValueError('No iteration was provided')
         return HyperbandIterationConfig.from_dict(iteration)
-    if SearchAlgorithms.is_bo(search_algorithm):
+    if SearchAlgorithms.is_bo(search_algorithm) or SearchAlgorithms.is_tpe(search_algorithm):
         if not iteration:
             raise ValueError('No iteration was provided')
         return BOIterationConfig.from_dict(iteration)
     return None
+
+
+def get_hptuning_extensions(hptuning):
+    """Return the hpsearch specific sections defined in an hptuning dict."""
+    if not hptuning:
+        return {}
+    return {key: hptuning[key] for key in HPTUNING_EXTENSIONS if hptuning.get(key)}
+
+
+def get_specification_hptuning(specification):
+    """Return the hptuning dict of a group specification, with the hpsearch specific sections."""
+    hptuning = specification.hptuning.to_dict()
+    # Keep the hpsearch specific sections ignored by the hptuning schema
+    hptuning.update(get_hptuning_extensions(specification.data.get(specification.HP_TUNING)))
+    return hptuning
+
+
+def validate_hptuning_extensions(hptuning):
+    """Validates the hpsearch specific sections, raises a marshmallow `ValidationError`."""
+    for key, value in get_hptuning_extensions(hptuning).items():
+        HPTUNING_EXTENSIONS[key].from_dict(value)
+
+
+def get_hptuning_extension_config(hptuning, identifier):
+    extensions = get_hptuning_extensions(hptuning)
+    if identifier not in extensions:
+        return None
+    return HPTUNING_EXTENSIONS[identifier].from_dict(extensions[identifier])
+
+
+def get_metric_early_stopping_config(hptuning):
+    return get_hptuning_extension_config(hptuning=hptuning,
+                                         identifier=MetricEarlyStoppingConfig.IDENTIFIER)
+
+
+def get_warm_start_config(hptuning):
+    return get_hptuning_extension_config(hptuning=hptuning,
+                                         identifier=WarmStartConfig.IDENTIFIER)
@@ -19,6 +19,9 @@ class BOIterationSchema(Schema):
     experiments_metrics = fields.List(
         fields.List(fields.Raw(), validate=validate.Length(equal=2)),
         allow_none=True)
+    warm_start_observations = fields.List(
+        fields.List(fields.Raw(), validate=validate.Length(equal=2)),
+        allow_none=True)
 
     class Meta:
         ordered = True
@@ -34,6 +37,7 @@ class BOIterationSchema(Schema):
 
 class BOIterationConfig(BaseConfig):
     SCHEMA = BOIterationSchema
+    REDUCED_ATTRIBUTES = ['warm_start_observations']
 
     def __init__(self,
                  iteration,
@@ -42,7 +46,8 @@ class BOIterationConfig(BaseConfig):
                  old_experiments_configs=None,
                  experiment_ids=None,
                  experiments_metrics=None,
-                 experiments_configs=None):
+                 experiments_configs=None,
+                 warm_start_observations=None):
         self.iteration = iteration
         self.old_experiment_ids = old_experiment_ids
         self.old_experiments_metrics = old_experiments_metrics
@@ -50,6 +55,7 @@ class BOIterationConfig(BaseConfig):
         self.experiment_ids = experiment_ids
         self.experiments_configs = experiments_configs
         self.experiments_metrics = experiments_metrics
+        self.warm_start_observations = warm_start_observations
 
     @property
     def combined_experiment_ids(self):
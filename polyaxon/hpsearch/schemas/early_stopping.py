@@ -0,0 +1,80 @@
+from marshmallow import Schema, fields, post_dump, post_load, validate
+
+from schemas.base import BaseConfig
+from schemas.hptuning import Optimization
+
+
+class MetricEarlyStoppingPolicies(object):
+    MEDIAN = 'median'
+    TRUNCATION = 'truncation'
+
+    MEDIAN_VALUES = [MEDIAN, MEDIAN.upper(), MEDIAN.capitalize()]
+    TRUNCATION_VALUES = [TRUNCATION, TRUNCATION.upper(), TRUNCATION.capitalize()]
+
+    VALUES = MEDIAN_VALUES + TRUNCATION_VALUES
+
+    @classmethod
+    def is_median(cls, value):
+        return value in cls.MEDIAN_VALUES
+
+    @classmethod
+    def is_truncation(cls, value):
+        return value in cls.TRUNCATION_VALUES
+
+
+class MetricEarlyStoppingSchema(Schema):
+    policy = fields.Str(validate=validate.OneOf(MetricEarlyStoppingPolicies.VALUES))
+    metric = fields.Str()
+    optimization = fields.Str(allow_none=True, validate=validate.OneOf(Optimization.VALUES))
+    min_steps = fields.Int(allow_none=True, validate=validate.Range(min=1))
+    evaluation_interval = fields.Int(allow_none=True, validate=validate.Range(min=1))
+    min_peers = fields.Int(allow_none=True, validate=validate.Range(min=1))
+    percentile = fields.Float(allow_none=True, validate=validate.Range(min=0, max=100))
+
+    class Meta:
+        ordered = True
+
+    @post_load
+    def make(self, data):
+        return MetricEarlyStoppingConfig(**data)
+
+    @post_dump
+    def unmake(self, data):
+        return MetricEarlyStoppingConfig.remove_reduced_attrs(data)
+
+
+class MetricEarlyStoppingConfig(BaseConfig):
+    """
+    Metric curve based early stopping config.
+
+    Args:
+        policy: `str`. The policy to use to compare a running experiment with its peers.
+            * median: stops an experiment if its best value so far is worse than
+                the median of the running averages of its peers at the same step.
+            * truncation: stops an experiment if its best value so far is
+                in the worst `percentile` of its peers' best values at the same step.
+        metric: `str`. The metric to use for early stopping.
+        optimization: `string`. The optimization to do: maximize or minimize.
+        min_steps: `int`. The number of reported steps before an experiment can be stopped.
+        evaluation_interval: `int`. Evaluate the experiment every n steps after `min_steps`.
+        min_peers: `int`. The minimum number of peers that reached the same step.
+        percentile: `float`. The percentile used by the truncation policy.
+    """
+    SCHEMA = MetricEarlyStoppingSchema
+    IDENTIFIER = 'metric_early_stopping'
+
+    def __init__(self,
+                 policy,
+                 metric,
+                 optimization=Optimization.MAXIMIZE,
+                 min_steps=1,
+                 evaluation_interval=1,
+                 min_peers=1,
+                 percentile=25.):
+        self.policy = policy
+        self.metric = metric
+        self.optimization = optimization
+        self.min_steps = min_steps
+        self.evaluation_interval = evaluation_interval
+        self.min_peers = min_peers
+        self.percentile = percentile
@@ -9,6 +9,9 @@ class HyperbandIterationSchema(Schema):
     experiment_ids = fields.List(fields.Int(), allow_none=True)
     experiments_metrics = fields.List(fields.List(fields.Raw(), validate=validate.Length(equal=2)),
                                       allow_none=True)
+    warm_start_observations = fields.List(
+        fields.List(fields.Raw(), validate=validate.Length(equal=2)),
+        allow_none=True)
 
     class Meta:
         ordered = True
@@ -24,9 +27,16 @@ class HyperbandIterationSchema(Schema):
 
 class HyperbandIterationConfig(BaseConfig):
     SCHEMA = HyperbandIterationSchema
-
-    def __init__(self, iteration, bracket_iteration, experiment_ids=None, experiments_metrics=None):
+    REDUCED_ATTRIBUTES = ['warm_start_observations']
+
+    def __init__(self,
+                 iteration,
+                 bracket_iteration,
+                 experiment_ids=None,
+                 experiments_metrics=None,
+                 warm_start_observations=None):
         self.iteration = iteration
         self.bracket_iteration = bracket_iteration
         self.experiment_ids = experiment_ids
         self.experiments_metrics = experiments_metrics
+        self.warm_start_observations = warm_start_observations
@@ -0,0 +1,55 @@
+from marshmallow import (
+    Schema,
+    ValidationError,
+    fields,
+    post_dump,
+    post_load,
+    validate,
+    validates_schema
+)
+
+from schemas.base import BaseConfig
+
+
+class WarmStartSchema(Schema):
+    experiment_groups = fields.List(fields.Int(), allow_none=True)
+    query = fields.Str(allow_none=True)
+    n_experiments = fields.Int(allow_none=True, validate=validate.Range(min=1))
+
+    class Meta:
+        ordered = True
+
+    @post_load
+    def make(self, data):
+        return WarmStartConfig(**data)
+
+    @post_dump
+    def unmake(self, data):
+        return WarmStartConfig.remove_reduced_attrs(data)
+
+    @validates_schema
+    def validate_source(self, data):
+        if not data.get('experiment_groups') and not data.get('query'):
+            raise ValidationError('Warm start requires `experiment_groups` or a `query`.')
+
+
+class WarmStartConfig(BaseConfig):
+    """
+    Warm start config, seeds the search with the results of previous experiments.
+
+    Only the experiments of the same project, having all the keys of the current matrix
+    in their declarations and reporting the search metric are used.
+
+    Args:
+        experiment_groups: `list`. The ids of previous experiment groups.
+        query: `str`. A query to select the previous experiments, e.g. `metric.loss:<0.5`.
+        n_experiments: `int`. The maximum number of most recent experiments to use.
+    """
+    SCHEMA = WarmStartSchema
+    IDENTIFIER = 'warm_start'
+    REDUCED_ATTRIBUTES = ['experiment_groups', 'query']
+
+    def __init__(self, experiment_groups=None, query=None, n_experiments=500):
+        self.experiment_groups = experiment_groups
+        self.query = query
+        self.n_experiments = n_experiments
@@ -2,10 +2,11 @@ from hpsearch.search_managers.bayesian_optimization.manager import BOSearchManag
 from hpsearch.search_managers.grid import GridSearchManager
 from hpsearch.search_managers.hyperband import HyperbandSearchManager
 from hpsearch.search_managers.random import RandomSearchManager
+from hpsearch.search_managers.tpe.manager import TPESearchManager
 from schemas.hptuning import SearchAlgorithms
 
 
-def get_search_algorithm_manager(hptuning_config):
+def get_search_algorithm_manager(hptuning_config, warm_start_observations=None):
     if not hptuning_config:
         return None
 
@@ -14,8 +15,13 @@ def get_search_algorithm_manager(hptuning_config):
     if SearchAlgorithms.is_random(hptuning_config.search_algorithm):
         return RandomSearchManager(hptuning_config=hptuning_config)
     if SearchAlgorithms.is_hyperband(hptuning_config.search_algorithm):
-        return HyperbandSearchManager(hptuning_config=hptuning_config)
+        return HyperbandSearchManager(hptuning_config=hptuning_config,
+                                      warm_start_observations=warm_start_observations)
     if SearchAlgorithms.is_bo(hptuning_config.search_algorithm):
-        return BOSearchManager(hptuning_config=hptuning_config)
+        return BOSearchManager(hptuning_config=hptuning_config,
+                               warm_start_observations=warm_start_observations)
+    if SearchAlgorithms.is_tpe(hptuning_config.search_algorithm):
+        return TPESearchManager(hptuning_config=hptuning_config,
+                                warm_start_observations=warm_start_observations)
 
     return None
@@ -5,28 +5,40 @@ from schemas.hptuning import SearchAlgorithms
 
 
 class BOSearchManager(BaseSearchAlgorithmManager):
-    """Bayesian optimization algorithm manager for hyperparameter optimization."""
+    """Bayesian optimization algorithm manager for hyperparameter optimization.
+
+    Warm start observations, i.e. [declarations, metric] of previous experiments,
+    are added to the observed points and replace part of the random initial trials.
+    """
 
     NAME = SearchAlgorithms.BO
 
-    def __init__(self, hptuning_config):
+    def __init__(self, hptuning_config, warm_start_observations=None):
         super().__init__(hptuning_config=hptuning_config)
         self.n_initial_trials = self.hptuning_config.bo.n_initial_trials
         self.n_iterations = self.hptuning_config.bo.n_iterations
+        self.warm_start_observations = warm_start_observations or []
 
     def get_suggestions(self, iteration_config=None):
+        configs = [observation[0] for observation in self.warm_start_observations]
+        metrics = [observation[1] for observation in self.warm_start_observations]
         if not iteration_config:
-            return get_random_suggestions(matrix=self.hptuning_config.matrix,
-                                          n_suggestions=self.n_initial_trials,
-                                          seed=self.hptuning_config.seed)
+            n_suggestions = self.n_initial_trials - len(configs)
+            if n_suggestions > 0:
+                return get_random_suggestions(matrix=self.hptuning_config.matrix,
+                                              n_suggestions=n_suggestions,
+                                              seed=self.hptuning_config.seed)
+            return self._get_suggestions(configs=configs, metrics=metrics)
+
         # Use the iteration_config to construct observed point and metrics
         experiments_configs = dict(iteration_config.combined_experiments_configs)
         experiments_metrics = dict(iteration_config.combined_experiments_metrics)
-        configs = []
-        metrics = []
         for key in experiments_metrics.keys():
             configs.append(experiments_configs[key])
             metrics.append(experiments_metrics[key])
+        return self._get_suggestions(configs=configs, metrics=metrics)
+
+    def _get_suggestions(self, configs, metrics):
         optimizer = BOOptimizer(hptuning_config=self.hptuning_config)
         optimizer.add_observations(configs=configs, metrics=metrics)
         suggestion = optimizer.get_suggestion()
@@ -3,7 +3,7 @@ import math
 from hpsearch.schemas import HyperbandIterationConfig
 from hpsearch.search_managers.base import BaseSearchAlgorithmManager
 from hpsearch.search_managers.utils import get_random_suggestions
-from schemas.hptuning import SearchAlgorithms
+from schemas.hptuning import Optimization, SearchAlgorithms
 
 
 class HyperbandSearchManager(BaseSearchAlgorithmManager):
@@ -48,8 +48,10 @@ class HyperbandSearchManager(BaseSearchAlgorithmManager):
 
     NAME = SearchAlgorithms.HYPERBAND
 
-    def __init__(self, hptuning_config):
+    def __init__(self, hptuning_config, warm_start_observations=None):
         super().__init__(hptuning_config=hptuning_config)
+        # [declarations, metric] of previous experiments
+        self.warm_start_observations = warm_start_observations or []
         # Maximum iterations per configuration
         self.max_iter = self.hptuning_config.hyperband.max_iter
         # Defines configuration downsampling/elimination rate (default = 3)
@@ -112,6 +114,24 @@ class HyperbandSearchManager(BaseSearchAlgorithmManager):
         n_resources = self.get_resources(bracket=bracket)
         return self.get_n_resources(n_resources=n_resources, bracket_iteration=bracket_iteration)
 
+    def get_warm_start_suggestions(self, n_configs, suggestion_params):
+        """Return the best configs of the warm start observations.
+
+        At most the number of configs kept after the first reduction of a bracket is used,
+        so that the previous best configs compete with new random configs.
+        """
+        if not self.warm_start_observations:
+            return []
+        reverse = Optimization.maximize(self.hptuning_config.hyperband.metric.optimization)
+        observations = sorted(self.warm_start_observations, key=lambda x: x[1], reverse=reverse)
+        n_warm_start = self.get_n_config_to_keep(n_suggestions=n_configs, bracket_iteration=0)
+        suggestions = []
+        for declarations, _ in observations[:n_warm_start]:
+            suggestion = dict(declarations)
+            suggestion.update(suggestion_params)
+            suggestions.append(suggestion)
+        return suggestions
+
     def get_suggestions(self, iteration_config=None):
         """Return a list of suggestions/arms based on hyperband."""
         if not iteration_config or not isinstance(iteration_config, HyperbandIterationConfig):
@@ -125,10 +145,15 @@ class HyperbandSearchManager(BaseSearchAlgorithmManager):
         suggestion_params = {
             self.hptuning_config.hyperband.resource.name: n_resources
         }
-        return get_random_suggestions(matrix=self.hptuning_config.matrix,
-                                      n_suggestions=n_configs,
-                                      suggestion_params=suggestion_params,
-                                      seed=self.hptuning_config.seed)
+        suggestions = self.get_warm_start_suggestions(n_configs=n_configs,
+                                                      suggestion_params=suggestion_params)
+        n_suggestions = n_configs - len(suggestions)
+        if n_suggestions > 0:
+            suggestions += get_random_suggestions(matrix=self.hptuning_config.matrix,
+                                                  n_suggestions=n_suggestions,
+                                                  suggestion_params=suggestion_params,
+                                                  seed=self.hptuning_config.seed)
+        return suggestions
 
     def should_reschedule(self, iteration, bracket_iteration):
         """Return a boolean to indicate if we need to reschedule another iteration."""
@@ -0,0 +1,92 @@
+import numpy as np
+
+from scipy.special import erf
+
+EPS = 1e-12
+
+
+def normal_cdf(x, mu, sigma):
+    return 0.5 * (1 + erf((x - mu) / (np.sqrt(2) * sigma)))
+
+
+class ParzenEstimator(object):
+    """A 1d gaussian mixture truncated to [low, high].
+
+    Each observation is the center of a component, its bandwidth is the largest distance
+    to its neighbours, the prior is a wide component centered in the middle of the bounds.
+
+    Densities are computed for all candidates and components at once,
+    the cost is linear in the number of observations.
+    """
+
+    # Limits the number of components narrowing the bandwidths
+    MAX_MAGIC_CLIP = 100.
+
+    def __init__(self, observations, low, high, prior_weight=1.):
+        self.low = float(low)
+        self.high = float(high)
+        observations = np.sort(np.asarray(observations, dtype=float))
+        n_observations = len(observations)
+        prior_mu = 0.5 * (self.low + self.high)
+        prior_sigma = max(self.high - self.low, EPS)
+
+        if n_observations:
+            padded = np.concatenate([[self.low], observations, [self.high]])
+            sigmas = np.maximum(padded[1:-1] - padded[:-2], padded[2:] - padded[1:-1])
+            min_sigma = prior_sigma / min(self.MAX_MAGIC_CLIP, 1. + n_observations)
+            sigmas = np.clip(sigmas, min_sigma, prior_sigma)
+        else:
+            sigmas = np.array([])
+
+        if not n_observations:
+            # Only the prior can be used
+            prior_weight = 1.
+
+        self.mus = np.append(observations, prior_mu)
+        self.sigmas = np.append(sigmas, prior_sigma)
+        weights = np.append(np.ones(n_observations), prior_weight)
+        self.weights = weights / weights.sum()
+        # Probability mass of each component within the bounds
+        self.masses = np.maximum(normal_cdf(self.high, self.mus, self.sigmas) -
+                                 normal_cdf(self.low, self.mus, self.sigmas), EPS)
+
+    def sample(self, size, rand_generator, max_retries=10):
+        components = rand_generator.choice(len(self.mus), size=size, p=self.weights)
+        samples = rand_generator.normal(self.mus[components], self.sigmas[components])
+        # Redraw the samples outside of the bounds
+        for _ in range(max_retries):
+            outside = (samples < self.low) | (samples > self.high)
+            if not outside.any():
+                break
+            samples[outside] = rand_generator.normal(self.mus[components[outside]],
+                                                     self.sigmas[components[outside]])
+        return np.clip(samples, self.low, self.high)
+
+    def log_pdf(self, x):
+        x = np.asarray(x, dtype=float).reshape(-1, 1)
+        z = (x - self.mus) / self.sigmas
+        pdfs = np.exp(-0.5 * z ** 2) / (np.sqrt(2 * np.pi) * self.sigmas * self.masses)
+        return np.log(np.dot(pdfs, self.weights) + EPS)
+
+
+class CategoricalEstimator(object):
+    """The frequencies of the observed indices of `n_values` categories smoothed by a prior.
+
+    The prior is uniform unless the categories' probabilities are given.
+    """
+
+    def __init__(self, observations, n_values, prior_weight=1., prior=None):
+        counts = np.bincount(np.asarray(observations, dtype=int), minlength=n_values)
+        if prior is None:
+            prior = np.ones(n_values)
+        prior = np.asarray(prior, dtype=float)
+        weights = counts + float(prior_weight or 0.) * prior / prior.sum()
+        if not weights.sum():
+            weights = np.ones(n_values)
+        self.probabilities = weights / weights.sum()
+
+    def sample(self, size, rand_generator):
+        return rand_generator.choice(len(self.probabilities), size=size, p=self.probabilities)
+
+    def log_pdf(self, x):
+        return np.log(self.probabilities[np.asarray(x, dtype=int)] + EPS)
@@ -0,0 +1,131 @@
+import math
+import numpy as np
+
+from hpsearch.search_managers.tpe.estimators import CategoricalEstimator, ParzenEstimator
+from hpsearch.search_managers.utils import get_random_generator
+from schemas.hptuning import Optimization
+
+
+def to_python(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class TPEOptimizer(object):
+    """Tree-structured Parzen Estimator.
+
+    The observations are split in good and bad observations by the `gamma` quantile
+    of the metric, each param is then suggested by maximizing `l(x) / g(x)`
+    over candidates sampled from `l(x)`, where `l` and `g` are the densities
+    estimated with the good and bad observations respectively.
+
+    Categorical params are modeled with categorical distributions, using the probabilities
+    of `pvalues` as their prior, numerical params with parzen estimators, discrete values
+    are snapped to the closest feasible value, and the bounds of non uniform distributions
+    are estimated by sampling the matrix.
+    """
+
+    N_BOUNDS_SAMPLES = 100
+
+    def __init__(self, hptuning_config):
+        self.hptuning_config = hptuning_config
+        self.config = hptuning_config.tpe
+        self.rand_generator = get_random_generator(seed=hptuning_config.seed)
+        self.maximize = Optimization.maximize(self.config.metric.optimization)
+        self._features = []
+        self._categorical_features = {}
+        self._categorical_priors = {}
+        self._discrete_features = {}
+        self._bounds = {}
+        self._configs = []
+        self._losses = np.array([])
+
+        self.set_features()
+
+    def set_features(self):
+        for key in sorted(self.hptuning_config.matrix.keys()):
+            value = self.hptuning_config.matrix[key]
+            self._features.append(key)
+            if value.pvalues:
+                # `to_numpy` is not defined for distributions
+                self._categorical_features[key] = [v for v, _ in value.pvalues]
+                self._categorical_priors[key] = [p for _, p in value.pvalues]
+            elif value.is_categorical:
+                self._categorical_features[key] = list(value.to_numpy())
+            elif value.is_discrete:
+                values = np.sort(np.asarray(value.to_numpy()))
+                self._discrete_features[key] = values
+                self._bounds[key] = (float(values[0]), float(values[-1]))
+            elif value.is_uniform:
+                self._bounds[key] = (float(value.min), float(value.max))
+            else:
+                samples = [value.sample(rand_generator=self.rand_generator)
+                           for _ in range(self.N_BOUNDS_SAMPLES)]
+                self._bounds[key] = (float(np.min(samples)), float(np.max(samples)))
+
+    def add_observations(self, configs, metrics):
+        self._configs = configs
+        losses = np.asarray(metrics, dtype=float)
+        self._losses = -losses if self.maximize else losses
+
+    def split_observations(self):
+        """Return the indices of the good and bad observations."""
+        n_observations = len(self._losses)
+        n_below = max(1, int(math.ceil(self.config.gamma * n_observations)))
+        order = np.argsort(self._losses, kind='mergesort')
+        return order[:n_below], order[n_below:]
+
+    def _get_observed_values(self, feature, indices):
+        values = []
+        for index in indices:
+            value = self._configs[index].get(feature)
+            if value is None:
+                continue
+            if feature in self._categorical_features:
+                if value not in self._categorical_features[feature]:
+                    continue
+                value = self._categorical_features[feature].index(value)
+            values.append(value)
+        return values
+
+    def _get_estimator(self, feature, values):
+        if feature in self._categorical_features:
+            return CategoricalEstimator(observations=values,
+                                        n_values=len(self._categorical_features[feature]),
+                                        prior_weight=self.config.prior_weight,
+                                        prior=self._categorical_priors.get(feature))
+        low, high = self._bounds[feature]
+        return ParzenEstimator(observations=values,
+                               low=low,
+                               high=high,
+                               prior_weight=self.config.prior_weight)
+
+    def _get_feature_suggestion(self, feature, below, above):
+        below_estimator = self._get_estimator(feature, self._get_observed_values(feature, below))
+        above_estimator = self._get_estimator(feature, self._get_observed_values(feature, above))
+        candidates = below_estimator.sample(size=self.config.n_ei_candidates,
+                                            rand_generator=self.rand_generator)
+        scores = below_estimator.log_pdf(candidates) - above_estimator.log_pdf(candidates)
+        best = candidates[np.argmax(scores)]
+
+        if feature in self._categorical_features:
+            return to_python(self._categorical_features[feature][int(best)])
+        if feature in self._discrete_features:
+            values = self._discrete_features[feature]
+            return to_python(values[np.argmin(np.absolute(values - best))])
+        return float(best)
+
+    def get_suggestion(self):
+        if not len(self._losses):
+            return None
+        below, above = self.split_observations()
+        return {feature: self._get_feature_suggestion(feature=feature, below=below, above=above)
+                for feature in self._features}
+
+    def get_suggestions(self, n_suggestions=1):
+        suggestions = []
+        for _ in range(n_suggestions):
+            suggestion = self.get_suggestion()
+            if suggestion is None:
+                break
+            suggestions.append(suggestion)
+        return suggestions
@@ -0,0 +1,11 @@
+from hpsearch.simulator.objectives import (  # noqa
+    BraninObjective,
+    HartmannObjective,
+    LearningCurveObjective,
+    get_objective
+)
+from hpsearch.simulator.simulator import (  # noqa
+    HPSearchSimulator,
+    SimulationReport,
+    get_hptuning_config
+)
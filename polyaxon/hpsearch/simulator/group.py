@@ -0,0 +1,94 @@
+from hpsearch.iteration_managers.bayesian_optimization import BOIterationManager
+from hpsearch.iteration_managers.hyperband import HyperbandIterationManager
+from hpsearch.iteration_managers.tpe import TPEIterationManager
+from hpsearch.schemas import get_iteration_config
+from hpsearch.search_managers import get_search_algorithm_manager
+from schemas.hptuning import SearchAlgorithms
+
+
+class SimulatedIteration(object):
+    def __init__(self, data):
+        self.data = data
+
+    def save(self):
+        pass
+
+
+class SimulatedIterationManagerMixin(object):
+    def _create_iteration(self, iteration_config):
+        iteration = SimulatedIteration(data=iteration_config.to_dict())
+        self.experiment_group.iterations.append(iteration)
+        return iteration
+
+
+class SimulatedBOIterationManager(SimulatedIterationManagerMixin, BOIterationManager):
+    pass
+
+
+class SimulatedHyperbandIterationManager(SimulatedIterationManagerMixin,
+                                         HyperbandIterationManager):
+    pass
+
+
+class SimulatedTPEIterationManager(SimulatedIterationManagerMixin, TPEIterationManager):
+    pass
+
+
+class SimulatedExperimentGroup(object):
+    """An in memory experiment group exposing the api used by the hpsearch managers.
+
+    Experiments are stored as a dict {experiment_id: {'declarations': ..., 'metric': ...}}.
+    """
+
+    def __init__(self, hptuning_config, warm_start_observations=None, id=1):  # noqa
+        self.id = id
+        self.hptuning_config = hptuning_config
+        self.search_algorithm = hptuning_config.search_algorithm
+        self.iterations = []
+        self.experiments = {}
+        self.search_manager = get_search_algorithm_manager(
+            hptuning_config=hptuning_config,
+            warm_start_observations=warm_start_observations)
+        self.iteration_manager = None
+        if SearchAlgorithms.is_hyperband(self.search_algorithm):
+            self.iteration_manager = SimulatedHyperbandIterationManager(experiment_group=self)
+        elif SearchAlgorithms.is_bo(self.search_algorithm):
+            self.iteration_manager = SimulatedBOIterationManager(experiment_group=self)
+        elif SearchAlgorithms.is_tpe(self.search_algorithm):
+            self.iteration_manager = SimulatedTPEIterationManager(experiment_group=self)
+
+    @property
+    def iteration(self):
+        return self.iterations[-1] if self.iterations else None
+
+    @property
+    def iteration_data(self):
+        return self.iteration.data if self.iteration else None
+
+    @property
+    def iteration_config(self):
+        if self.iteration_data and self.search_algorithm:
+            return get_iteration_config(
+                search_algorithm=self.search_algorithm,
+                iteration=self.iteration_data)
+        return None
+
+    def get_suggestions(self):
+        iteration_config = self.iteration_config
+        if iteration_config:
+            return self.search_manager.get_suggestions(iteration_config=iteration_config)
+        return self.search_manager.get_suggestions()
+
+    def create_experiment(self, declarations):
+        experiment_id = len(self.experiments) + 1
+        self.experiments[experiment_id] = {'declarations': declarations, 'metric': None}
+        return experiment_id
+
+    def set_metric(self, experiment_id, value):
+        self.experiments[experiment_id]['metric'] = value
+
+    def get_experiments_metrics(self, metric, experiment_ids=None):
+        if experiment_ids is None:
+            experiment_ids = list(self.experiments.keys())
+        return [(experiment_id, self.experiments[experiment_id]['metric'])
+                for experiment_id in experiment_ids]
@@ -0,0 +1,158 @@
+import math
+import numpy as np
+
+from schemas.hptuning import Optimization
+
+
+class BaseObjective(object):
+    """A synthetic objective function used to simulate experiments.
+
+    An objective defines the search space (a polyaxonfile matrix),
+    the metric reported by the simulated experiments and their simulated run time.
+    """
+    NAME = None
+    METRIC = 'loss'
+    OPTIMIZATION = Optimization.MINIMIZE
+    OPTIMUM = None
+    # The param used as a training budget, e.g. number of epochs, if any
+    RESOURCE = None
+    MAX_RESOURCE = None
+    # Simulated run time, in seconds, of an experiment using one unit of resource
+    RUN_TIME = 60.
+
+    def __init__(self, run_time=None, run_time_jitter=0.1, noise=0., seed=None):
+        self.run_time = run_time or self.RUN_TIME
+        self.run_time_jitter = run_time_jitter
+        self.noise = noise
+        self.rand_generator = np.random.RandomState(seed)
+
+    def get_resource(self, params):
+        if not self.RESOURCE:
+            return None
+        return params.get(self.RESOURCE) or self.MAX_RESOURCE
+
+    def get_matrix(self, grid_size=None):
+        """Return the matrix of the search space.
+
+        Params:
+            grid_size: if provided, continuous params are discretized with `grid_size` values.
+        """
+        raise NotImplementedError
+
+    def evaluate(self, params, resource=None):
+        raise NotImplementedError
+
+    def get_metric(self, params, resource=None):
+        value = self.evaluate(params=params, resource=resource)
+        if self.noise:
+            value += self.rand_generator.normal(scale=self.noise)
+        return float(value)
+
+    def get_run_time(self, params, resource=None):
+        run_time = self.run_time * (resource or 1)
+        if self.run_time_jitter:
+            run_time *= 1 + self.rand_generator.uniform(-self.run_time_jitter,
+                                                        self.run_time_jitter)
+        return run_time
+
+    @staticmethod
+    def _get_param_matrix(low, high, grid_size=None):
+        if grid_size:
+            return {'linspace': [low, high, grid_size]}
+        return {'uniform': [low, high]}
+
+
+class BraninObjective(BaseObjective):
+    """The 2 dimensional Branin function, the global minimum is 0.397887."""
+    NAME = 'branin'
+    OPTIMUM = 0.397887
+
+    def get_matrix(self, grid_size=None):
+        return {
+            'x1': self._get_param_matrix(-5, 10, grid_size),
+            'x2': self._get_param_matrix(0, 15, grid_size),
+        }
+
+    def evaluate(self, params, resource=None):
+        x1, x2 = params['x1'], params['x2']
+        a = 1
+        b = 5.1 / (4 * math.pi ** 2)
+        c = 5 / math.pi
+        r = 6
+        s = 10
+        t = 1 / (8 * math.pi)
+        return a * (x2 - b * x1 ** 2 + c * x1 - r) ** 2 + s * (1 - t) * math.cos(x1) + s
+
+
+class HartmannObjective(BaseObjective):
+    """The 6 dimensional Hartmann function, the global minimum is -3.32237."""
+    NAME = 'hartmann'
+    OPTIMUM = -3.32237
+
+    ALPHA = np.array([1.0, 1.2, 3.0, 3.2])
+    A = np.array([
+        [10, 3, 17, 3.5, 1.7, 8],
+        [0.05, 10, 17, 0.1, 8, 14],
+        [3, 3.5, 1.7, 10, 17, 8],
+        [17, 8, 0.05, 10, 0.1, 14],
+    ])
+    P = 1e-4 * np.array([
+        [1312, 1696, 5569, 124, 8283, 5886],
+        [2329, 4135, 8307, 3736, 1004, 9991],
+        [2348, 1451, 3522, 2883, 3047, 6650],
+        [4047, 8828, 8732, 5743, 1091, 381],
+    ])
+    PARAMS = ['x1', 'x2', 'x3', 'x4', 'x5', 'x6']
+
+    def get_matrix(self, grid_size=None):
+        return {param: self._get_param_matrix(0, 1, grid_size) for param in self.PARAMS}
+
+    def evaluate(self, params, resource=None):
+        x = np.array([params[param] for param in self.PARAMS], dtype=float)
+        inner = np.sum(self.A * (x - self.P) ** 2, axis=1)
+        return -np.sum(self.ALPHA * np.exp(-inner))
+
+
+class LearningCurveObjective(BaseObjective):
+    """A model of a training loss decaying with the number of epochs.
+
+    The asymptotic loss depends on the learning rate and the dropout,
+    the metric reported after `num_epochs` follows an exponential decay towards it,
+    so that low budget evaluations are cheap but only partially informative.
+    """
+    NAME = 'learning_curve'
+    # Lower bound of the loss, only reached with an infinite number of epochs
+    OPTIMUM = 0.05
+    RESOURCE = 'num_epochs'
+    MAX_RESOURCE = 81
+    RUN_TIME = 10.
+
+    def get_matrix(self, grid_size=None):
+        return {
+            'learning_rate': self._get_param_matrix(0.0001, 0.1, grid_size),
+            'dropout': self._get_param_matrix(0., 0.8, grid_size),
+        }
+
+    def evaluate(self, params, resource=None):
+        learning_rate = params['learning_rate']
+        dropout = params['dropout']
+        num_epochs = resource or self.get_resource(params)
+        asymptote = (self.OPTIMUM +
+                     0.1 * (math.log10(learning_rate) + 2.5) ** 2 +
+                     0.5 * (dropout - 0.3) ** 2)
+        decay_rate = 0.02 + 2 * learning_rate * (1 - dropout)
+        return asymptote + (1. - asymptote) * math.exp(-decay_rate * num_epochs)
+
+
+OBJECTIVES = {
+    BraninObjective.NAME: BraninObjective,
+    HartmannObjective.NAME: HartmannObjective,
+    LearningCurveObjective.NAME: LearningCurveObjective,
+}
+
+
+def get_objective(name, **kwargs):
+    if name not in OBJECTIVES:
+        raise ValueError('Objective `{}` is not supported, '
+                         'possible values: {}'.format(name, sorted(OBJECTIVES)))
+    return OBJECTIVES[name](**kwargs)
@@ -0,0 +1,376 @@
+import heapq
+import logging
+import numpy as np
+import time
+
+from hpsearch.simulator.group import SimulatedExperimentGroup
+from schemas.hptuning import HPTuningConfig, Optimization, SearchAlgorithms
+
+_logger = logging.getLogger('polyaxon.hpsearch.simulator')
+
+
+def get_hptuning_config(search_algorithm,
+                        objective,
+                        concurrency=1,
+                        n_experiments=None,
+                        grid_size=5,
+                        n_iterations=10,
+                        max_iter=None,
+                        eta=3,
+                        seed=None):
+    """Create an hptuning config searching the space of a simulation objective."""
+    metric = {'name': objective.METRIC, 'optimization': objective.OPTIMIZATION}
+    hptuning = {
+        'concurrency': concurrency,
+        'matrix': objective.get_matrix(),
+    }
+    if seed:
+        hptuning['seed'] = seed
+    if SearchAlgorithms.is_grid(search_algorithm):
+        hptuning['matrix'] = objective.get_matrix(grid_size=grid_size)
+        if n_experiments:
+            hptuning['grid_search'] = {'n_experiments': n_experiments}
+    elif SearchAlgorithms.is_random(search_algorithm):
+        hptuning['random_search'] = {'n_experiments': n_experiments or grid_size ** 2}
+    elif SearchAlgorithms.is_hyperband(search_algorithm):
+        hptuning['hyperband'] = {
+            'max_iter': max_iter or objective.MAX_RESOURCE or 27,
+            'eta': eta,
+            'resource': {'name': objective.RESOURCE or 'num_epochs', 'type': 'int'},
+            'metric': metric,
+            'resume': False
+        }
+    elif SearchAlgorithms.is_bo(search_algorithm):
+        hptuning['bo'] = {
+            'n_initial_trials': n_experiments or concurrency,
+            'n_iterations': n_iterations,
+            'metric': metric,
+            'utility_function': {
+                'acquisition_function': 'ucb',
+                'kappa': 2.576,
+                'gaussian_process': {
+                    'kernel': 'matern',
+                    'length_scale': 1.0,
+                    'nu': 1.9,
+                    'n_restarts_optimizer': 0
+                },
+                'n_warmup': 1000,
+                'n_iter': 1
+            }
+        }
+    elif SearchAlgorithms.is_tpe(search_algorithm):
+        hptuning['tpe'] = {
+            'n_initial_trials': n_experiments or concurrency,
+            'n_iterations': n_iterations,
+            'n_suggestions': concurrency,
+            'metric': metric,
+        }
+    else:
+        raise ValueError('Search algorithm `{}` is not supported.'.format(search_algorithm))
+    return HPTuningConfig.from_dict(hptuning)
+
+
+class SimulationReport(object):
+    """The result of a simulation.
+
+    Times are in seconds, `makespan` and `time_to_target` are simulated times,
+    the latencies are the real times spent in the hpsearch managers:
+    the suggestion latencies in computing the suggestions,
+    the iteration latencies in creating, updating and reducing the iterations.
+    """
+
+    def __init__(self,
+                 search_algorithm,
+                 objective,
+                 concurrency,
+                 runs,
+                 suggestion_latencies,
+                 iteration_latencies,
+                 n_iterations,
+                 makespan,
+                 busy_time,
+                 target=None):
+        self.search_algorithm = search_algorithm
+        self.objective = objective
+        self.concurrency = concurrency
+        self.runs = runs
+        self.suggestion_latencies = suggestion_latencies
+        self.iteration_latencies = iteration_latencies
+        self.n_iterations = n_iterations
+        self.makespan = makespan
+        self.busy_time = busy_time
+        self.target = target
+
+    @property
+    def maximize(self):
+        return Optimization.maximize(self.objective.OPTIMIZATION)
+
+    @property
+    def n_runs(self):
+        return len(self.runs)
+
+    @property
+    def n_experiments(self):
+        return len({run.experiment_id for run in self.runs})
+
+    @property
+    def best_run(self):
+        if not self.runs:
+            return None
+        get_best = max if self.maximize else min
+        return get_best(self.runs, key=lambda run: run.metric)
+
+    @property
+    def utilisation(self):
+        if not self.makespan:
+            return 0.
+        return self.busy_time / (self.concurrency * self.makespan)
+
+    @property
+    def time_to_target(self):
+        """The simulated time when the first run reached the target."""
+        if self.target is None:
+            return None
+        for run in sorted(self.runs, key=lambda r: r.end):
+            if ((self.maximize and run.metric >= self.target) or
+                    (not self.maximize and run.metric <= self.target)):
+                return run.end
+        return None
+
+    @staticmethod
+    def _get_latency_stats(values):
+        latencies = np.asarray(values or [0.], dtype=float)
+        return {
+            'count': len(values),
+            'total': float(latencies.sum()),
+            'mean': float(latencies.mean()),
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+            'max': float(latencies.max()),
+        }
+
+    def get_latency_stats(self):
+        return self._get_latency_stats(self.suggestion_latencies)
+
+    def get_iteration_latency_stats(self):
+        return self._get_latency_stats(self.iteration_latencies)
+
+    def to_dict(self):
+        best_run = self.best_run
+        return {
+            'search_algorithm': self.search_algorithm,
+            'objective': self.objective.NAME,
+            'concurrency': self.concurrency,
+            'n_experiments': self.n_experiments,
+            'n_runs': self.n_runs,
+            'n_iterations': self.n_iterations,
+            'best_metric': best_run.metric if best_run else None,
+            'best_declarations': best_run.declarations if best_run else None,
+            'target': self.target,
+            'time_to_target': self.time_to_target,
+            'makespan': self.makespan,
+            'utilisation': self.utilisation,
+            'suggestion_latency': self.get_latency_stats(),
+            'iteration_latency': self.get_iteration_latency_stats(),
+        }
+
+
+class SimulatedRun(object):
+    def __init__(self, experiment_id, declarations, metric, start, end):
+        self.experiment_id = experiment_id
+        self.declarations = declarations
+        self.metric = metric
+        self.start = start
+        self.end = end
+
+
+class HPSearchSimulator(object):
+    """Drives the search and iteration managers against a synthetic objective.
+
+    Experiments are scheduled on `concurrency` simulated slots, using a simulated clock,
+    iterations of Hyperband and BO wait for all experiments of an iteration to be done,
+    similar to the hpsearch tasks.
+
+    Args:
+        hptuning_config: `HPTuningConfig`. The hptuning config to simulate.
+        objective: `BaseObjective`. The objective function used to compute the metrics.
+        concurrency: `int`. The number of slots, defaults to the config's concurrency.
+        target: `float`. A metric value used to compute the time to target.
+        iteration_overhead: `float`. A simulated delay, in seconds, added before
+            each new iteration, e.g. to model the scheduling interval of the hp tasks.
+        include_suggestion_latency: `bool`. Whether or not to add the real
+            time spent in the managers, suggestions and iterations, to the simulated clock.
+        warm_start_observations: `list`. [declarations, metric] of previous experiments
+            used to warm start bo, tpe and hyperband.
+    """
+
+    def __init__(self,
+                 hptuning_config,
+                 objective,
+                 concurrency=None,
+                 target=None,
+                 iteration_overhead=0.,
+                 include_suggestion_latency=True,
+                 warm_start_observations=None):
+        self.hptuning_config = hptuning_config
+        self.objective = objective
+        self.concurrency = concurrency or hptuning_config.concurrency or 1
+        self.target = target
+        self.iteration_overhead = iteration_overhead
+        self.include_suggestion_latency = include_suggestion_latency
+        self.search_algorithm = hptuning_config.search_algorithm
+        self.experiment_group = SimulatedExperimentGroup(
+            hptuning_config=hptuning_config,
+            warm_start_observations=warm_start_observations)
+        self.clock = 0.
+        self.busy_time = 0.
+        self.runs = []
+        self.suggestion_latencies = []
+        self.iteration_latencies = []
+        self.n_iterations = 0
+        self._slots = [0.] * self.concurrency
+        self._resources = {}
+
+    def _time(self, latencies, fct, *args, **kwargs):
+        start = time.perf_counter()
+        result = fct(*args, **kwargs)
+        latency = time.perf_counter() - start
+        latencies.append(latency)
+        if self.include_suggestion_latency:
+            self.clock += latency
+        return result
+
+    def _time_suggestions(self, fct, *args, **kwargs):
+        return self._time(self.suggestion_latencies, fct, *args, **kwargs)
+
+    def _time_iteration(self, fct, *args, **kwargs):
+        return self._time(self.iteration_latencies, fct, *args, **kwargs)
+
+    def _get_resource(self, declarations):
+        if SearchAlgorithms.is_hyperband(self.search_algorithm):
+            return declarations.get(self.hptuning_config.hyperband.resource.name)
+        return self.objective.get_resource(declarations)
+
+    def _get_run_time(self, experiment_id, declarations, resource):
+        run_resource = resource
+        if (resource and SearchAlgorithms.is_hyperband(self.search_algorithm) and
+                self.hptuning_config.hyperband.resume):
+            run_resource = resource - self._resources.get(experiment_id, 0)
+        self._resources[experiment_id] = resource
+        return self.objective.get_run_time(params=declarations, resource=run_resource)
+
+    def run_experiments(self, experiment_ids):
+        """Schedule the experiments on the free slots and wait for all of them to be done."""
+        self.clock += self.iteration_overhead
+        self.n_iterations += 1
+        end = self.clock
+        for experiment_id in experiment_ids:
+            declarations = self.experiment_group.experiments[experiment_id]['declarations']
+            resource = self._get_resource(declarations)
+            run_time = self._get_run_time(experiment_id=experiment_id,
+                                          declarations=declarations,
+                                          resource=resource)
+            start = max(heapq.heappop(self._slots), self.clock)
+            run_end = start + run_time
+            heapq.heappush(self._slots, run_end)
+            metric = self.objective.get_metric(params=declarations, resource=resource)
+            self.experiment_group.set_metric(experiment_id=experiment_id, value=metric)
+            self.runs.append(SimulatedRun(experiment_id=experiment_id,
+                                          declarations=dict(declarations),
+                                          metric=metric,
+                                          start=start,
+                                          end=run_end))
+            self.busy_time += run_time
+            end = max(end, run_end)
+        self.clock = end
+
+    def create_experiments(self, suggestions):
+        return [self.experiment_group.create_experiment(declarations=suggestion)
+                for suggestion in suggestions or []]
+
+    def simulate_search(self):
+        """Grid and random search, all suggestions are created at once."""
+        suggestions = self._time_suggestions(self.experiment_group.get_suggestions)
+        self.run_experiments(self.create_experiments(suggestions))
+
+    def simulate_bo(self):
+        search_manager = self.experiment_group.search_manager
+        iteration_manager = self.experiment_group.iteration_manager
+        while True:
+            suggestions = self._time_suggestions(self.experiment_group.get_suggestions)
+            if not suggestions:
+                break
+            experiment_ids = self.create_experiments(suggestions)
+            experiments = self.experiment_group.experiments
+            experiments_configs = [[xp_id, experiments[xp_id]['declarations']]
+                                   for xp_id in experiment_ids]
+            self._time_iteration(iteration_manager.create_iteration,
+                                 experiment_ids=experiment_ids,
+                                 experiments_configs=experiments_configs)
+            self.run_experiments(experiment_ids)
+            self._time_iteration(iteration_manager.update_iteration)
+            iteration_config = self.experiment_group.iteration_config
+            if not search_manager.should_reschedule(iteration=iteration_config.iteration):
+                break
+
+    def simulate_hyperband(self):
+        search_manager = self.experiment_group.search_manager
+        iteration_manager = self.experiment_group.iteration_manager
+        hyperband = self.hptuning_config.hyperband
+
+        self._time_iteration(iteration_manager.create_iteration)
+        while True:
+            suggestions = self._time_suggestions(self.experiment_group.get_suggestions)
+            experiment_ids = self.create_experiments(suggestions)
+            iteration_manager.add_iteration_experiments(experiment_ids=experiment_ids)
+            self.run_experiments(experiment_ids)
+
+            while True:
+                self._time_iteration(iteration_manager.update_iteration)
+                iteration_config = self.experiment_group.iteration_config
+                if search_manager.should_reschedule(
+                        iteration=iteration_config.iteration,
+                        bracket_iteration=iteration_config.bracket_iteration):
+                    self._time_iteration(iteration_manager.create_iteration)
+                    break
+
+                if not search_manager.should_reduce_configs(
+                        iteration=iteration_config.iteration,
+                        bracket_iteration=iteration_config.bracket_iteration):
+                    return
+
+                experiment_ids = self._time_iteration(iteration_manager.get_reduced_configs)
+                self._time_iteration(iteration_manager.create_iteration,
+                                     experiment_ids=experiment_ids)
+                iteration_config = self.experiment_group.iteration_config
+                n_resources = search_manager.get_n_resources_for_iteration(
+                    iteration=iteration_config.iteration,
+                    bracket_iteration=iteration_config.bracket_iteration)
+                n_resources = hyperband.resource.cast_value(n_resources)
+                for experiment_id in experiment_ids:
+                    declarations = self.experiment_group.experiments[experiment_id]['declarations']
+                    declarations[hyperband.resource.name] = n_resources
+                self.run_experiments(experiment_ids)
+
+    def simulate(self):
+        if (SearchAlgorithms.is_bo(self.search_algorithm) or
+                SearchAlgorithms.is_tpe(self.search_algorithm)):
+            self.simulate_bo()
+        elif SearchAlgorithms.is_hyperband(self.search_algorithm):
+            self.simulate_hyperband()
+        else:
+            self.simulate_search()
+
+        report = SimulationReport(search_algorithm=self.search_algorithm,
+                                  objective=self.objective,
+                                  concurrency=self.concurrency,
+                                  runs=self.runs,
+                                  suggestion_latencies=self.suggestion_latencies,
+                                  iteration_latencies=self.iteration_latencies,
+                                  n_iterations=self.n_iterations,
+                                  makespan=self.clock,
+                                  busy_time=self.busy_time,
+                                  target=self.target)
+        _logger.debug('Simulated search `%s` on `%s`: %s',
+                      self.search_algorithm, self.objective.NAME, report.to_dict())
+        return report
@@ -5,9 +5,10 @@ from event_manager.events.experiment_group import (
     EXPERIMENT_GROUP_BO,
     EXPERIMENT_GROUP_GRID,
     EXPERIMENT_GROUP_HYPERBAND,
-    EXPERIMENT_GROUP_RANDOM
+    EXPERIMENT_GROUP_RANDOM,
+    EXPERIMENT_GROUP_TPE
 )
-from hpsearch.tasks import bo, grid, health, hyperband, random  # noqa
+from hpsearch.tasks import bo, early_stopping, grid, health, hyperband, random, tpe  # noqa
 from polyaxon.celery_api import app as celery_app
 from polyaxon.settings import HPCeleryTasks, Intervals
 from schemas.hptuning import SearchAlgorithms
@@ -41,4 +42,8 @@ def create(experiment_group):
         auditor.record(event_type=EXPERIMENT_GROUP_BO,
                        instance=experiment_group)
         return bo.create(experiment_group=experiment_group)
+    elif SearchAlgorithms.is_tpe(experiment_group.search_algorithm):
+        auditor.record(event_type=EXPERIMENT_GROUP_TPE,
+                       instance=experiment_group)
+        return tpe.create(experiment_group=experiment_group)
     return None
@@ -0,0 +1,44 @@
+import logging
+
+from db.getters.experiment_groups import get_running_experiment_group
+from db.getters.experiments import get_valid_experiment
+from hpsearch.early_stopping import get_metric_early_stopping_policy
+from polyaxon.celery_api import app as celery_app
+from polyaxon.settings import HPCeleryTasks, SchedulerCeleryTasks
+
+_logger = logging.getLogger('polyaxon.hpsearch.early_stopping')
+
+
+@celery_app.task(name=HPCeleryTasks.HP_EARLY_STOPPING, ignore_result=True)
+def hp_early_stopping(experiment_group_id, experiment_id, step=None):
+    experiment_group = get_running_experiment_group(experiment_group_id=experiment_group_id)
+    if not experiment_group:
+        return
+
+    policy = get_metric_early_stopping_policy(config=experiment_group.metric_early_stopping)
+    if not policy:
+        return
+
+    experiment = get_valid_experiment(experiment_id=experiment_id)
+    if not experiment or not experiment.is_running:
+        return
+
+    if not policy.should_stop_experiment(experiment_group_id=experiment_group.id,
+                                         experiment_id=experiment.id,
+                                         step=step):
+        return
+
+    _logger.info('Experiment `%s` is stopped early by the metric early stopping policy `%s`.',
+                 experiment.unique_name, policy.config.policy)
+    celery_app.send_task(
+        SchedulerCeleryTasks.EXPERIMENTS_STOP,
+        kwargs={
+            'project_name': experiment_group.project.unique_name,
+            'project_uuid': experiment_group.project.uuid.hex,
+            'experiment_name': experiment.unique_name,
+            'experiment_uuid': experiment.uuid.hex,
+            'experiment_group_name': experiment_group.unique_name,
+            'experiment_group_uuid': experiment_group.uuid.hex,
+            'specification': experiment.config,
+            'update_status': True
+        })
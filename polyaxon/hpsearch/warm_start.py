@@ -0,0 +1,90 @@
+import logging
+
+import query
+
+from query.exceptions import QueryError
+from schemas.hptuning import SearchAlgorithms
+
+_logger = logging.getLogger('polyaxon.hpsearch.warm_start')
+
+
+def get_search_metric(hptuning_config):
+    if SearchAlgorithms.is_bo(hptuning_config.search_algorithm):
+        return hptuning_config.bo.metric.name
+    if SearchAlgorithms.is_hyperband(hptuning_config.search_algorithm):
+        return hptuning_config.hyperband.metric.name
+    if SearchAlgorithms.is_tpe(hptuning_config.search_algorithm):
+        return hptuning_config.tpe.metric.name
+    return None
+
+
+def is_in_matrix(value, matrix_config):
+    if matrix_config.is_uniform:
+        try:
+            return matrix_config.min <= value <= matrix_config.max
+        except TypeError:
+            return False
+    if matrix_config.pvalues:
+        # `to_numpy` is not defined for distributions
+        return value in [v for v, _ in matrix_config.pvalues]
+    if matrix_config.is_continuous:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    return value in list(matrix_config.to_numpy())
+
+
+def get_matching_declarations(declarations, matrix):
+    """Return the declarations restricted to the matrix keys,
+    or None if they don't cover the matrix or are outside of its space.
+    """
+    if not declarations:
+        return None
+    matching_declarations = {}
+    for key, matrix_config in matrix.items():
+        if key not in declarations or not is_in_matrix(declarations[key], matrix_config):
+            return None
+        matching_declarations[key] = declarations[key]
+    return matching_declarations
+
+
+def get_warm_start_observations(experiment_group):
+    """Return a list of [declarations, metric] observed by previous experiments
+    matching the experiment group's warm start config and search space.
+    """
+    from db.models.experiments import Experiment
+
+    config = experiment_group.warm_start
+    hptuning_config = experiment_group.hptuning_config
+    if not config or not hptuning_config:
+        return None
+
+    metric = get_search_metric(hptuning_config)
+    if not metric:
+        _logger.info('Warm start is not supported by the search algorithm `%s`.',
+                     hptuning_config.search_algorithm)
+        return None
+
+    queryset = Experiment.objects.filter(
+        project_id=experiment_group.project_id,
+        last_metric__has_key=metric
+    ).exclude(experiment_group_id=experiment_group.id)
+    if config.experiment_groups:
+        queryset = queryset.filter(experiment_group_id__in=config.experiment_groups)
+    if config.query:
+        try:
+            queryset = query.filter_queryset(manager='experiment',
+                                             query_spec=config.query,
+                                             queryset=queryset)
+        except QueryError as e:
+            _logger.warning('Experiment group `%s` has an invalid warm start query: %s',
+                            experiment_group.id, e)
+            return None
+    queryset = queryset.order_by('-created_at').values_list('declarations', 'last_metric')
+
+    observations = []
+    for declarations, last_metric in queryset[:config.n_experiments]:
+        declarations = get_matching_declarations(declarations=declarations,
+                                                 matrix=hptuning_config.matrix)
+        if declarations is None or last_metric.get(metric) is None:
+            continue
+        observations.append([declarations, last_metric[metric]])
+    return observations
@@ -0,0 +1,23 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import Aggregate, FloatField
+
+
+class Percentiles(Aggregate):
+    """The continuous percentiles of an expression, e.g. `Percentiles('value', [0.5, 0.9])`.
+
+    Postgres computes all the percentiles with a single sort of the values.
+    """
+    function = 'percentile_cont'
+    name = 'Percentiles'
+    template = '%(function)s(%(percentiles)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+
+    def __init__(self, expression, percentiles, **extra):
+        percentiles = [float(percentile) for percentile in percentiles]
+        if not percentiles or not all(0 <= percentile <= 1 for percentile in percentiles):
+            raise ValueError('Percentiles must be between 0 and 1.')
+        super().__init__(
+            expression,
+            percentiles='ARRAY[{}]::double precision[]'.format(
+                ', '.join(repr(percentile) for percentile in percentiles)),
+            output_field=ArrayField(FloatField()),
+            **extra)
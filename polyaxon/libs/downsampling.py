@@ -0,0 +1,82 @@
+import numpy as np
+
+from constants.metrics import Downsampling
+
+
+def lttb(x, y, n_points):
+    """Largest triangle three buckets downsampling.
+
+    Keeps the first and last points and, for every bucket in between, the point forming
+    the largest triangle with the previous selected point and the next bucket's average.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_points >= n or n <= 2:
+        return x, y
+    if n_points < 3:
+        return x[[0, n - 1]], y[[0, n - 1]]
+
+    buckets = np.array_split(np.arange(1, n - 1), n_points - 2)
+    selected = np.empty(n_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    for i, bucket in enumerate(buckets):
+        next_bucket = buckets[i + 1] if i + 1 < len(buckets) else [n - 1]
+        avg_x = x[next_bucket].mean()
+        avg_y = y[next_bucket].mean()
+        previous = selected[i]
+        areas = np.absolute((x[previous] - avg_x) * (y[bucket] - y[previous]) -
+                            (x[previous] - x[bucket]) * (avg_y - y[previous]))
+        selected[i + 1] = bucket[np.argmax(areas)]
+    return x[selected], y[selected]
+
+
+def min_max(x, y, n_points):
+    """Keeps the min and max points of `n_points / 2` buckets, in their original order."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_points >= n or n <= 2:
+        return x, y
+
+    n_buckets = max(1, n_points // 2)
+    bounds = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+    selected = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        selected += [start + np.argmin(y[start:end]), start + np.argmax(y[start:end])]
+    selected = np.unique(selected)
+    return x[selected], y[selected]
+
+
+def align(x, y, edges):
+    """Aligns a series on the buckets delimited by `edges`.
+
+    Every bucket's value is the mean of the points falling in it, nan if it has none.
+    The buckets are half open, except the last one which includes the last edge.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.float64)
+    n_buckets = len(edges) - 1
+    mask = (x >= edges[0]) & (x <= edges[-1])
+    x = x[mask]
+    y = y[mask]
+    buckets = np.minimum(np.searchsorted(edges, x, side='right') - 1, n_buckets - 1)
+    counts = np.bincount(buckets, minlength=n_buckets)
+    sums = np.bincount(buckets, weights=y, minlength=n_buckets)
+    values = np.full(n_buckets, np.nan)
+    np.divide(sums, counts, out=values, where=counts > 0)
+    return values
+
+
+DOWNSAMPLING = {
+    Downsampling.LTTB: lttb,
+    Downsampling.MIN_MAX: min_max,
+}
+
+
+def downsample(x, y, n_points, method=Downsampling.LTTB):
+    if method not in DOWNSAMPLING:
+        raise ValueError('Downsampling method `{}` is not supported.'.format(method))
+    return DOWNSAMPLING[method](x, y, n_points)
@@ -51,10 +51,14 @@ def safe_request(
     allow_redirects=False,
     timeout=30,
     verify_ssl=True,
+    session=None,
 ):
-    """A slightly safer version of `request`."""
+    """A slightly safer version of `request`.
 
-    session = requests.Session()
+    A `session` can be passed to reuse its pooled connections.
+    """
+
+    session = session or requests.Session()
 
     kwargs = {}
 
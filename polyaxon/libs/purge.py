@@ -0,0 +1,33 @@
+from django.db import connection, transaction
+
+
+def delete_in_batches(model, last_date, batch_size, cascades=()):
+    """Delete the rows of a model created at or before a date, `batch_size` rows at a time.
+
+    Every batch is deleted in its own short transaction by raw deletes,
+    instead of collecting all the rows and their related rows in memory as `QuerySet.delete`.
+    `cascades` are the (model, column) referencing the rows, their rows are deleted first.
+
+    Returns the number of rows deleted.
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(model._meta.db_table)
+    n_deleted = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT "id" FROM {table} WHERE "created_at" <= %s '
+                'ORDER BY "created_at" LIMIT %s FOR UPDATE SKIP LOCKED'.format(table=table),
+                [last_date, batch_size])
+            ids = [row[0] for row in cursor.fetchall()]
+            if ids:
+                for cascade_model, column in cascades:
+                    cursor.execute('DELETE FROM {table} WHERE {column} = ANY(%s)'.format(
+                        table=quote_name(cascade_model._meta.db_table),
+                        column=quote_name(column)), [ids])
+                cursor.execute('DELETE FROM {table} WHERE "id" = ANY(%s)'.format(table=table),
+                               [ids])
+        # A short batch does not mean the rows are all deleted, locked rows were skipped
+        if not ids:
+            return n_deleted
+        n_deleted += len(ids)
@@ -3,6 +3,7 @@ from rest_framework.exceptions import ValidationError
 
 from django.core.exceptions import ValidationError as DjangoValidationError
 
+from hpsearch.schemas import get_specification_hptuning, validate_hptuning_extensions
 from schemas.environments import OutputsConfig, PersistenceConfig
 from schemas.exceptions import PolyaxonConfigurationError, PolyaxonfileError
 from schemas.hptuning import HPTuningConfig
@@ -32,6 +33,11 @@ def validate_experiment_spec_config(config, raise_for_rest=False):
 def validate_group_spec_content(content, raise_for_rest=False):
     try:
         spec = GroupSpecification.read(content)
+        if spec.hptuning:
+            # The polyaxonfile's schema ignores the hpsearch specific sections
+            hptuning = get_specification_hptuning(spec)
+            HPTuningConfig.from_dict(hptuning)
+            validate_hptuning_extensions(hptuning)
     except (MarshmallowValidationError, PolyaxonfileError, PolyaxonConfigurationError) as e:
         message_error = 'Received non valid specification content. %s' % e
         if raise_for_rest:
@@ -45,6 +51,7 @@ def validate_group_spec_content(content, raise_for_rest=False):
 def validate_group_hptuning_config(config, raise_for_rest=False):
     try:
         HPTuningConfig.from_dict(config)
+        validate_hptuning_extensions(config)
     except MarshmallowValidationError as e:
         if raise_for_rest:
             raise ValidationError(e)
@@ -1,3 +1,5 @@
+from django.conf import settings
+
 from libs.services import LazyServiceWrapper
 from notifier.managers import default_action_manager, default_event_manager
 from notifier.service import NotifierService
@@ -5,7 +7,10 @@ from notifier.service import NotifierService
 backend = LazyServiceWrapper(
     backend_base=NotifierService,
     backend_path='notifier.service.NotifierService',
-    options={}
+    options={
+        'write_window': settings.AuditorWriteBuffer.WINDOW / 1000.,
+        'write_size': settings.AuditorWriteBuffer.SIZE,
+    }
 )
 backend.expose(locals())
 
@@ -1,21 +1,69 @@
 from collections import namedtuple
 
+from django.contrib.auth import get_user_model
+
+from db.models.projects import Project
+from db.redis.recipients import RedisRecipients
+
 
 class RecipientSpec(namedtuple('RecipientSpec', 'id email')):
     pass
 
 
+def get_projects_owners(project_ids):
+    """Return the owner id of the projects, from the cache or else loaded in a single query."""
+    projects_owners = RedisRecipients.get_projects_owners(list(project_ids))
+    missing_ids = set(project_ids) - set(projects_owners)
+    if missing_ids:
+        loaded_owners = dict(
+            Project.objects.filter(id__in=missing_ids).values_list('id', 'user_id'))
+        RedisRecipients.set_projects_owners(loaded_owners)
+        projects_owners.update(loaded_owners)
+    return projects_owners
+
+
+def get_users_emails(user_ids):
+    """Return the email of the users, from the cache or else loaded in a single query."""
+    users_emails = RedisRecipients.get_users_emails(list(user_ids))
+    missing_ids = set(user_ids) - set(users_emails)
+    if missing_ids:
+        loaded_emails = {user_id: email or '' for user_id, email in
+                         get_user_model().objects.filter(
+                             id__in=missing_ids).values_list('id', 'email')}
+        RedisRecipients.set_users_emails(loaded_emails)
+        users_emails.update(loaded_emails)
+    return users_emails
+
+
+def get_recipients(instances):
+    """Return the recipients of each (instance, is_project), resolved for all of them at once.
+
+    The recipients of a project are its owner, the recipients of the other instances
+    are their user and their project's owner. The ids are read from the instances' columns,
+    the related project and user are not loaded.
+    """
+    projects_owners = get_projects_owners(
+        {instance.project_id for instance, is_project in instances if not is_project})
+    instances_user_ids = []
+    for instance, is_project in instances:
+        user_ids = {instance.user_id}
+        if not is_project and instance.project_id in projects_owners:
+            user_ids.add(projects_owners[instance.project_id])
+        instances_user_ids.append(user_ids)
+
+    users_emails = get_users_emails(set().union(*instances_user_ids))
+    return [{RecipientSpec(user_id, users_emails[user_id])
+             for user_id in user_ids if user_id in users_emails}
+            for user_ids in instances_user_ids]
+
+
 def get_project_recipients(project):
-    return {RecipientSpec(project.user.id, project.user.email), }
+    return get_recipients([(project, True)])[0]
 
 
 def get_build_recipients(build):
-    recipients = {RecipientSpec(build.user.id, build.user.email), }
-    recipients |= get_project_recipients(build.project)
-    return recipients
+    return get_recipients([(build, False)])[0]
 
 
 def get_instance_and_project_recipients(instance):
-    recipients = {RecipientSpec(instance.user.id, instance.user.email), }
-    recipients |= get_project_recipients(instance.project)
-    return recipients
+    return get_recipients([(instance, False)])[0]
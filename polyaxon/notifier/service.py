@@ -1,54 +1,114 @@
+from functools import partial
+
+from django.db import transaction
+
+import stats
+
 from action_manager.actions.email import EmailAction
 from constants import user_system
 from event_manager import event_subjects
+from event_manager.buffered_writer import BufferedWriter, get_content_type_id
 from event_manager.event_service import EventService
 from notifier.managers import default_action_manager, default_event_manager
-from notifier.recipients import get_instance_and_project_recipients, get_project_recipients
+from notifier.recipients import get_recipients
 
 
 class NotifierService(EventService):
+    """Creates the notifications of the events and executes the actions handling them.
+
+    The actions handling every event type are routed once at setup.
+    """
     event_manager = default_event_manager
     action_manager = default_action_manager
+    stats_key = 'notifier'
 
-    def __init__(self):
+    def __init__(self, write_window=0, write_size=500):
         self.notification_event = None
         self.notification = None
+        self.write_window = write_window
+        self.write_size = write_size
+        self.writer = None
+        self.routes = {}
 
     @staticmethod
-    def get_recipients(event):
-        if event.get_event_subject() == event_subjects.PROJECT:
-            return get_project_recipients(event.instance)
-        return get_instance_and_project_recipients(event.instance)
+    def get_events_recipients(events):
+        """Return the recipients of each event, resolved for all the events at once."""
+        return get_recipients([
+            (event.instance, event.get_event_subject() == event_subjects.PROJECT)
+            for event in events])
 
-    def create_notification(self, event, recipients):
+    def get_recipients(self, event):
+        return self.get_events_recipients([event])[0]
+
+    def get_notification_event(self, event):
         actor_id = event.data.get(event.actor_id)
-        actor_id = actor_id if actor_id != user_system.USER_SYSTEM_ID else None
-        notification_event = self.notification_event.objects.create(
+        return self.notification_event(
             event_type=event.event_type,
             actor_id=actor_id if actor_id != user_system.USER_SYSTEM_ID else None,
             context=event.data,
             created_at=event.datetime,
-            content_object=event.instance,
+            content_type_id=get_content_type_id(event.instance),
+            object_id=event.instance.pk,
         )
 
+    def create_notifications(self, notification_events):
+        """Create the (notification event, recipients) and the recipients' notifications.
+
+        The notification events and the notifications are created in an insert each.
+        """
+        created_notification_events = self.notification_event.objects.bulk_create(
+            [notification_event for notification_event, _ in notification_events])
+
+        events_recipients = zip(created_notification_events,
+                                [recipients for _, recipients in notification_events])
         self.notification.objects.bulk_create([
             self.notification(event=notification_event, user_id=recipient.id)
+            for notification_event, recipients in events_recipients
             for recipient in recipients
         ])
 
-    def record_event(self, event):
-        recipients = self.get_recipients(event)
-        self.create_notification(event, recipients)
-        for action in self.action_manager.values:
+    def create_notification(self, event, recipients):
+        notification_event = (self.get_notification_event(event), recipients)
+        if self.writer:
+            transaction.on_commit(partial(self.writer.add, notification_event))
+        else:
+            self.create_notifications([notification_event])
+
+    def get_actions(self, event_type):
+        """Return the actions handling the event type."""
+        return self.routes.get(event_type, [])
+
+    def build_routes(self):
+        self.routes = {
+            event_type: [action for action in self.action_manager.values
+                         if action.can_handle(event_type)]
+            for event_type in self.event_manager.keys
+        }
+
+    def execute_actions(self, event, recipients):
+        for action in self.get_actions(event.event_type):
             config = None
             if action == EmailAction:
                 config = {'recipients': [r.email for r in recipients]}
 
             try:
-                action.execute(context=event, config=config, from_user=None, from_event=True)
+                with stats.timer('notifier.actions.{}'.format(action.action_key)):
+                    action.execute(context=event, config=config, from_user=None, from_event=True)
             except Exception as e:
                 action.logger.warning('Action execution failed %s', e, exc_info=True)
 
+    def record_event(self, event):
+        recipients = self.get_recipients(event)
+        self.create_notification(event, recipients)
+        self.execute_actions(event, recipients)
+
+    def record_events(self, events):
+        events_recipients = list(zip(events, self.get_events_recipients(events)))
+        self.create_notifications([(self.get_notification_event(event), recipients)
+                                   for event, recipients in events_recipients])
+        for event, recipients in events_recipients:
+            self.execute_actions(event, recipients)
+
     def setup(self):
         super().setup()
         # Load default event types and actions
@@ -59,3 +119,8 @@ class NotifierService(EventService):
 
         self.notification_event = NotificationEvent
         self.notification = Notification
+        self.build_routes()
+        if self.write_window:
+            self.writer = BufferedWriter(write=self.create_notifications,
+                                         size=self.write_size,
+                                         window=self.write_window)
@@ -3,6 +3,7 @@ from polyaxon.config_manager import config
 
 from .admin import *
 from .api_host import *
+from .auditor import *
 from .celery_settings import *
 from .context_processors import *
 from .core import *
@@ -12,6 +13,7 @@ from .logging import *
 from .oauth import *
 from .redis_settings import *
 from .secrets import *
+from .stats import *
 from .tracker import *
 from .versions import *
 
@@ -0,0 +1,63 @@
+from polyaxon.config_manager import config
+
+AUDITOR_BACKEND_SYNC = 'sync'
+AUDITOR_BACKEND_ASYNC = 'async'
+AUDITOR_BACKEND = config.get_string(
+    'POLYAXON_AUDITOR_BACKEND',
+    is_optional=True,
+    default=AUDITOR_BACKEND_SYNC,
+    options=(AUDITOR_BACKEND_SYNC, AUDITOR_BACKEND_ASYNC))
+
+
+class AuditorBuffer(object):
+    """The bounded buffer of the async auditor's events.
+
+    The buffer is best-effort, the events still buffered when a process is killed,
+    or after the shutdown timeout of a celery worker, are not recorded.
+    """
+    SIZE = config.get_int(
+        'POLYAXON_AUDITOR_BUFFER_SIZE',
+        is_optional=True,
+        default=10000)
+    BATCH_SIZE = config.get_int(
+        'POLYAXON_AUDITOR_BATCH_SIZE',
+        is_optional=True,
+        default=500)
+    # Milliseconds a caller waits for the full buffer before recording its events itself
+    PUT_TIMEOUT = config.get_int(
+        'POLYAXON_AUDITOR_PUT_TIMEOUT',
+        is_optional=True,
+        default=100)
+    # Seconds a shutting down celery worker waits for its buffered events to be recorded
+    SHUTDOWN_TIMEOUT = config.get_int(
+        'POLYAXON_AUDITOR_SHUTDOWN_TIMEOUT',
+        is_optional=True,
+        default=30)
+
+
+class AuditorWriteBuffer(object):
+    """The buffered inserts of the activity logs and notifications."""
+    # Milliseconds the rows are buffered for, 0 inserts every row when its event is recorded
+    WINDOW = config.get_int(
+        'POLYAXON_AUDITOR_WRITE_WINDOW',
+        is_optional=True,
+        default=0)
+    SIZE = config.get_int(
+        'POLYAXON_AUDITOR_WRITE_SIZE',
+        is_optional=True,
+        default=500)
+
+
+class ActivityLogsViews(object):
+    """The recording policy of the views activity logs, the other activity logs are all recorded."""
+    # Seconds during which the same view of an object by an actor is recorded once,
+    # 0 records all the views
+    WINDOW = config.get_int(
+        'POLYAXON_ACTIVITYLOGS_VIEWS_WINDOW',
+        is_optional=True,
+        default=0)
+    # Percentage of the views recorded
+    SAMPLE_RATE = config.get_int(
+        'POLYAXON_ACTIVITYLOGS_VIEWS_SAMPLE_RATE',
+        is_optional=True,
+        default=100)
@@ -1,4 +1,5 @@
 AUDITOR_APPS = (
+    'stats.apps.StatsConfig',
     'notifier.apps.NotifierConfig',
     'activitylogs.apps.ActivityLogsConfig',
     'tracker.apps.TrackerConfig',
@@ -80,6 +80,7 @@ class Intervals(object):
     CLUSTERS_NOTIFICATION_ALIVE = 150
     CLEAN_ACTIVITY_LOGS = 300
     CLEAN_NOTIFICATIONS = 300
+    QUERY_INDEX_KEYS = 3600
 
     @staticmethod
     def get_schedule(interval):
@@ -122,6 +123,7 @@ class CronsCeleryTasks(object):
     CLUSTERS_UPDATE_SYSTEM_INFO = 'clusters_update_system_info'
     CLEAN_ACTIVITY_LOGS = 'clean_activity_logs'
     CLEAN_NOTIFICATIONS = 'clean_notifications'
+    QUERY_INDEX_KEYS = 'query_index_keys'
 
 
 class ReposCeleryTasks(object):
@@ -227,6 +229,11 @@ class HPCeleryTasks(object):
     HP_BO_CREATE = 'hp_bo_create'
     HP_BO_START = 'hp_bo_start'
     HP_BO_ITERATE = 'hp_bo_iterate'
+    HP_TPE_CREATE = 'hp_tpe_create'
+    HP_TPE_START = 'hp_tpe_start'
+    HP_TPE_ITERATE = 'hp_tpe_iterate'
+
+    HP_EARLY_STOPPING = 'hp_early_stopping'
 
 
 class DockerizerCeleryTasks(object):
@@ -390,6 +397,8 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.CRONS_CLEAN},
     CronsCeleryTasks.CLEAN_NOTIFICATIONS:
         {'queue': CeleryQueues.CRONS_CLEAN},
+    CronsCeleryTasks.QUERY_INDEX_KEYS:
+        {'queue': CeleryQueues.CRONS_CLEAN},
 
     # HP health
     HPCeleryTasks.HP_HEALTH:
@@ -417,6 +426,14 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.HP},
     HPCeleryTasks.HP_BO_ITERATE:
         {'queue': CeleryQueues.HP},
+    HPCeleryTasks.HP_TPE_CREATE:
+        {'queue': CeleryQueues.HP},
+    HPCeleryTasks.HP_TPE_START:
+        {'queue': CeleryQueues.HP},
+    HPCeleryTasks.HP_TPE_ITERATE:
+        {'queue': CeleryQueues.HP},
+    HPCeleryTasks.HP_EARLY_STOPPING:
+        {'queue': CeleryQueues.HP},
 
     # Events health
     EventsCeleryTasks.EVENTS_HEALTH:
@@ -493,4 +510,11 @@ CELERY_BEAT_SCHEDULE = {
             'expires': Intervals.get_expires(Intervals.CLEAN_NOTIFICATIONS),
         },
     },
+    CronsCeleryTasks.QUERY_INDEX_KEYS + '_beat': {
+        'task': CronsCeleryTasks.QUERY_INDEX_KEYS,
+        'schedule': Intervals.get_schedule(Intervals.QUERY_INDEX_KEYS),
+        'options': {
+            'expires': Intervals.get_expires(Intervals.QUERY_INDEX_KEYS),
+        },
+    },
 }
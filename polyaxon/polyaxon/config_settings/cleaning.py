@@ -10,3 +10,8 @@ class CleaningIntervals(object):
         'POLYAXON_CLEANING_INTERVALS_NOTIFICATIONS',
         is_optional=True,
         default=30)
+    # The number of rows deleted per transaction
+    BATCH_SIZE = config.get_int(
+        'POLYAXON_CLEANING_BATCH_SIZE',
+        is_optional=True,
+        default=10000)
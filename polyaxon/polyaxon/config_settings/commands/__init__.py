@@ -1,5 +1,6 @@
 from polyaxon.config_settings.dirs import *
 from polyaxon.config_settings.k8s import *
+from polyaxon.config_settings.query_indexes import *
 from polyaxon.config_settings.spawner import *
 
 from .apps import *
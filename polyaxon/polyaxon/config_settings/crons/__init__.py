@@ -1,4 +1,5 @@
 from polyaxon.config_settings.notification_urls import *
 from polyaxon.config_settings.cleaning import *
+from polyaxon.config_settings.query_indexes import *
 
 from .apps import *
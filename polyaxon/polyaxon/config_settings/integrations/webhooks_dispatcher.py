@@ -0,0 +1,33 @@
+from polyaxon.config_manager import config
+
+
+class WebHooksDispatcher(object):
+    """The delivery of the web hooks, by a pool of workers."""
+    WORKERS = config.get_int(
+        'POLYAXON_WEBHOOKS_DISPATCHER_WORKERS',
+        is_optional=True,
+        default=8)
+    # Requests per second to each host
+    RATE_LIMIT = config.get_int(
+        'POLYAXON_WEBHOOKS_DISPATCHER_RATE_LIMIT',
+        is_optional=True,
+        default=5)
+    MAX_RETRIES = config.get_int(
+        'POLYAXON_WEBHOOKS_DISPATCHER_MAX_RETRIES',
+        is_optional=True,
+        default=3)
+    # Milliseconds before the first retry, doubled for each following retry
+    BACKOFF = config.get_int(
+        'POLYAXON_WEBHOOKS_DISPATCHER_BACKOFF',
+        is_optional=True,
+        default=500)
+    # Seconds
+    TIMEOUT = config.get_int(
+        'POLYAXON_WEBHOOKS_DISPATCHER_TIMEOUT',
+        is_optional=True,
+        default=10)
+    # Deliveries waiting to be sent or retried, the next web hooks are dead lettered
+    QUEUE_SIZE = config.get_int(
+        'POLYAXON_WEBHOOKS_DISPATCHER_QUEUE_SIZE',
+        is_optional=True,
+        default=1000)
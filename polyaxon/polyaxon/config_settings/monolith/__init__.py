@@ -12,6 +12,7 @@ from polyaxon.config_settings.persistence_logs import *
 from polyaxon.config_settings.persistence_outputs import *
 from polyaxon.config_settings.persistence_repos import *
 from polyaxon.config_settings.persistence_upload import *
+from polyaxon.config_settings.query_indexes import *
 from polyaxon.config_settings.registration import *
 from polyaxon.config_settings.registry import *
 from polyaxon.config_settings.rest import *
@@ -0,0 +1,13 @@
+from polyaxon.config_manager import config
+
+
+class QueryIndexes(object):
+    """The indexes created for the most queried metric and declaration keys."""
+    MIN_HITS = config.get_int(
+        'POLYAXON_QUERY_INDEXES_MIN_HITS',
+        is_optional=True,
+        default=20)
+    MAX_KEYS = config.get_int(
+        'POLYAXON_QUERY_INDEXES_MAX_KEYS',
+        is_optional=True,
+        default=10)
@@ -14,3 +14,13 @@ class RedisPools(object):
         config.get_string('POLYAXON_REDIS_EPHEMERAL_TOKENS_URL'))
     TTL = redis.ConnectionPool.from_url(
         config.get_string('POLYAXON_REDIS_TTL_URL'))
+    GROUP_METRICS = redis.ConnectionPool.from_url(
+        config.get_string('POLYAXON_REDIS_GROUP_METRICS_URL'))
+    QUERY_KEYS = redis.ConnectionPool.from_url(
+        config.get_string('POLYAXON_REDIS_QUERY_KEYS_URL'))
+    WEBHOOKS = redis.ConnectionPool.from_url(
+        config.get_string('POLYAXON_REDIS_WEBHOOKS_URL'))
+    ACTIVITY_VIEWS = redis.ConnectionPool.from_url(
+        config.get_string('POLYAXON_REDIS_ACTIVITY_VIEWS_URL'))
+    RECIPIENTS = redis.ConnectionPool.from_url(
+        config.get_string('POLYAXON_REDIS_RECIPIENTS_URL'))
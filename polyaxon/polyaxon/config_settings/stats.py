@@ -8,3 +8,35 @@ STATS_BACKEND = config.get_string(
     is_optional=True,
     default=STATS_BACKEND_NOOP,
     options=(STATS_BACKEND_NOOP, STATS_BACKEND_DATADOG, STATS_BACKEND_STATSD))
+
+DEFAULT_STATS_PREFIX = config.get_string(
+    'POLYAXON_STATS_DEFAULT_PREFIX',
+    is_optional=True,
+    default='polyaxon')
+
+
+class StatsStatsd(object):
+    """The statsd server of the statsd stats backend."""
+    HOST = config.get_string(
+        'POLYAXON_STATSD_HOST',
+        is_optional=True,
+        default='localhost')
+    PORT = config.get_int(
+        'POLYAXON_STATSD_PORT',
+        is_optional=True,
+        default=8125)
+
+
+class StatsBatch(object):
+    """The batches of the stats, sent when full and periodically, the datadog backend
+    only sends them periodically.
+    """
+    SIZE = config.get_int(
+        'POLYAXON_STATS_BATCH_SIZE',
+        is_optional=True,
+        default=50)
+    # Seconds between the flushes of the stats
+    INTERVAL = config.get_int(
+        'POLYAXON_STATS_BATCH_INTERVAL',
+        is_optional=True,
+        default=10)
@@ -2,8 +2,28 @@ from polyaxon.config_manager import config
 
 TRACKER_BACKEND_NOOP = 'noop'
 TRACKER_BACKEND_PUBLISHER = 'publisher'
+TRACKER_BACKEND_BATCHED_PUBLISHER = 'batched_publisher'
 TRACKER_BACKEND = config.get_string(
     'POLYAXON_TRACKER_BACKEND',
     is_optional=True,
     default=TRACKER_BACKEND_NOOP,
-    options=(TRACKER_BACKEND_NOOP, TRACKER_BACKEND_PUBLISHER))
+    options=(TRACKER_BACKEND_NOOP,
+             TRACKER_BACKEND_PUBLISHER,
+             TRACKER_BACKEND_BATCHED_PUBLISHER))
+
+
+class TrackerBuffer(object):
+    """The bounded buffer of the batched publisher tracker's events."""
+    SIZE = config.get_int(
+        'POLYAXON_TRACKER_BUFFER_SIZE',
+        is_optional=True,
+        default=10000)
+    BATCH_SIZE = config.get_int(
+        'POLYAXON_TRACKER_BATCH_SIZE',
+        is_optional=True,
+        default=100)
+    # Seconds between the uploads of the buffered events
+    WINDOW = config.get_int(
+        'POLYAXON_TRACKER_WINDOW',
+        is_optional=True,
+        default=10)
@@ -49,8 +49,11 @@ class BaseOperatorCondition(BaseCondition):
     def __eq__(self, other):
         return self.operator == other.operator
 
+    def get_q(self, name, params):
+        return self.operator(name=name, params=params)
+
     def apply(self, queryset, name, params):
-        return queryset.filter(self.operator(name=name, params=params))
+        return queryset.filter(self.get_q(name=name, params=params))
 
 
 class CallbackCondition(BaseCondition):
@@ -0,0 +1,87 @@
+import hashlib
+
+from django.db import connection
+
+from db.redis.query_keys import RedisQueryKeys
+
+INDEX_PREFIX = 'qk'
+
+
+def record_json_key(model, field, key):
+    """Count a filter or an ordering on the key of a model's json field."""
+    RedisQueryKeys.increment(table=model._meta.db_table, field=field, key=key)
+
+
+def get_json_key_index_name(model, field, key):
+    # Postgres identifiers are limited to 63 characters, the key is hashed
+    key_hash = hashlib.md5(key.encode()).hexdigest()[:16]
+    return '{}_{}_{}_{}'.format(INDEX_PREFIX, model._meta.db_table, field, key_hash)[:63]
+
+
+def get_json_key_lookup(key):
+    # Same as django's `KeyTransform`, integer keys are array indexes
+    try:
+        return str(int(key))
+    except ValueError:
+        return "'{}'".format(key.replace("'", "''"))
+
+
+def get_json_key_index_sql(model, field, key, concurrently=True):
+    """The index on `(project_id, field -> 'key')`.
+
+    The expression is the one generated by django for the key lookups and the key orderings,
+    e.g. `last_metric__loss__lte=0.8` or `KeyTransform('loss', 'last_metric')`,
+    so that postgres uses the index for the filters and the orderings of a project's rows.
+    """
+    return 'CREATE INDEX {concurrently}IF NOT EXISTS "{name}" ON "{table}" ' \
+           '("project_id", ("{field}" -> {lookup}))'.format(
+               concurrently='CONCURRENTLY ' if concurrently else '',
+               name=get_json_key_index_name(model=model, field=field, key=key),
+               table=model._meta.db_table,
+               field=field,
+               lookup=get_json_key_lookup(key))
+
+
+def create_json_key_index(model, field, key, concurrently=True):
+    """Create the index of a json key.
+
+    N.B. indexes can only be created concurrently outside of a transaction.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(get_json_key_index_sql(model=model,
+                                              field=field,
+                                              key=key,
+                                              concurrently=concurrently))
+
+
+def get_json_key_indexes(model, field):
+    """Return the names of the existing indexes of a json field's keys."""
+    prefix = '{}_{}_{}_'.format(INDEX_PREFIX, model._meta.db_table, field)
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT indexname FROM pg_indexes WHERE tablename = %s',
+                       [model._meta.db_table])
+        return {row[0] for row in cursor.fetchall() if row[0].startswith(prefix)}
+
+
+def index_json_keys(model, field, min_hits, max_keys, concurrently=True):
+    """Index the most queried keys of a json field, up to `max_keys` indexes per field.
+
+    Returns:
+        list: the keys indexed.
+    """
+    indexes = get_json_key_indexes(model=model, field=field)
+    indexed_keys = []
+    keys = RedisQueryKeys.get_keys(table=model._meta.db_table,
+                                   field=field,
+                                   min_hits=min_hits,
+                                   count=max_keys)
+    for key in keys:
+        if len(indexes) >= max_keys:
+            break
+        index_name = get_json_key_index_name(model=model, field=field, key=key)
+        if index_name in indexes:
+            continue
+        create_json_key_index(model=model, field=field, key=key, concurrently=concurrently)
+        indexes.add(index_name)
+        indexed_keys.append(key)
+    return indexed_keys
@@ -1,13 +1,50 @@
-from query.builder import QueryCondSpec
+from collections import namedtuple
+from functools import lru_cache
+
+from django.db.models import Q
+
+from query.builder import BaseOperatorCondition, QueryCondSpec
 from query.exceptions import QueryError
+from query.indexes import record_json_key
 from query.parser import parse_field, tokenize_query
 
+COMPILED_QUERIES_CACHE_SIZE = 1024
+
+
+class CompiledQuery(namedtuple("CompiledQuery", "q callbacks indexed_keys")):
+    """A query spec compiled to a single `Q` tree.
+
+    The callback conditions can not be expressed as a `Q` and are kept as
+    (callback, params, negation), the indexed keys are the (field, key) to record on every apply.
+    """
+
+
+@lru_cache(maxsize=COMPILED_QUERIES_CACHE_SIZE)
+def compile_query(manager, query_spec):
+    q = Q()
+    callbacks = []
+    indexed_keys = []
+    for key, cond_specs in manager.handle_query(query_spec=query_spec).items():
+        field, suffix = parse_field(key)
+        if suffix and field in manager.INDEXED_FIELDS:
+            indexed_keys.append((manager.FIELDS_PROXY.get(field, field), suffix))
+        name = manager.proxy_field(key)
+        for cond_spec in cond_specs:
+            if isinstance(cond_spec.cond, BaseOperatorCondition):
+                q &= cond_spec.cond.get_q(name=name, params=cond_spec.params)
+            else:
+                callbacks.append(
+                    (cond_spec.cond.callback, cond_spec.params, cond_spec.cond.negation))
+    return CompiledQuery(q=q, callbacks=tuple(callbacks), indexed_keys=tuple(indexed_keys))
+
 
 class BaseQueryManager(object):
     NAME = None
     FIELDS_PROXY = {}
     PARSERS_BY_FIELD = {}
     CONDITIONS_BY_FIELD = {}
+    # Json fields whose keys are recorded to index the most queried ones
+    INDEXED_FIELDS = ()
 
     @classmethod
     def proxy_field(cls, field):
@@ -55,13 +92,19 @@ class BaseQueryManager(object):
         built_query = cls.build(parsed_query=parsed_query)
         return built_query
 
+    @classmethod
+    def compile(cls, query_spec):
+        """Return the compiled query, cached by manager and query spec."""
+        return compile_query(cls, query_spec)
+
     @classmethod
     def apply(cls, query_spec, queryset):
-        built_query = cls.handle_query(query_spec=query_spec)
-        for key, cond_specs in built_query.items():
-            key = cls.proxy_field(key)
-            for cond_spec in cond_specs:
-                queryset = cond_spec.cond.apply(
-                    queryset=queryset, name=key, params=cond_spec.params)
+        compiled_query = cls.compile(query_spec=query_spec)
+        for field, key in compiled_query.indexed_keys:
+            record_json_key(model=queryset.model, field=field, key=key)
+        if compiled_query.q:
+            queryset = queryset.filter(compiled_query.q)
+        for callback, params, negation in compiled_query.callbacks:
+            queryset = callback(queryset, params, negation)
 
         return queryset
@@ -27,6 +27,7 @@ class ExperimentQueryManager(BaseQueryManager):
         'build': 'build_job',
         'commit': 'code_reference__commit',
     }
+    INDEXED_FIELDS = ('metric', 'declarations')
     PARSERS_BY_FIELD = {
         # Id
         'id': parse_value_operation,
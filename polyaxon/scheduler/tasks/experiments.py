@@ -113,6 +113,7 @@ def experiments_set_metrics(experiment_id, data):
         serializer.is_valid(raise_exception=True)
     except ValidationError:
         _logger.error('Could not create metrics, a validation error was raised.')
+        return
 
     serializer.save(experiment=experiment)
 
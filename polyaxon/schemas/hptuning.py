@@ -1,19 +1,134 @@
+from marshmallow import (
+    Schema,
+    ValidationError,
+    fields,
+    post_dump,
+    post_load,
+    validate,
+    validates_schema
+)
+
 from polyaxon_schemas.hptuning import (  # noqa
     BOConfig,
     EarlyStoppingMetricConfig,
     GaussianProcessConfig,
     GridSearchConfig,
-    HPTuningConfig,
     HyperbandConfig,
     RandomSearchConfig,
     ResourceConfig,
     SearchMetricConfig,
     UtilityFunctionConfig
 )
+from polyaxon_schemas.hptuning import HPTuningConfig as BaseHPTuningConfig
 from polyaxon_schemas.matrix import MatrixConfig  # noqa
 from polyaxon_schemas.utils import (  # noqa
     AcquisitionFunctions,
     GaussianProcessesKernels,
-    Optimization,
-    SearchAlgorithms
+    Optimization
 )
+from polyaxon_schemas.utils import SearchAlgorithms as BaseSearchAlgorithms
+from schemas.base import BaseConfig
+
+
+class SearchAlgorithms(BaseSearchAlgorithms):
+    TPE = 'tpe'
+
+    TPE_VALUES = [TPE, TPE.upper(), TPE.capitalize()]
+
+    @classmethod
+    def is_tpe(cls, value):
+        return value in cls.TPE_VALUES
+
+
+class TPESchema(Schema):
+    n_initial_trials = fields.Int(validate=validate.Range(min=1))
+    n_iterations = fields.Int(validate=validate.Range(min=1))
+    metric = fields.Nested(SearchMetricConfig.SCHEMA)
+    n_suggestions = fields.Int(validate=validate.Range(min=1))
+    gamma = fields.Float(validate=validate.Range(min=0, max=1))
+    n_ei_candidates = fields.Int(validate=validate.Range(min=1))
+    prior_weight = fields.Float(validate=validate.Range(min=0))
+
+    class Meta:
+        ordered = True
+
+    @post_load
+    def make(self, data):
+        return TPEConfig(**data)
+
+    @post_dump
+    def unmake(self, data):
+        return TPEConfig.remove_reduced_attrs(data)
+
+
+class TPEConfig(BaseConfig):
+    """
+    Tree-structured Parzen Estimator config.
+
+    Args:
+        n_initial_trials: `int`. The number of random trials before using the estimators.
+        n_iterations: `int`. The number of iterations after the initial trials.
+        metric: `SearchMetricConfig`. The metric to optimize.
+        n_suggestions: `int`. The number of suggestions per iteration.
+        gamma: `float`. The quantile of observations used to estimate the good density.
+        n_ei_candidates: `int`. The number of candidates sampled to maximize
+            the expected improvement.
+        prior_weight: `float`. The weight of the prior in the estimated densities.
+    """
+    SCHEMA = TPESchema
+    IDENTIFIER = 'tpe'
+
+    def __init__(self,
+                 n_initial_trials,
+                 n_iterations,
+                 metric,
+                 n_suggestions=1,
+                 gamma=0.25,
+                 n_ei_candidates=24,
+                 prior_weight=1.):
+        self.n_initial_trials = n_initial_trials
+        self.n_iterations = n_iterations
+        self.metric = metric
+        self.n_suggestions = n_suggestions
+        self.gamma = gamma
+        self.n_ei_candidates = n_ei_candidates
+        self.prior_weight = prior_weight
+
+
+class HPTuningSchema(BaseHPTuningConfig.SCHEMA):
+    SEARCH_ALGORITHMS = ('grid_search', 'random_search', 'hyperband', 'bo', 'tpe')
+
+    tpe = fields.Nested(TPESchema, allow_none=True)
+
+    @validates_schema
+    def validate_search_algorithm(self, data):
+        algorithms = [key for key in self.SEARCH_ALGORITHMS if data.get(key) is not None]
+        if len(algorithms) > 1:
+            raise ValidationError(
+                'Only one search algorithm can be used, received `{}`.'.format(algorithms))
+
+    @post_load
+    def make(self, data):
+        return HPTuningConfig(**data)
+
+    @post_dump
+    def unmake(self, data):
+        return HPTuningConfig.remove_reduced_attrs(data)
+
+
+class HPTuningConfig(BaseHPTuningConfig):
+    """The polyaxonfile's hptuning config extended with the search algorithms
+    only supported by hpsearch, e.g. tpe.
+    """
+    SCHEMA = HPTuningSchema
+    REDUCED_ATTRIBUTES = list(BaseHPTuningConfig.REDUCED_ATTRIBUTES or []) + ['tpe']
+
+    def __init__(self, tpe=None, **kwargs):
+        super().__init__(**kwargs)
+        self.tpe = tpe
+
+    @property
+    def search_algorithm(self):
+        if self.tpe:
+            return SearchAlgorithms.TPE
+        return super().search_algorithm
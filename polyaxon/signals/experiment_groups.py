@@ -6,6 +6,8 @@ import auditor
 
 from constants.experiment_groups import ExperimentGroupLifeCycle
 from db.models.experiment_groups import ExperimentGroup, ExperimentGroupStatus
+from db.redis.group_metrics import RedisGroupMetrics
+from db.redis.group_stats import RedisGroupStats
 from event_manager.events.experiment_group import (
     EXPERIMENT_GROUP_CREATED,
     EXPERIMENT_GROUP_DELETED,
@@ -13,6 +15,7 @@ from event_manager.events.experiment_group import (
     EXPERIMENT_GROUP_NEW_STATUS,
     EXPERIMENT_GROUP_STOPPED
 )
+from hpsearch.schemas import get_specification_hptuning
 from libs.decorators import check_specification, ignore_raw, ignore_updates, ignore_updates_pre
 from libs.paths.experiment_groups import (
     delete_experiment_group_logs,
@@ -21,7 +24,7 @@ from libs.paths.experiment_groups import (
 from libs.repos.utils import assign_code_reference
 from polyaxon.celery_api import app as celery_app
 from polyaxon.settings import SchedulerCeleryTasks
-from schemas.hptuning import SearchAlgorithms
+from schemas.hptuning import HPTuningConfig, SearchAlgorithms
 from signals.run_time import set_finished_at, set_started_at
 from signals.utils import remove_bookmarks, set_persistence, set_tags
 
@@ -35,9 +38,8 @@ def experiment_group_pre_save(sender, **kwargs):
     assign_code_reference(instance)
     # Check if params need to be set
     if not instance.hptuning and instance.specification:
-        hptuning_config = instance.specification.hptuning
-        hptuning = hptuning_config.to_dict()
-        if hptuning_config.search_algorithm == SearchAlgorithms.GRID:
+        hptuning = get_specification_hptuning(instance.specification)
+        if HPTuningConfig.from_dict(hptuning).search_algorithm == SearchAlgorithms.GRID:
             hptuning['grid_search'] = hptuning.get('grid_search', {})
         instance.hptuning = hptuning
     set_tags(instance=instance)
@@ -92,6 +94,8 @@ def experiment_group_post_delete(sender, **kwargs):
     auditor.record(event_type=EXPERIMENT_GROUP_DELETED,
                    instance=instance)
     remove_bookmarks(object_id=instance.id, content_type='experimentgroup')
+    RedisGroupMetrics.clear(experiment_group_id=instance.id)
+    RedisGroupStats.clear(experiment_group_id=instance.id)
 
 
 @receiver(post_save, sender=ExperimentGroupStatus, dispatch_uid="experiment_group_status_post_save")
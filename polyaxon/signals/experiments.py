@@ -11,12 +11,12 @@ from db.models.cloning_strategies import CloningStrategy
 from db.models.experiment_groups import ExperimentGroup
 from db.models.experiment_jobs import ExperimentJob, ExperimentJobStatus
 from db.models.experiments import Experiment, ExperimentMetric, ExperimentStatus
+from db.redis.group_stats import RedisGroupStats
 from db.redis.tll import RedisTTL
 from event_manager.events.experiment import (
     EXPERIMENT_DELETED,
     EXPERIMENT_DONE,
     EXPERIMENT_FAILED,
-    EXPERIMENT_NEW_METRIC,
     EXPERIMENT_NEW_STATUS,
     EXPERIMENT_STOPPED,
     EXPERIMENT_SUCCEEDED
@@ -105,6 +105,8 @@ def experiment_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=EXPERIMENT_DELETED, instance=instance)
     remove_bookmarks(object_id=instance.id, content_type='experiment')
+    if instance.experiment_group_id:
+        RedisGroupStats.clear(experiment_group_id=instance.experiment_group_id)
 
 
 @receiver(post_save, sender=ExperimentJob, dispatch_uid="experiment_job_post_save")
@@ -161,6 +163,8 @@ def experiment_status_post_save(sender, **kwargs):
                     status=instance.status,
                     is_done=ExperimentLifeCycle.is_done)
     experiment.save(update_fields=['status', 'started_at', 'finished_at'])
+    if experiment.experiment_group_id:
+        RedisGroupStats.clear(experiment_group_id=experiment.experiment_group_id)
     auditor.record(event_type=EXPERIMENT_NEW_STATUS,
                    instance=experiment,
                    previous_status=previous_status)
@@ -194,18 +198,7 @@ def experiment_status_post_save(sender, **kwargs):
 @ignore_raw
 def experiment_metric_post_save(sender, **kwargs):
     instance = kwargs['instance']
-    experiment = instance.experiment
-
-    # update experiment last_metric
-    def update_metric(last_metrics, metrics):
-        last_metrics.update(metrics)
-        return last_metrics
-
-    experiment.last_metric = update_metric(last_metrics=experiment.last_metric,
-                                           metrics=instance.values)
-    experiment.save(update_fields=['last_metric'])
-    auditor.record(event_type=EXPERIMENT_NEW_METRIC,
-                   instance=experiment)
+    instance.experiment.add_metrics(metrics=[instance])
 
 
 @receiver(post_save, sender=Experiment, dispatch_uid="start_new_experiment")
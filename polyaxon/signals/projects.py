@@ -4,6 +4,7 @@ from django.dispatch import receiver
 import auditor
 
 from db.models.projects import Project
+from db.redis.recipients import RedisRecipients
 from event_manager.events.project import PROJECT_DELETED
 from libs.decorators import ignore_raw, ignore_updates
 from libs.paths.projects import delete_project_logs, delete_project_outputs, delete_project_repos
@@ -21,6 +22,14 @@ def project_post_save(sender, **kwargs):
     delete_project_repos(instance.unique_name)
 
 
+@receiver(post_save, sender=Project, dispatch_uid="project_recipients_post_save")
+@ignore_raw
+def project_recipients_post_save(sender, **kwargs):
+    instance = kwargs['instance']
+    # The owner of the project might have changed
+    RedisRecipients.clear_project(instance.id)
+
+
 @receiver(pre_delete, sender=Project, dispatch_uid="project_pre_delete")
 @ignore_raw
 def project_pre_delete(sender, **kwargs):
@@ -37,3 +46,4 @@ def project_post_deleted(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=PROJECT_DELETED, instance=instance)
     remove_bookmarks(object_id=instance.id, content_type='project')
+    RedisRecipients.clear_project(instance.id)
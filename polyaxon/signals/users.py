@@ -1,11 +1,12 @@
 from rest_framework.authtoken.models import Token
 
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 
 import auditor
 
+from db.redis.recipients import RedisRecipients
 from event_manager.events.user import USER_REGISTERED, USER_UPDATED
 from libs.decorators import ignore_raw
 
@@ -18,6 +19,14 @@ def create_auth_token(sender, instance=None, created=False, **kwargs):
         auditor.record(event_type=USER_REGISTERED, instance=instance)
     else:
         auditor.record(event_type=USER_UPDATED, instance=instance)
+        # The email of the user might have changed
+        RedisRecipients.clear_user(instance.id)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid="user_deleted")
+@ignore_raw
+def user_post_deleted(sender, **kwargs):
+    RedisRecipients.clear_user(kwargs['instance'].id)
 
 
 # A new user has registered.
@@ -14,9 +14,22 @@ def get_stats_backend():
     return ''
 
 
+def get_backend_options():
+    if settings.STATS_BACKEND == settings.STATS_BACKEND_DATADOG:
+        return {'flush_interval': settings.StatsBatch.INTERVAL}
+    if settings.STATS_BACKEND == settings.STATS_BACKEND_STATSD:
+        return {
+            'host': settings.StatsStatsd.HOST,
+            'port': settings.StatsStatsd.PORT,
+            'batch_size': settings.StatsBatch.SIZE,
+            'batch_interval': settings.StatsBatch.INTERVAL,
+        }
+    return {}
+
+
 backend = LazyServiceWrapper(
     backend_base=BaseStatsBackend,
     backend_path=get_stats_backend(),
-    options={}
+    options=get_backend_options()
 )
 backend.expose(locals())
@@ -1,10 +1,17 @@
+import time
+
+from contextlib import contextmanager
 from random import random
 from threading import local
 
 from django.conf import settings
 
+from libs.services import Service
+
+
+class BaseStatsBackend(local, Service):
+    __all__ = ('incr', 'timing', 'histogram', 'gauge', 'timer', 'flush')
 
-class BaseStatsBackend(local):
     def __init__(self, prefix=None):  # pylint:disable=super-init-not-called
         if prefix is None:
             prefix = settings.DEFAULT_STATS_PREFIX
@@ -21,5 +28,47 @@ class BaseStatsBackend(local):
     def _incr(self, key, amount=1, sample_rate=1, **kwargs):
         raise NotImplementedError
 
+    def _timing(self, key, value, sample_rate=1, **kwargs):
+        raise NotImplementedError
+
+    def _histogram(self, key, value, sample_rate=1, **kwargs):
+        raise NotImplementedError
+
+    def _gauge(self, key, value, sample_rate=1, **kwargs):
+        raise NotImplementedError
+
+    def _flush(self):
+        pass
+
     def incr(self, key, amount=1, sample_rate=1, **kwargs):
         self._incr(key=self._get_key(key), amount=amount, sample_rate=sample_rate, **kwargs)
+
+    def timing(self, key, value, sample_rate=1, **kwargs):
+        """Record a duration `value` in milliseconds."""
+        self._timing(key=self._get_key(key), value=value, sample_rate=sample_rate, **kwargs)
+
+    def histogram(self, key, value, sample_rate=1, **kwargs):
+        self._histogram(key=self._get_key(key), value=value, sample_rate=sample_rate, **kwargs)
+
+    def gauge(self, key, value, sample_rate=1, **kwargs):
+        self._gauge(key=self._get_key(key), value=value, sample_rate=sample_rate, **kwargs)
+
+    @contextmanager
+    def timer(self, key, sample_rate=1, **kwargs):
+        """Record the duration of the block.
+
+        >>> with timer('auditor.record'):
+        >>>     ...
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timing(key=key,
+                        value=(time.perf_counter() - start) * 1000,
+                        sample_rate=sample_rate,
+                        **kwargs)
+
+    def flush(self):
+        """Send the stats batched by the current thread."""
+        self._flush()
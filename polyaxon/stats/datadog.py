@@ -9,9 +9,12 @@ from stats.base import BaseStatsBackend
 
 
 class DatadogStatsBackend(BaseStatsBackend):
-    def __init__(self, prefix=None, host=None, tags=None, **kwargs):
+    """Sends the stats in batches, aggregated and flushed every `flush_interval` seconds."""
+
+    def __init__(self, prefix=None, host=None, tags=None, flush_interval=10, **kwargs):
         self.tags = tags
         self.host = host or get_hostname()
+        self.flush_interval = flush_interval
         initialize(**kwargs)
         super().__init__(prefix=prefix)
 
@@ -25,11 +28,39 @@ class DatadogStatsBackend(BaseStatsBackend):
     @cached_property
     def stats(self):
         instance = ThreadStats()
-        instance.start()
+        instance.start(flush_interval=self.flush_interval)
         return instance
 
+    def _get_tags(self, **kwargs):
+        return kwargs.get('tags', []) + (self.tags or [])
+
     def _incr(self, key, amount=1, sample_rate=1, **kwargs):
-        tags = kwargs.get('tags', [])
-        if self.tags:
-            tags += self.tags
-        self.stats.increment(key, amount, sample_rate=sample_rate, tags=tags, host=self.host)
+        self.stats.increment(key,
+                             amount,
+                             sample_rate=sample_rate,
+                             tags=self._get_tags(**kwargs),
+                             host=self.host)
+
+    def _timing(self, key, value, sample_rate=1, **kwargs):
+        self.stats.timing(key,
+                          value,
+                          sample_rate=sample_rate,
+                          tags=self._get_tags(**kwargs),
+                          host=self.host)
+
+    def _histogram(self, key, value, sample_rate=1, **kwargs):
+        self.stats.histogram(key,
+                             value,
+                             sample_rate=sample_rate,
+                             tags=self._get_tags(**kwargs),
+                             host=self.host)
+
+    def _gauge(self, key, value, sample_rate=1, **kwargs):
+        self.stats.gauge(key,
+                         value,
+                         sample_rate=sample_rate,
+                         tags=self._get_tags(**kwargs),
+                         host=self.host)
+
+    def _flush(self):
+        self.stats.flush()
@@ -1,13 +1,112 @@
 # pylint:disable=import-error
+import atexit
+import logging
+import os
+import threading
+import time
+
 import statsd
 
 from stats.base import BaseStatsBackend
 
+_logger = logging.getLogger('polyaxon.stats')
+
+
+class StatsdBatch(object):
+    """The stats recorded by a thread, sent at once in a pipeline."""
+
+    def __init__(self, client):
+        self.client = client
+        self.pipeline = client.pipeline()
+        self.count = 0
+        self.thread = threading.current_thread()
+        self.pid = None
+        self._lock = threading.Lock()
+
+    def add(self, record, *args):
+        """Record a stat with the pipeline's `record` method and return the size of the batch."""
+        with self._lock:
+            getattr(self.pipeline, record)(*args)
+            self.count += 1
+            return self.count
+
+    def send(self):
+        with self._lock:
+            if not self.count:
+                return
+            pipeline, self.pipeline = self.pipeline, self.client.pipeline()
+            self.count = 0
+        pipeline.send()
+
 
 class StatsdStatsBackend(BaseStatsBackend):
-    def __init__(self, prefix=None, host='localhost', port=8125):
+    """Sends the stats in batches, every thread batches its stats in a pipeline.
+
+    A batch is sent when it holds `batch_size` stats, and the batches of all the threads
+    are sent every `batch_interval` seconds by a flusher thread and when the process exits.
+    The histograms are sent as timings, statsd does not have histograms.
+    """
+
+    _batches = set()
+    _batches_lock = threading.Lock()
+    _pid = None
+
+    def __init__(self, prefix=None, host='localhost', port=8125, batch_size=50, batch_interval=10):
         self.client = statsd.StatsClient(host=host, port=port)
+        self.batch = StatsdBatch(client=self.client)
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
         super().__init__(prefix=prefix)
 
+    def register_batch(self):
+        cls = type(self)
+        with cls._batches_lock:
+            # The flusher is started by the first stat of every process, e.g. after a fork
+            if cls._pid != os.getpid():
+                cls._pid = os.getpid()
+                cls._batches = set()
+                threading.Thread(target=self.flush_periodically,
+                                 name='stats-flusher',
+                                 daemon=True).start()
+                atexit.register(cls.flush_batches)
+            self.batch.thread = threading.current_thread()
+            self.batch.pid = os.getpid()
+            cls._batches.add(self.batch)
+
+    @classmethod
+    def flush_batches(cls):
+        """Send the batches of all the threads, and forget the batches of the finished threads."""
+        with cls._batches_lock:
+            batches = list(cls._batches)
+            cls._batches = {batch for batch in batches if batch.thread.is_alive()}
+        for batch in batches:
+            batch.send()
+
+    def flush_periodically(self):
+        while True:
+            time.sleep(self.batch_interval)
+            try:
+                self.flush_batches()
+            except Exception as e:
+                _logger.warning('Failed to send the stats: %s', e, exc_info=True)
+
+    def _add(self, record, *args):
+        if self.batch.pid != os.getpid():
+            self.register_batch()
+        if self.batch.add(record, *args) >= self.batch_size:
+            self.batch.send()
+
     def _incr(self, key, amount=1, sample_rate=1, **kwargs):
-        self.client.incr(key, amount, sample_rate)
+        self._add('incr', key, amount, sample_rate)
+
+    def _timing(self, key, value, sample_rate=1, **kwargs):
+        self._add('timing', key, value, sample_rate)
+
+    def _histogram(self, key, value, sample_rate=1, **kwargs):
+        self._add('timing', key, value, sample_rate)
+
+    def _gauge(self, key, value, sample_rate=1, **kwargs):
+        self._add('gauge', key, value, sample_rate)
+
+    def _flush(self):
+        self.batch.send()
@@ -11,6 +11,8 @@ def get_tracker_backend():
         return 'tracker.service.TrackerService'
     if settings.TRACKER_BACKEND == settings.TRACKER_BACKEND_PUBLISHER:
         return 'tracker.publish_tracker.PublishTrackerService'
+    if settings.TRACKER_BACKEND == settings.TRACKER_BACKEND_BATCHED_PUBLISHER:
+        return 'tracker.batched_publish_tracker.BatchedPublishTrackerService'
     return ''
 
 
@@ -19,6 +21,13 @@ def get_backend_options():
         return {}
     if settings.TRACKER_BACKEND == settings.TRACKER_BACKEND_PUBLISHER:
         return {'key': config.tracker_key}
+    if settings.TRACKER_BACKEND == settings.TRACKER_BACKEND_BATCHED_PUBLISHER:
+        return {
+            'key': config.tracker_key,
+            'buffer_size': settings.TrackerBuffer.SIZE,
+            'batch_size': settings.TrackerBuffer.BATCH_SIZE,
+            'window': settings.TrackerBuffer.WINDOW,
+        }
     return {}
 
 
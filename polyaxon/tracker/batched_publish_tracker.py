@@ -0,0 +1,121 @@
+import logging
+import os
+import queue
+import threading
+import time
+
+import analytics
+
+from analytics.request import post
+
+from django.db import close_old_connections
+
+import stats
+
+from tracker.publish_tracker import PublishTrackerService
+
+_logger = logging.getLogger('polyaxon.tracker')
+
+
+class BatchedPublishTrackerService(PublishTrackerService):
+    """A publisher tracker uploading the events in batches from a background thread.
+
+    Recording an event only puts its serialized data in a bounded buffer,
+    the buffer holds no reference to the events' instances, and the events are dropped
+    when it is full. Every `window` seconds a flusher thread looks up the cluster,
+    builds the messages of the buffered events and uploads them in batches
+    of `batch_size` events, one request per batch.
+    The batches failing to upload, e.g. without network, are dropped,
+    so are the buffered events when the process exits.
+    """
+
+    def __init__(self, key='', buffer_size=10000, batch_size=100, window=10):
+        super().__init__(key=key)
+        self.key = key
+        # Only builds the messages, the uploads are done by the flusher
+        self.client = analytics.Client(write_key=key or '', send=False)
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.window = window
+        self._queue = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def start_flusher(self):
+        # The flusher is started by the first event of every process, e.g. after a fork
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.buffer_size)
+            threading.Thread(target=self.flush_periodically,
+                             args=(self._queue,),
+                             name='tracker-flusher',
+                             daemon=True).start()
+            self._pid = os.getpid()
+
+    @staticmethod
+    def serialize_event(event):
+        """Return the (event type, properties, datetime, traits) of an event.
+
+        The traits identifying the cluster are only sent with the cluster creation.
+        """
+        traits = None
+        if event.event_type == 'cluster.created':
+            traits = event.serialize(dumps=False)
+        return (event.event_type,
+                event.serialize(dumps=False, include_actor_name=False),
+                event.datetime,
+                traits)
+
+    def record_event(self, event):
+        self.start_flusher()
+        try:
+            self._queue.put_nowait(self.serialize_event(event))
+        except queue.Full:
+            stats.incr('tracker.dropped')
+            _logger.debug('The tracker buffer is full, dropping the event `%s`.', event.event_type)
+
+    def get_messages(self, cluster_id, events):
+        messages = []
+        for event_type, properties, timestamp, traits in events:
+            if traits is not None:
+                _, message = self.client.identify(cluster_id, traits, timestamp=timestamp)
+                messages.append(message)
+            _, message = self.client.track(cluster_id,
+                                           event_type,
+                                           properties,
+                                           timestamp=timestamp)
+            messages.append(message)
+        return messages
+
+    def upload(self, events):
+        cluster_id = self.get_cluster_id()
+        if not cluster_id:
+            return
+        try:
+            with stats.timer('tracker.upload'):
+                post(self.key, batch=self.get_messages(cluster_id, events))
+        except Exception as e:
+            stats.incr('tracker.dropped', amount=len(events))
+            _logger.debug('Failed to upload %s tracker events: %s', len(events), e)
+
+    def flush(self, events_queue):
+        events = []
+        while True:
+            try:
+                events.append(events_queue.get_nowait())
+            except queue.Empty:
+                break
+        for i in range(0, len(events), self.batch_size):
+            self.upload(events[i:i + self.batch_size])
+
+    def flush_periodically(self, events_queue):
+        while True:
+            time.sleep(self.window)
+            try:
+                self.flush(events_queue)
+            finally:
+                close_old_connections()
+                stats.flush()
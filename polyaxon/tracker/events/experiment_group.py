@@ -20,6 +20,7 @@ tracker.subscribe(experiment_group.ExperimentGroupRandomEvent)
 tracker.subscribe(experiment_group.ExperimentGroupGridEvent)
 tracker.subscribe(experiment_group.ExperimentGroupHyperbandEvent)
 tracker.subscribe(experiment_group.ExperimentGroupBOEvent)
+tracker.subscribe(experiment_group.ExperimentGroupTPEEvent)
 tracker.subscribe(experiment_group.ExperimentGroupDeletedTriggeredEvent)
 tracker.subscribe(experiment_group.ExperimentGroupStoppedTriggeredEvent)
 tracker.subscribe(experiment_group.ExperimentGroupResumedTriggeredEvent)
@@ -5,6 +5,7 @@ from tracker.manager import default_manager
 class TrackerService(EventService):
 
     event_manager = default_manager
+    stats_key = 'tracker'
 
     def setup(self):
         super().setup()
@@ -44,12 +44,12 @@ class TestDiscordWebHookAction(TestWebHookAction):
                 config={'url': 'http://bar.com/webhook', 'method': 'GET'})
 
     def test_execute(self):
-        with patch('action_manager.actions.webhooks.webhook.safe_request') as mock_execute:
+        with patch('action_manager.dispatcher.WebHookDispatcher.dispatch') as mock_execute:
             self.webhook.execute(context={'content': 'bar'})
 
         assert mock_execute.call_count == 0
 
-        with patch('action_manager.actions.webhooks.webhook.safe_request') as mock_execute:
+        with patch('action_manager.dispatcher.WebHookDispatcher.dispatch') as mock_execute:
             self.webhook.execute(
                 context={'content': 'bar'},
                 config={'url': 'http://bar.com/webhook', 'method': 'GET'})
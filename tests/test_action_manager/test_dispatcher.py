@@ -0,0 +1,119 @@
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from action_manager.dispatcher import RateLimiter, WebHookDispatcher
+from db.redis.webhooks import RedisWebHookDeadLetters
+from tests.utils import BaseTest
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.requests.append((self.path, json.loads(body.decode()) if body else None))
+        self.server.ports.add(self.client_address[1])
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.actions_mark
+class TestWebHookDispatcher(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.server = HTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.requests = []
+        self.server.ports = set()
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = 'http://127.0.0.1:{}/webhook'.format(self.server.server_port)
+        self.dispatcher = WebHookDispatcher(workers=2,
+                                            rate_limit=1000,
+                                            max_retries=2,
+                                            backoff=0.01,
+                                            timeout=5,
+                                            queue_size=10)
+        RedisWebHookDeadLetters.clear()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def dispatch(self, url):
+        return self.dispatcher.dispatch(url=url, method='POST', json={'foo': 'bar'}).result(5)
+
+    def test_dispatch_delivers_in_the_background(self):
+        futures = [self.dispatcher.dispatch(url=self.url, method='POST', json={'i': i})
+                   for i in range(3)]
+        assert all(future.result(timeout=5).status_code == 200 for future in futures)
+        assert sorted(payload['i'] for _, payload in self.server.requests) == [0, 1, 2]
+        # The connections are kept alive
+        assert len(self.server.ports) <= 2
+
+    def test_deliver_retries_failures(self):
+        self.server.statuses = [503, 429]
+        response = self.dispatch(url=self.url)
+        assert response.status_code == 200
+        assert len(self.server.requests) == 3
+        assert RedisWebHookDeadLetters.get_letters() == []
+
+    def test_deliver_records_dead_letters(self):
+        self.server.statuses = [500, 500, 500]
+        assert self.dispatch(url=self.url) is None
+        assert len(self.server.requests) == 3
+        letters = RedisWebHookDeadLetters.get_letters()
+        assert len(letters) == 1
+        assert letters[0]['url'] == self.url
+        assert letters[0]['payload'] == {'foo': 'bar'}
+        assert letters[0]['attempts'] == 3
+
+    def test_deliver_does_not_retry_client_errors(self):
+        self.server.statuses = [404]
+        assert self.dispatch(url=self.url) is None
+        assert len(self.server.requests) == 1
+        assert RedisWebHookDeadLetters.get_letters()[0]['attempts'] == 1
+
+    def test_deliver_records_unreachable_hosts(self):
+        url = 'http://127.0.0.1:1/webhook'
+        assert self.dispatch(url=url) is None
+        assert RedisWebHookDeadLetters.get_letters()[0]['attempts'] == 3
+
+    def test_dispatch_records_dead_letters_when_the_queue_is_full(self):
+        self.dispatcher.queue_size = 1
+        self.server.statuses = [500, 500, 500]
+        futures = [self.dispatcher.dispatch(url=self.url, method='POST', json={'i': i})
+                   for i in range(2)]
+        assert [future.result(timeout=5) for future in futures] == [None, None]
+        # The second web hook is not sent
+        assert [payload['i'] for _, payload in self.server.requests] == [0, 0, 0]
+        letters = RedisWebHookDeadLetters.get_letters()
+        assert sorted(letter['attempts'] for letter in letters) == [0, 3]
+
+    def test_dispatch_is_rate_limited(self):
+        self.dispatcher.rate_limit = 20
+        start = time.monotonic()
+        futures = [self.dispatcher.dispatch(url=self.url, method='POST', json={'i': i})
+                   for i in range(3)]
+        assert all(future.result(timeout=5).status_code == 200 for future in futures)
+        assert time.monotonic() - start >= 0.1
+
+    def test_rate_limiter(self):
+        rate_limiter = RateLimiter(rate=20)
+        assert rate_limiter.acquire() == 0
+        delay = rate_limiter.acquire()
+        assert 0 < delay <= 0.05
+        time.sleep(delay)
+        assert rate_limiter.acquire() == 0
@@ -89,13 +89,13 @@ class TestWebHookAction(BaseTest):
         assert self.webhook._prepare({'foo': 'bar'}) == {'foo': 'bar'}
 
     def test_execute_empty_payload(self):
-        with patch('action_manager.actions.webhooks.webhook.safe_request') as mock_execute:
+        with patch('action_manager.dispatcher.WebHookDispatcher.dispatch') as mock_execute:
             self.webhook.execute(context={})
 
         assert mock_execute.call_count == 0
 
     def test_execute_empty_payload_with_config(self):
-        with patch('action_manager.actions.webhooks.webhook.safe_request') as mock_execute:
+        with patch('action_manager.dispatcher.WebHookDispatcher.dispatch') as mock_execute:
             self.webhook.execute(
                 context=None,
                 config={'url': 'http://bar.com/webhook', 'method': 'GET'})
@@ -103,12 +103,12 @@ class TestWebHookAction(BaseTest):
         assert mock_execute.call_count == 1
 
     def test_execute(self):
-        with patch('action_manager.actions.webhooks.webhook.safe_request') as mock_execute:
+        with patch('action_manager.dispatcher.WebHookDispatcher.dispatch') as mock_execute:
             self.webhook.execute(context={'foo': 'bar'})
 
         assert mock_execute.call_count == 0
 
-        with patch('action_manager.actions.webhooks.webhook.safe_request') as mock_execute:
+        with patch('action_manager.dispatcher.WebHookDispatcher.dispatch') as mock_execute:
             self.webhook.execute(
                 context={'foo': 'bar'},
                 config={'url': 'http://bar.com/webhook', 'method': 'GET'})
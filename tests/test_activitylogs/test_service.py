@@ -1,10 +1,14 @@
 # pylint:disable=ungrouped-imports
+from unittest.mock import patch
+
 import pytest
 
 import activitylogs
 
+from activitylogs.service import ActivityLogService
 from db.models.activitylogs import ActivityLog
-from event_manager.events.experiment import EXPERIMENT_DELETED_TRIGGERED
+from db.redis.activity_views import RedisActivityViews
+from event_manager.events.experiment import EXPERIMENT_DELETED_TRIGGERED, EXPERIMENT_VIEWED
 from event_manager.events.user import USER_ACTIVATED
 from factories.factory_experiments import ExperimentFactory
 from factories.factory_users import UserFactory
@@ -46,3 +50,91 @@ class ActivityLogsTest(BaseTest):
         assert activity.event_type == EXPERIMENT_DELETED_TRIGGERED
         assert activity.content_object == self.experiment
         assert activity.actor == self.admin
+
+    def test_record_events_creates_activities(self):
+        events = [activitylogs.backend.get_event(event_type=USER_ACTIVATED,
+                                                 instance=user,
+                                                 actor_id=self.admin.id,
+                                                 actor_name=self.admin.username)
+                  for user in [self.user, UserFactory()]]
+        activitylogs.backend.record_events(events)
+
+        assert ActivityLog.objects.count() == 2
+        assert {activity.content_object for activity in ActivityLog.objects.all()} == {
+            event.instance for event in events}
+        assert {activity.actor for activity in ActivityLog.objects.all()} == {self.admin}
+
+    @patch('activitylogs.service.transaction.on_commit', side_effect=lambda func: func())
+    def test_record_buffers_activities(self, _):
+        service = ActivityLogService(write_window=60, write_size=2)
+        service.setup()
+        with patch('event_manager.buffered_writer.BufferedWriter.start_flusher'):
+            service.record(event_type=USER_ACTIVATED,
+                           instance=self.user,
+                           actor_id=self.admin.id,
+                           actor_name=self.admin.username)
+            assert ActivityLog.objects.count() == 0
+
+            service.record(event_type=EXPERIMENT_DELETED_TRIGGERED,
+                           instance=self.experiment,
+                           actor_id=self.admin.id,
+                           actor_name=self.admin.username)
+        assert ActivityLog.objects.count() == 2
+        assert ActivityLog.objects.filter(object_id=self.experiment.id,
+                                          event_type=EXPERIMENT_DELETED_TRIGGERED).exists()
+
+    def record_experiment_events(self, service, actor):
+        for event_type in [EXPERIMENT_VIEWED, EXPERIMENT_VIEWED, EXPERIMENT_DELETED_TRIGGERED]:
+            service.record(event_type=event_type,
+                           instance=self.experiment,
+                           actor_id=actor.id,
+                           actor_name=actor.username)
+
+    def test_record_deduplicates_views(self):
+        service = ActivityLogService(views_window=60)
+        service.setup()
+        RedisActivityViews.clear(event_type=EXPERIMENT_VIEWED,
+                                 object_id=self.experiment.id,
+                                 actor_id=self.admin.id)
+
+        self.record_experiment_events(service=service, actor=self.admin)
+        assert ActivityLog.objects.filter(event_type=EXPERIMENT_VIEWED).count() == 1
+        assert ActivityLog.objects.filter(event_type=EXPERIMENT_DELETED_TRIGGERED).count() == 1
+
+        # The views of other actors are recorded
+        self.record_experiment_events(service=service, actor=self.user)
+        assert ActivityLog.objects.filter(event_type=EXPERIMENT_VIEWED).count() == 2
+        assert ActivityLog.objects.filter(event_type=EXPERIMENT_DELETED_TRIGGERED).count() == 2
+
+        # The views are recorded again after the window
+        RedisActivityViews.clear(event_type=EXPERIMENT_VIEWED,
+                                 object_id=self.experiment.id,
+                                 actor_id=self.admin.id)
+        self.record_experiment_events(service=service, actor=self.admin)
+        assert ActivityLog.objects.filter(event_type=EXPERIMENT_VIEWED).count() == 3
+
+    def test_record_samples_views(self):
+        service = ActivityLogService(views_sample_rate=0.5)
+        service.setup()
+
+        with patch('activitylogs.service.random.random', side_effect=[0.7, 0.2]):
+            self.record_experiment_events(service=service, actor=self.admin)
+        assert ActivityLog.objects.filter(event_type=EXPERIMENT_VIEWED).count() == 1
+        assert ActivityLog.objects.filter(event_type=EXPERIMENT_DELETED_TRIGGERED).count() == 1
+
+    def test_record_events_filters_views(self):
+        service = ActivityLogService(views_window=60)
+        service.setup()
+        RedisActivityViews.clear(event_type=EXPERIMENT_VIEWED,
+                                 object_id=self.experiment.id,
+                                 actor_id=self.admin.id)
+        events = [service.get_event(event_type=event_type,
+                                    instance=self.experiment,
+                                    actor_id=self.admin.id,
+                                    actor_name=self.admin.username)
+                  for event_type in [EXPERIMENT_VIEWED,
+                                     EXPERIMENT_DELETED_TRIGGERED,
+                                     EXPERIMENT_VIEWED]]
+        service.record_events(events)
+        assert list(ActivityLog.objects.order_by('id').values_list('event_type', flat=True)) == [
+            EXPERIMENT_VIEWED, EXPERIMENT_DELETED_TRIGGERED]
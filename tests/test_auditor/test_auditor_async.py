@@ -0,0 +1,118 @@
+# pylint:disable=ungrouped-imports
+import queue
+import threading
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import activitylogs
+import tracker
+
+from auditor.async_service import AsyncAuditorService
+from db.models.activitylogs import ActivityLog
+from event_manager.events.experiment import EXPERIMENT_SUCCEEDED, EXPERIMENT_VIEWED
+from factories.factory_experiments import ExperimentFactory
+from tests.utils import BaseTest
+
+
+@pytest.mark.auditor_mark
+class AsyncAuditorTest(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.experiment = ExperimentFactory()
+        tracker.validate()
+        tracker.setup()
+        activitylogs.validate()
+        activitylogs.setup()
+        self.auditor = AsyncAuditorService(buffer_size=2, batch_size=10, put_timeout=0.01)
+        self.auditor.setup()
+
+    def record_viewed(self):
+        self.auditor.record(event_type=EXPERIMENT_VIEWED,
+                            instance=self.experiment,
+                            actor_id=self.experiment.user.id,
+                            actor_name=self.experiment.user.username)
+
+    @patch('auditor.async_service.AsyncAuditorService.put')
+    @patch('auditor.async_service.transaction.on_commit', side_effect=lambda func: func())
+    def test_record_builds_the_events_of_the_handling_services(self, _, put):
+        self.record_viewed()
+
+        assert put.call_count == 1
+        services = [service for service, _ in put.call_args[0][0]]
+        assert services == [tracker.backend, activitylogs.backend]
+
+    @patch('auditor.async_service.transaction.on_commit')
+    def test_record_waits_for_the_commit(self, on_commit):
+        self.record_viewed()
+        assert on_commit.call_count == 1
+        assert ActivityLog.objects.count() == 0
+
+    @patch('auditor.async_service.transaction.on_commit')
+    def test_record_ignores_events_without_services(self, on_commit):
+        # Experiment succeeded is only handled by the notifier, which is not set up
+        self.auditor.record(event_type=EXPERIMENT_SUCCEEDED, instance=self.experiment)
+        assert on_commit.call_count == 0
+
+    def test_record_services_events_records_each_service_batch(self):
+        services_events = self.auditor.get_services_events(
+            self.auditor.get_event(event_type=EXPERIMENT_VIEWED,
+                                   instance=self.experiment,
+                                   actor_id=self.experiment.user.id,
+                                   actor_name=self.experiment.user.username))
+        self.auditor.record_services_events(services_events * 3)
+
+        assert ActivityLog.objects.count() == 3
+        activity = ActivityLog.objects.last()
+        assert activity.event_type == EXPERIMENT_VIEWED
+        assert activity.content_object == self.experiment
+        assert activity.actor == self.experiment.user
+
+    @patch('auditor.async_service.AsyncAuditorService.record_services_events')
+    @patch('auditor.async_service.AsyncAuditorService.start_consumer')
+    def test_put_records_in_the_caller_when_the_buffer_is_full(self,
+                                                               start_consumer,
+                                                               record_services_events):
+        self.auditor._queue = queue.Queue(maxsize=self.auditor.buffer_size)
+        for i in range(3):
+            self.auditor.put([(activitylogs.backend, i)])
+
+        assert self.auditor._queue.qsize() == 2
+        assert record_services_events.call_count == 1
+        assert record_services_events.call_args[0][0] == [(activitylogs.backend, 2)]
+
+    @patch('auditor.async_service.close_old_connections')
+    def test_consume_records_the_buffered_events_in_batches(self, _):
+        events_queue = queue.Queue()
+        for i in range(3):
+            events_queue.put([(activitylogs.backend, i)])
+        recorded = threading.Event()
+        self.auditor.record_services_events = MagicMock(side_effect=lambda _: recorded.set())
+
+        threading.Thread(target=self.auditor.consume, args=(events_queue,), daemon=True).start()
+        assert recorded.wait(timeout=5)
+        events_queue.join()
+
+        assert self.auditor.record_services_events.call_count == 1
+        assert self.auditor.record_services_events.call_args[0][0] == [
+            (activitylogs.backend, 0), (activitylogs.backend, 1), (activitylogs.backend, 2)]
+
+    @patch('auditor.async_service.worker_shutdown')
+    @patch('auditor.async_service.worker_process_shutdown')
+    @patch('auditor.async_service.atexit.register')
+    def test_setup_drains_the_buffer_at_shutdown(self,
+                                                 register,
+                                                 worker_process_shutdown,
+                                                 worker_shutdown):
+        auditor = AsyncAuditorService(shutdown_timeout=2)
+        auditor.setup()
+        register.assert_called_once_with(auditor.flush)
+        worker_process_shutdown.connect.assert_called_once_with(auditor.drain, weak=False)
+        worker_shutdown.connect.assert_called_once_with(auditor.drain, weak=False)
+
+        with patch('auditor.async_service.AsyncAuditorService.flush') as flush:
+            auditor.drain(sender=None)
+        flush.assert_called_once_with(timeout=2)
@@ -183,6 +183,15 @@ class AuditorExperimentGroupTest(BaseTest):
         assert tracker_record.call_count == 1
         assert activitylogs_record.call_count == 0
 
+    @patch('tracker.service.TrackerService.record_event')
+    @patch('activitylogs.service.ActivityLogService.record_event')
+    def test_experiment_group_tpe(self, activitylogs_record, tracker_record):
+        auditor.record(event_type=experiment_group_events.EXPERIMENT_GROUP_TPE,
+                       instance=self.experiment_group)
+
+        assert tracker_record.call_count == 1
+        assert activitylogs_record.call_count == 0
+
     @patch('tracker.service.TrackerService.record_event')
     @patch('activitylogs.service.ActivityLogService.record_event')
     def test_experiment_group_deleted_triggered(self, activitylogs_record, tracker_record):
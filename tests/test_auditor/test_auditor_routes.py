@@ -0,0 +1,44 @@
+# pylint:disable=ungrouped-imports
+from unittest.mock import patch
+
+import pytest
+
+import activitylogs
+import notifier
+import tracker
+
+from auditor.service import AuditorService
+from event_manager.events.experiment import EXPERIMENT_SUCCEEDED, EXPERIMENT_VIEWED
+from factories.factory_experiments import ExperimentFactory
+from tests.utils import BaseTest
+
+
+@pytest.mark.auditor_mark
+class AuditorRoutesTest(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.experiment = ExperimentFactory()
+        self.auditor = AuditorService()
+        self.auditor.setup()
+
+    def test_routes_the_event_types_to_the_handling_services(self):
+        assert self.auditor.get_services(EXPERIMENT_VIEWED) == [tracker.backend,
+                                                                activitylogs.backend]
+        assert self.auditor.get_services(EXPERIMENT_SUCCEEDED) == [notifier.backend,
+                                                                   tracker.backend]
+        assert self.auditor.get_services('unknown.event') == []
+
+    @patch('notifier.service.NotifierService.record')
+    @patch('tracker.service.TrackerService.record')
+    @patch('activitylogs.service.ActivityLogService.record')
+    def test_record_only_passes_the_event_to_the_handling_services(self,
+                                                                  activitylogs_record,
+                                                                  tracker_record,
+                                                                  notifier_record):
+        self.auditor.record(event_type=EXPERIMENT_SUCCEEDED, instance=self.experiment)
+
+        assert notifier_record.call_count == 1
+        assert tracker_record.call_count == 1
+        assert activitylogs_record.call_count == 0
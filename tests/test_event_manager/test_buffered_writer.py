@@ -0,0 +1,60 @@
+import threading
+
+from unittest.mock import patch
+
+import pytest
+
+from event_manager.buffered_writer import BufferedWriter
+from tests.utils import BaseTest
+
+
+@pytest.mark.events_mark
+class TestBufferedWriter(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        self.batches = []
+        self.written = threading.Event()
+        super().setUp()
+
+    def write(self, rows):
+        self.batches.append(rows)
+        self.written.set()
+
+    @patch('event_manager.buffered_writer.BufferedWriter.start_flusher')
+    def test_add_writes_full_buffers(self, _):
+        writer = BufferedWriter(write=self.write, size=2, window=60)
+        writer.add(1)
+        assert self.batches == []
+        writer.add(2)
+        writer.add(3)
+        assert self.batches == [[1, 2]]
+
+        writer.flush()
+        assert self.batches == [[1, 2], [3]]
+
+        # Empty buffers are not written
+        writer.flush()
+        assert self.batches == [[1, 2], [3]]
+
+    @patch('event_manager.buffered_writer.atexit.register')
+    def test_buffers_are_written_at_exit(self, register):
+        writer = BufferedWriter(write=self.write, size=2, window=60)
+        register.assert_called_once_with(writer.flush)
+
+    @patch('event_manager.buffered_writer.close_old_connections')
+    def test_flusher_writes_the_buffer_after_the_window(self, _):
+        writer = BufferedWriter(write=self.write, size=100, window=0.01)
+        writer.add(1)
+        assert self.written.wait(timeout=5)
+        assert self.batches == [[1]]
+
+    @patch('event_manager.buffered_writer.BufferedWriter.start_flusher')
+    def test_write_failures_are_logged(self, _):
+        def write(rows):
+            raise ValueError('Failed')
+
+        writer = BufferedWriter(write=write, size=1, window=60)
+        with patch('event_manager.buffered_writer._logger.warning') as warning:
+            writer.add(1)
+        assert warning.call_count == 1
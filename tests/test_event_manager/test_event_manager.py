@@ -93,3 +93,11 @@ class TestEventManager(BaseTest):
         assert self.manager.user_view_events() == []
         self.manager.subscribe(ExperimentViewedEvent)
         assert self.manager.user_view_events() == [ExperimentViewedEvent.event_type]
+
+    def test_subscribe_compiles_events(self):
+        class DummyEvent(ClusterCreatedEvent):
+            event_type = 'dummy.event'
+
+        assert '_compiled_attributes' not in DummyEvent.__dict__
+        self.manager.subscribe(DummyEvent)
+        assert '_compiled_attributes' in DummyEvent.__dict__
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from event_manager.event import Attribute, Event
@@ -79,3 +81,12 @@ class TestEventService(BaseTest):
         assert event.datetime is not None
         assert event.data['dummy_attr'] == dummy_instance.dummy_attr
         assert event.data['new_attr'] == 'new_attr'
+
+    @patch('stats.incr')
+    def test_record_sends_the_stats(self, stats_incr):
+        self.service.event_manager.subscribe(DummyEvent)
+        self.service.record(event_type=DummyEvent.event_type,
+                            instance=DummyObject(dummy_attr='test3'))
+
+        assert stats_incr.call_count == 1
+        assert stats_incr.call_args[0][0] == 'events.events.dummy.event'
@@ -100,6 +100,7 @@ class TestEvents(BaseTest):
         assert (experiment_group.ExperimentGroupHyperbandEvent.get_event_subject() ==
                 'experiment_group')
         assert experiment_group.ExperimentGroupBOEvent.get_event_subject() == 'experiment_group'
+        assert experiment_group.ExperimentGroupTPEEvent.get_event_subject() == 'experiment_group'
         assert (experiment_group.ExperimentGroupDeletedTriggeredEvent.get_event_subject() ==
                 'experiment_group')
         assert (experiment_group.ExperimentGroupStoppedTriggeredEvent.get_event_subject() ==
@@ -302,6 +303,7 @@ class TestEvents(BaseTest):
         assert experiment_group.ExperimentGroupGridEvent.get_event_action() is None
         assert experiment_group.ExperimentGroupHyperbandEvent.get_event_action() is None
         assert experiment_group.ExperimentGroupBOEvent.get_event_action() is None
+        assert experiment_group.ExperimentGroupTPEEvent.get_event_action() is None
         assert experiment_group.ExperimentGroupDeletedTriggeredEvent.get_event_action() == 'deleted'
         assert experiment_group.ExperimentGroupStoppedTriggeredEvent.get_event_action() == 'stopped'
         assert experiment_group.ExperimentGroupResumedTriggeredEvent.get_event_action() == 'resumed'
@@ -592,3 +594,50 @@ class TestEvents(BaseTest):
                                           some_actor_name=user_system.USER_SYSTEM_NAME)
         assert event.data['some_actor_id'] == user_system.USER_SYSTEM_ID
         assert event.data['some_actor_name'] == user_system.USER_SYSTEM_NAME
+
+    def test_compiled_attributes(self):
+        class DummyEvent(Event):
+            event_type = 'dummy.event'
+            actor = True
+            attributes = (
+                Attribute('attr1'),
+                Attribute('attr2.attr3', attr_type=int),
+            )
+
+        class ChildDummyEvent(DummyEvent):
+            attributes = (
+                Attribute('attr1'),
+            )
+
+        compiled_attributes = DummyEvent.compile()
+        assert [attr.name for attr in compiled_attributes] == [
+            'attr1', 'attr2.attr3', 'actor_id', 'actor_name']
+        assert [attr.kwarg for attr in compiled_attributes] == [
+            None, 'attr2_attr3', None, None]
+        assert DummyEvent.get_compiled_attributes() is compiled_attributes
+
+        # Subclasses are compiled with their own attributes
+        assert [attr.name for attr in ChildDummyEvent.get_compiled_attributes()] == [
+            'attr1', 'actor_id', 'actor_name']
+
+        # Dotted attributes can be passed with underscores
+        event = DummyEvent(attr1='test', attr2_attr3='2', actor_id=1, actor_name='foo')
+        assert event.data == {
+            'attr1': 'test', 'attr2.attr3': 2, 'actor_id': 1, 'actor_name': 'foo'}
+
+        # Unknown attributes raise
+        with self.assertRaises(ValueError):
+            DummyEvent(attr1='test', attr2_attr3=2, actor_id=1, actor_name='foo', attr4=1)
+
+    def test_serialize_without_actor_name(self):
+        class DummyEvent(Event):
+            event_type = 'dummy.event'
+            actor = True
+            attributes = (
+                Attribute('attr1'),
+            )
+
+        event = DummyEvent(attr1='test', actor_id=1, actor_name='foo')
+        assert event.serialize(include_actor_name=False)['data'] == {
+            'attr1': 'test', 'actor_id': 1}
+        assert event.data['actor_name'] == 'foo'
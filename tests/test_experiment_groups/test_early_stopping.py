@@ -0,0 +1,216 @@
+from unittest.mock import patch
+
+import pytest
+
+from marshmallow import ValidationError
+
+from db.models.experiments import ExperimentMetric
+from db.redis.group_early_stopping import RedisGroupEarlyStopping
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from factories.factory_experiments import ExperimentFactory
+from factories.fixtures import (
+    experiment_group_spec_content_2_xps,
+    experiment_group_spec_content_metric_early_stopping
+)
+from hpsearch.early_stopping import (
+    MedianStoppingPolicy,
+    TruncationStoppingPolicy,
+    get_metric_early_stopping_policy
+)
+from hpsearch.schemas import (
+    get_hptuning_extensions,
+    get_metric_early_stopping_config,
+    validate_hptuning_extensions
+)
+from hpsearch.schemas.early_stopping import MetricEarlyStoppingConfig
+from tests.utils import BaseTest
+
+
+@pytest.mark.experiment_groups_mark
+class TestMetricEarlyStoppingConfig(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_metric_early_stopping_config(self):
+        config = {
+            'policy': 'median',
+            'metric': 'loss',
+            'optimization': 'minimize',
+            'min_steps': 2,
+            'evaluation_interval': 1,
+            'min_peers': 3,
+            'percentile': 25.,
+        }
+        assert MetricEarlyStoppingConfig.from_dict(config).to_dict() == config
+
+    def test_wrong_metric_early_stopping_config(self):
+        with self.assertRaises(ValidationError):
+            MetricEarlyStoppingConfig.from_dict({'policy': 'foo', 'metric': 'loss'})
+
+        with self.assertRaises(ValidationError):
+            MetricEarlyStoppingConfig.from_dict({'policy': 'median',
+                                                 'metric': 'loss',
+                                                 'min_steps': 0})
+
+        with self.assertRaises(ValidationError):
+            validate_hptuning_extensions({
+                'metric_early_stopping': {'policy': 'truncation',
+                                          'metric': 'loss',
+                                          'percentile': 120}
+            })
+
+    def test_get_hptuning_extensions(self):
+        assert get_hptuning_extensions(None) == {}
+        assert get_hptuning_extensions({'concurrency': 2}) == {}
+        assert get_metric_early_stopping_config({'concurrency': 2}) is None
+
+        section = {'policy': 'median', 'metric': 'loss'}
+        hptuning = {'concurrency': 2, 'metric_early_stopping': section}
+        assert get_hptuning_extensions(hptuning) == {'metric_early_stopping': section}
+        config = get_metric_early_stopping_config(hptuning)
+        assert isinstance(config, MetricEarlyStoppingConfig)
+        assert config.metric == 'loss'
+        assert config.min_steps == 1
+
+
+@pytest.mark.experiment_groups_mark
+class TestMetricEarlyStoppingPolicies(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_get_metric_early_stopping_policy(self):
+        assert get_metric_early_stopping_policy(None) is None
+        config = MetricEarlyStoppingConfig(policy='median', metric='loss')
+        assert isinstance(get_metric_early_stopping_policy(config), MedianStoppingPolicy)
+        config = MetricEarlyStoppingConfig(policy='truncation', metric='loss')
+        assert isinstance(get_metric_early_stopping_policy(config), TruncationStoppingPolicy)
+
+    def test_median_policy_maximize(self):
+        policy = MedianStoppingPolicy(
+            MetricEarlyStoppingConfig(policy='median', metric='accuracy', min_steps=2))
+        peers = [[0.5, 0.6, 0.7], [0.4, 0.5, 0.6], [0.6, 0.7, 0.8]]
+
+        # Before min steps
+        assert policy.should_stop([0.1], peers) is False
+        # Running averages at step 2: 0.55, 0.45, 0.65 -> median 0.55
+        assert policy.should_stop([0.1, 0.5], peers) is True
+        assert policy.should_stop([0.1, 0.6], peers) is False
+        # No peers reached the step
+        assert policy.should_stop([0.1, 0.1, 0.1, 0.1], peers) is False
+
+    def test_median_policy_minimize(self):
+        policy = MedianStoppingPolicy(
+            MetricEarlyStoppingConfig(policy='median', metric='loss', optimization='minimize'))
+        peers = [[0.5, 0.3], [0.7, 0.5], [0.9, 0.7]]
+
+        assert policy.should_stop([0.8], peers) is True
+        assert policy.should_stop([0.6], peers) is False
+
+    def test_min_peers_and_evaluation_interval(self):
+        policy = MedianStoppingPolicy(MetricEarlyStoppingConfig(policy='median',
+                                                                metric='accuracy',
+                                                                min_peers=3,
+                                                                evaluation_interval=2))
+        peers = [[0.5, 0.6, 0.7], [0.4, 0.5, 0.6]]
+        assert policy.should_stop([0.1], peers) is False
+
+        peers.append([0.6, 0.7, 0.8])
+        assert policy.should_stop([0.1], peers) is True
+        # Step 2 is not evaluated
+        assert policy.should_stop([0.1, 0.1], peers) is False
+        assert policy.should_stop([0.1, 0.1, 0.1], peers) is True
+
+    def test_truncation_policy(self):
+        policy = TruncationStoppingPolicy(MetricEarlyStoppingConfig(policy='truncation',
+                                                                    metric='accuracy',
+                                                                    percentile=50))
+        peers = [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
+        assert policy.should_stop([0.1, 0.35], peers) is True
+        assert policy.should_stop([0.1, 0.45], peers) is False
+
+        policy = TruncationStoppingPolicy(MetricEarlyStoppingConfig(policy='truncation',
+                                                                    metric='loss',
+                                                                    optimization='minimize',
+                                                                    percentile=50))
+        assert policy.should_stop([0.6, 0.45], peers) is True
+        assert policy.should_stop([0.6, 0.25], peers) is False
+
+    def test_should_stop_experiment(self):
+        experiment_group = ExperimentGroupFactory(
+            content=experiment_group_spec_content_metric_early_stopping)
+        experiments = [ExperimentFactory(experiment_group=experiment_group) for _ in range(3)]
+        policy = get_metric_early_stopping_policy(experiment_group.metric_early_stopping)
+
+        for loss in [0.9, 0.7]:
+            ExperimentMetric.objects.create(experiment=experiments[0], values={'loss': loss})
+        for loss in [0.8, 0.5]:
+            ExperimentMetric.objects.create(experiment=experiments[1], values={'loss': loss})
+        ExperimentMetric.objects.create(experiment=experiments[2], values={'accuracy': 0.1})
+
+        # Only the evaluated steps are stored, the first step is before min steps
+        assert RedisGroupEarlyStopping.get_step_values(experiment_group.id, 1) == {}
+        assert RedisGroupEarlyStopping.get_step_values(experiment_group.id, 2) == {
+            experiments[0].id: [0.8, 0.7],
+            experiments[1].id: [0.65, 0.5],
+        }
+        assert RedisGroupEarlyStopping.get_experiment_aggregates(
+            experiment_group.id, experiments[2].id) is None
+
+        group_id = experiment_group.id
+        assert policy.should_stop_experiment(group_id, experiments[0].id, step=2) is True
+        assert policy.should_stop_experiment(group_id, experiments[0].id) is True
+        assert policy.should_stop_experiment(group_id, experiments[1].id, step=2) is False
+        assert policy.should_stop_experiment(group_id, experiments[2].id) is False
+
+    def test_update_aggregates(self):
+        policy = MedianStoppingPolicy(MetricEarlyStoppingConfig(policy='median',
+                                                                metric='loss',
+                                                                optimization='minimize',
+                                                                min_steps=2,
+                                                                evaluation_interval=2))
+        aggregates, steps_values = policy.update_aggregates(None, [0.9, 0.7, 0.8])
+        assert aggregates[0] == 3
+        assert aggregates[1] == pytest.approx(2.4)
+        assert aggregates[2] == 0.7
+        assert list(steps_values) == []
+
+        aggregates, steps_values = policy.update_aggregates(aggregates, [0.2, 0.4])
+        assert aggregates[0] == 5
+        assert aggregates[2] == 0.2
+        assert list(steps_values) == [4]
+        assert steps_values[4][0] == pytest.approx(0.65)
+        assert steps_values[4][1] == 0.2
+
+
+@pytest.mark.experiment_groups_mark
+class TestMetricEarlyStoppingTriggers(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_group_metric_early_stopping(self):
+        experiment_group = ExperimentGroupFactory()
+        assert experiment_group.has_metric_early_stopping is False
+
+        experiment_group = ExperimentGroupFactory(
+            content=experiment_group_spec_content_metric_early_stopping)
+        assert experiment_group.has_metric_early_stopping is True
+        assert experiment_group.metric_early_stopping.policy == 'median'
+        assert experiment_group.metric_early_stopping.min_steps == 2
+
+    def test_new_metric_triggers_early_stopping(self):
+        experiment_group = ExperimentGroupFactory(content=experiment_group_spec_content_2_xps)
+        experiment = ExperimentFactory(experiment_group=experiment_group)
+        with patch('hpsearch.tasks.early_stopping.hp_early_stopping.apply_async') as mock_fct:
+            ExperimentMetric.objects.create(experiment=experiment, values={'loss': 0.1})
+        assert mock_fct.call_count == 0
+
+        experiment_group = ExperimentGroupFactory(
+            content=experiment_group_spec_content_metric_early_stopping)
+        experiment = ExperimentFactory(experiment_group=experiment_group)
+        with patch('hpsearch.tasks.early_stopping.hp_early_stopping.apply_async') as mock_fct:
+            ExperimentMetric.objects.create(experiment=experiment, values={'loss': 0.1})
+        # The first step is before the min steps of the policy
+        assert mock_fct.call_count == 0
+
+        with patch('hpsearch.tasks.early_stopping.hp_early_stopping.apply_async') as mock_fct:
+            ExperimentMetric.objects.create(experiment=experiment, values={'accuracy': 0.1})
+            ExperimentMetric.objects.create(experiment=experiment, values={'loss': 0.1})
+        assert mock_fct.call_count == 1
+        assert mock_fct.call_args[1]['kwargs']['step'] == 2
@@ -0,0 +1,106 @@
+import pytest
+
+from hpsearch.simulator import (
+    BraninObjective,
+    HartmannObjective,
+    HPSearchSimulator,
+    LearningCurveObjective,
+    get_hptuning_config,
+    get_objective
+)
+from schemas.hptuning import SearchAlgorithms
+from tests.utils import BaseTest
+
+
+@pytest.mark.experiment_groups_mark
+class TestSimulationObjectives(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_get_objective(self):
+        assert isinstance(get_objective('branin'), BraninObjective)
+        assert isinstance(get_objective('hartmann'), HartmannObjective)
+        assert isinstance(get_objective('learning_curve'), LearningCurveObjective)
+        with self.assertRaises(ValueError):
+            get_objective('foo')
+
+    def test_optimums(self):
+        objective = BraninObjective()
+        assert round(objective.evaluate({'x1': 3.14159, 'x2': 2.275}), 4) == 0.3979
+
+        objective = HartmannObjective()
+        params = dict(zip(HartmannObjective.PARAMS,
+                          [0.20169, 0.150011, 0.476874, 0.275332, 0.311652, 0.6573]))
+        assert round(objective.evaluate(params), 4) == -3.3224
+
+    def test_learning_curve_decays_with_resource(self):
+        objective = LearningCurveObjective()
+        params = {'learning_rate': 0.01, 'dropout': 0.3}
+        values = [objective.evaluate(params, resource=r) for r in [1, 3, 9, 27, 81]]
+        assert values == sorted(values, reverse=True)
+        assert objective.get_run_time(params, resource=3) < objective.get_run_time(params,
+                                                                                   resource=27)
+
+
+@pytest.mark.experiment_groups_mark
+class TestHPSearchSimulator(BaseTest):
+    DISABLE_RUNNER = True
+
+    def simulate(self, search_algorithm, objective, concurrency=2, **kwargs):
+        hptuning_config = get_hptuning_config(search_algorithm=search_algorithm,
+                                              objective=objective,
+                                              concurrency=concurrency,
+                                              seed=1,
+                                              **kwargs)
+        simulator = HPSearchSimulator(hptuning_config=hptuning_config,
+                                      objective=objective,
+                                      target=objective.OPTIMUM + 100,
+                                      include_suggestion_latency=False)
+        return simulator.simulate()
+
+    def test_grid_search(self):
+        report = self.simulate(SearchAlgorithms.GRID, BraninObjective(seed=1), grid_size=3)
+        assert report.n_experiments == 9
+        assert report.n_iterations == 1
+        assert report.get_latency_stats()['count'] == 1
+        assert report.time_to_target is not None
+        assert 0 < report.utilisation <= 1
+
+    def test_random_search(self):
+        report = self.simulate(SearchAlgorithms.RANDOM, HartmannObjective(seed=1),
+                               n_experiments=10)
+        assert report.n_experiments == 10
+        assert report.best_run.metric == report.to_dict()['best_metric']
+
+    def test_concurrency_reduces_makespan(self):
+        report1 = self.simulate(SearchAlgorithms.RANDOM,
+                                BraninObjective(run_time_jitter=0),
+                                concurrency=1,
+                                n_experiments=8)
+        report4 = self.simulate(SearchAlgorithms.RANDOM,
+                                BraninObjective(run_time_jitter=0),
+                                concurrency=4,
+                                n_experiments=8)
+        assert report1.makespan == 4 * report4.makespan
+        assert report1.utilisation == report4.utilisation == 1
+
+    def test_hyperband(self):
+        report = self.simulate(SearchAlgorithms.HYPERBAND,
+                               LearningCurveObjective(seed=1),
+                               max_iter=9)
+        assert report.n_iterations > 1
+        assert report.n_runs > report.n_experiments
+        resources = {run.declarations['num_epochs'] for run in report.runs}
+        assert max(resources) >= 9
+        # Only the suggestions are timed as suggestion latencies
+        assert report.get_latency_stats()['count'] < report.n_iterations
+        assert report.get_iteration_latency_stats()['count'] > report.n_iterations
+
+    @pytest.mark.filterwarnings('ignore::UserWarning')
+    def test_bo(self):
+        report = self.simulate(SearchAlgorithms.BO,
+                               BraninObjective(seed=1),
+                               n_experiments=4,
+                               n_iterations=3)
+        # Initial trials and one suggestion for each iteration
+        assert report.n_iterations == 4
+        assert report.n_experiments == 7
@@ -0,0 +1,285 @@
+import numpy as np
+
+from unittest.mock import patch
+
+import pytest
+
+from marshmallow import ValidationError
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from hpsearch.iteration_managers import TPEIterationManager, get_search_iteration_manager
+from hpsearch.schemas import BOIterationConfig, get_iteration_config
+from hpsearch.search_managers import TPESearchManager, get_search_algorithm_manager
+from hpsearch.search_managers.tpe.estimators import CategoricalEstimator, ParzenEstimator
+from hpsearch.search_managers.tpe.optimizer import TPEOptimizer
+from hpsearch.simulator import HPSearchSimulator, get_hptuning_config, get_objective
+from libs.spec_validation import validate_group_spec_content
+from schemas.hptuning import HPTuningConfig, SearchAlgorithms, TPEConfig
+from tests.utils import BaseTest
+
+MATRIX = {
+    'feature1': {'values': [1, 2, 3]},
+    'feature2': {'uniform': [0, 1]},
+    'feature3': {'values': ['a', 'b']},
+    'feature4': {'loguniform': [0.001, 0.1]},
+}
+
+
+TPE_CONTENT = """---
+    version: 1
+
+    kind: group
+
+    hptuning:
+      concurrency: 2
+      {}
+      tpe:
+        n_initial_trials: 2
+        n_iterations: 2
+        metric:
+          name: loss
+          optimization: minimize
+      matrix:
+        lr:
+          uniform: [0.01, 0.1]
+
+    build:
+      image: my_image
+
+    run:
+      cmd: train --lr={{{{ lr }}}}
+"""
+
+
+def get_tpe_hptuning(**kwargs):
+    tpe = {
+        'n_iterations': 5,
+        'n_initial_trials': 4,
+        'metric': {'name': 'loss', 'optimization': 'minimize'},
+    }
+    tpe.update(kwargs)
+    return {'concurrency': 2, 'seed': 1, 'tpe': tpe, 'matrix': MATRIX}
+
+
+@pytest.mark.experiment_groups_mark
+class TestTPEConfig(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_tpe_config(self):
+        config = {
+            'n_initial_trials': 4,
+            'n_iterations': 5,
+            'metric': {'name': 'loss', 'optimization': 'minimize'},
+            'n_suggestions': 2,
+            'gamma': 0.2,
+            'n_ei_candidates': 10,
+            'prior_weight': 0.5,
+        }
+        assert TPEConfig.from_dict(config).to_dict() == config
+
+        config = TPEConfig.from_dict({
+            'n_initial_trials': 4,
+            'n_iterations': 5,
+            'metric': {'name': 'loss', 'optimization': 'minimize'},
+        })
+        assert config.n_suggestions == 1
+        assert config.gamma == 0.25
+
+        with self.assertRaises(ValidationError):
+            TPEConfig.from_dict({
+                'n_initial_trials': 4,
+                'n_iterations': 5,
+                'metric': {'name': 'loss', 'optimization': 'minimize'},
+                'gamma': 2,
+            })
+
+    def test_hptuning_config_search_algorithm(self):
+        hptuning_config = HPTuningConfig.from_dict(get_tpe_hptuning())
+        assert hptuning_config.search_algorithm == SearchAlgorithms.TPE
+        assert hptuning_config.tpe.n_initial_trials == 4
+        assert hptuning_config.to_dict()['tpe']['n_iterations'] == 5
+
+    def test_hptuning_config_accepts_one_search_algorithm(self):
+        hptuning = get_tpe_hptuning()
+        hptuning['random_search'] = {'n_experiments': 2}
+        with self.assertRaises(ValidationError):
+            HPTuningConfig.from_dict(hptuning)
+
+    def test_group_content_accepts_one_search_algorithm(self):
+        content = TPE_CONTENT.format('')
+        validate_group_spec_content(content)
+        experiment_group = ExperimentGroupFactory(content=content)
+        assert experiment_group.search_algorithm == SearchAlgorithms.TPE
+
+        content = TPE_CONTENT.format('random_search: {n_experiments: 2}')
+        with self.assertRaises(DjangoValidationError):
+            validate_group_spec_content(content)
+
+    def test_get_iteration_config(self):
+        iteration = {
+            'iteration': 1,
+            'experiment_ids': [1, 2],
+            'experiments_configs': [[1, {'feature1': 1}], [2, {'feature1': 2}]],
+            'experiments_metrics': None
+        }
+        assert isinstance(get_iteration_config(SearchAlgorithms.TPE, iteration=iteration),
+                          BOIterationConfig)
+
+
+@pytest.mark.experiment_groups_mark
+class TestTPEEstimators(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_parzen_estimator(self):
+        estimator = ParzenEstimator(observations=[0.2, 0.25, 0.8], low=0, high=1)
+        # 3 observations and the prior
+        assert len(estimator.mus) == 4
+        assert round(estimator.weights.sum(), 6) == 1
+        assert np.all(estimator.sigmas > 0)
+
+        samples = estimator.sample(size=100, rand_generator=np.random.RandomState(1))
+        assert samples.shape == (100,)
+        assert np.all((samples >= 0) & (samples <= 1))
+
+        log_pdfs = estimator.log_pdf([0.22, 0.5, 0.8])
+        assert log_pdfs.shape == (3,)
+        assert log_pdfs[0] > log_pdfs[1]
+
+        # Truncated density integrates to 1 over the bounds
+        x = np.linspace(0, 1, 10001)
+        assert round(np.trapz(np.exp(estimator.log_pdf(x)), x), 2) == 1
+
+    def test_parzen_estimator_without_observations(self):
+        estimator = ParzenEstimator(observations=[], low=-1, high=1, prior_weight=0)
+        assert len(estimator.mus) == 1
+        assert estimator.weights.tolist() == [1.]
+
+    def test_categorical_estimator(self):
+        estimator = CategoricalEstimator(observations=[0, 0, 2], n_values=3, prior_weight=0)
+        assert estimator.probabilities.tolist() == [2 / 3, 0, 1 / 3]
+
+        estimator = CategoricalEstimator(observations=[0, 0, 2], n_values=3, prior_weight=3)
+        assert estimator.probabilities.tolist() == [0.5, 1 / 6, 1 / 3]
+
+        samples = estimator.sample(size=10, rand_generator=np.random.RandomState(1))
+        assert set(samples.tolist()) <= {0, 1, 2}
+        assert estimator.log_pdf([0, 1]).shape == (2,)
+
+        estimator = CategoricalEstimator(observations=[], n_values=2, prior_weight=1, prior=[3, 1])
+        assert estimator.probabilities.tolist() == [0.75, 0.25]
+
+
+@pytest.mark.experiment_groups_mark
+class TestTPESearchManager(BaseTest):
+    DISABLE_RUNNER = True
+
+    observations = [
+        [{'feature1': 1, 'feature2': 0.1, 'feature3': 'a', 'feature4': 0.01}, 0.9],
+        [{'feature1': 2, 'feature2': 0.5, 'feature3': 'b', 'feature4': 0.05}, 0.2],
+        [{'feature1': 3, 'feature2': 0.9, 'feature3': 'a', 'feature4': 0.002}, 0.5],
+        [{'feature1': 2, 'feature2': 0.4, 'feature3': 'b', 'feature4': 0.08}, 0.1],
+    ]
+
+    def test_optimizer_get_suggestions(self):
+        hptuning_config = HPTuningConfig.from_dict(get_tpe_hptuning())
+        optimizer = TPEOptimizer(hptuning_config=hptuning_config)
+        assert optimizer.get_suggestion() is None
+
+        optimizer.add_observations(configs=[o[0] for o in self.observations],
+                                   metrics=[o[1] for o in self.observations])
+        below, above = optimizer.split_observations()
+        assert below.tolist() == [3]
+        assert sorted(above.tolist()) == [0, 1, 2]
+
+        suggestions = optimizer.get_suggestions(n_suggestions=3)
+        assert len(suggestions) == 3
+        for suggestion in suggestions:
+            assert suggestion['feature1'] in [1, 2, 3]
+            assert 0 <= suggestion['feature2'] <= 1
+            assert suggestion['feature3'] in ['a', 'b']
+            assert 0.001 <= suggestion['feature4'] <= 0.1
+
+    def test_optimizer_pvalues(self):
+        hptuning = get_tpe_hptuning()
+        hptuning['matrix'] = dict(MATRIX, feature1={'pvalues': [(1, 0.1), (2, 0.3), (3, 0.6)]})
+        optimizer = TPEOptimizer(hptuning_config=HPTuningConfig.from_dict(hptuning))
+        assert optimizer._categorical_features['feature1'] == [1, 2, 3]
+        assert optimizer._categorical_priors['feature1'] == [0.1, 0.3, 0.6]
+
+        optimizer.add_observations(configs=[o[0] for o in self.observations],
+                                   metrics=[o[1] for o in self.observations])
+        for suggestion in optimizer.get_suggestions(n_suggestions=3):
+            assert suggestion['feature1'] in [1, 2, 3]
+
+    def test_optimizer_maximize(self):
+        hptuning_config = HPTuningConfig.from_dict(
+            get_tpe_hptuning(metric={'name': 'accuracy', 'optimization': 'maximize'}))
+        optimizer = TPEOptimizer(hptuning_config=hptuning_config)
+        optimizer.add_observations(configs=[o[0] for o in self.observations],
+                                   metrics=[o[1] for o in self.observations])
+        below, _ = optimizer.split_observations()
+        assert below.tolist() == [0]
+
+    def test_get_search_manager(self):
+        hptuning_config = HPTuningConfig.from_dict(get_tpe_hptuning())
+        assert isinstance(get_search_algorithm_manager(hptuning_config), TPESearchManager)
+
+    def test_first_get_suggestions_returns_initial_random_suggestion(self):
+        manager = TPESearchManager(
+            hptuning_config=HPTuningConfig.from_dict(get_tpe_hptuning()))
+        assert len(manager.get_suggestions()) == 4
+
+    def test_warm_start_reduces_initial_trials(self):
+        manager = TPESearchManager(
+            hptuning_config=HPTuningConfig.from_dict(get_tpe_hptuning()),
+            warm_start_observations=self.observations[:3])
+        assert len(manager.get_suggestions()) == 1
+
+        manager = TPESearchManager(
+            hptuning_config=HPTuningConfig.from_dict(get_tpe_hptuning(n_suggestions=2)),
+            warm_start_observations=self.observations)
+        assert len(manager.get_suggestions()) == 2
+
+    def test_iteration_suggestions_calls_optimizer(self):
+        manager = TPESearchManager(
+            hptuning_config=HPTuningConfig.from_dict(get_tpe_hptuning()))
+        iteration_config = BOIterationConfig.from_dict({
+            'iteration': 1,
+            'experiment_ids': [1, 2],
+            'experiments_configs': [[1, self.observations[0][0]], [2, self.observations[1][0]]],
+            'experiments_metrics': [[1, 0.9], [2, 0.2]],
+        })
+        with patch('hpsearch.search_managers.tpe.manager.'
+                   'TPEOptimizer.add_observations') as mock_fct:
+            manager.get_suggestions(iteration_config=iteration_config)
+        assert mock_fct.call_count == 1
+        assert mock_fct.call_args[1]['metrics'] == [0.9, 0.2]
+
+    def test_should_reschedule(self):
+        manager = TPESearchManager(
+            hptuning_config=HPTuningConfig.from_dict(get_tpe_hptuning()))
+        assert manager.should_reschedule(iteration=4) is True
+        assert manager.should_reschedule(iteration=5) is False
+
+    @patch('scheduler.tasks.experiment_groups.experiments_group_create.apply_async')
+    def test_experiment_group_managers(self, _):
+        experiment_group = ExperimentGroupFactory(content=None, hptuning=get_tpe_hptuning())
+        assert experiment_group.search_algorithm == SearchAlgorithms.TPE
+        assert isinstance(experiment_group.search_manager, TPESearchManager)
+        assert isinstance(get_search_iteration_manager(experiment_group), TPEIterationManager)
+        assert experiment_group.iteration_manager.get_metric_name() == 'loss'
+
+    def test_simulate_tpe(self):
+        objective = get_objective('branin')
+        hptuning_config = get_hptuning_config(search_algorithm=SearchAlgorithms.TPE,
+                                              objective=objective,
+                                              concurrency=2,
+                                              n_experiments=4,
+                                              n_iterations=3,
+                                              seed=1)
+        report = HPSearchSimulator(hptuning_config=hptuning_config,
+                                   objective=objective).simulate()
+        assert len(report.runs) == 4 + 3 * 2
+        assert report.n_iterations == 4
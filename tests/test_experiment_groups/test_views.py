@@ -742,3 +742,80 @@ class TestExperimentGroupMetricListViewV1(BaseViewTest):
         data = resp.data['results']
         assert len(data) == 1
         assert data == self.serializer_class(self.queryset[limit:], many=True).data
+
+
+@pytest.mark.experiment_groups_mark
+class TestExperimentGroupStatsViewV1(BaseViewTest):
+    HAS_AUTH = True
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        project = ProjectFactory(user=self.auth_client.user)
+        self.group = ExperimentGroupFactory(project=project)
+        self.experiments = [
+            ExperimentFactory(project=project,
+                              experiment_group=self.group,
+                              declarations={'lr': lr},
+                              last_metric={'loss': loss})
+            for lr, loss in [(0.1, 0.4), (0.1, 0.1), (0.01, 0.3), (0.01, 0.2)]]
+        # An experiment without metrics and an experiment of another group
+        ExperimentFactory(project=project, experiment_group=self.group, declarations={'lr': 0.1})
+        ExperimentFactory(project=project, last_metric={'loss': 0.})
+        self.url = '/{}/{}/{}/groups/{}/stats/'.format(API_V1,
+                                                       project.user.username,
+                                                       project.name,
+                                                       self.group.id)
+
+    def test_get(self):
+        resp = self.auth_client.get(
+            '{}?metrics=loss,accuracy&declarations=lr&percentiles=0.5&top_k=2'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['num_experiments'] == 5
+        assert resp.data['statuses'] == {ExperimentLifeCycle.CREATED: 5}
+
+        loss = resp.data['metrics']['loss']
+        assert loss['count'] == 4
+        assert loss['min'] == pytest.approx(0.1)
+        assert loss['max'] == pytest.approx(0.4)
+        assert loss['mean'] == pytest.approx(0.25)
+        assert loss['percentiles'] == {'0.5': pytest.approx(0.25)}
+        assert [e['id'] for e in loss['top']] == [self.experiments[0].id, self.experiments[2].id]
+        assert [e['id'] for e in loss['bottom']] == [self.experiments[1].id,
+                                                     self.experiments[3].id]
+        assert resp.data['metrics']['accuracy']['count'] == 0
+        assert resp.data['metrics']['accuracy']['top'] == []
+
+        assert resp.data['declarations']['lr'] == [{'value': 0.1, 'count': 3},
+                                                   {'value': 0.01, 'count': 2}]
+
+    def test_get_is_cached_until_new_metrics(self):
+        url = '{}?metrics=loss'.format(self.url)
+        assert self.auth_client.get(url).data['metrics']['loss']['max'] == pytest.approx(0.4)
+
+        # Updates bypassing the experiments' methods are not seen
+        Experiment.objects.filter(id=self.experiments[0].id).update(last_metric={'loss': 0.9})
+        assert self.auth_client.get(url).data['metrics']['loss']['max'] == pytest.approx(0.4)
+
+        ExperimentMetric.objects.create(experiment=self.experiments[1], values={'loss': 1.})
+        assert self.auth_client.get(url).data['metrics']['loss']['max'] == pytest.approx(1.)
+
+    def test_get_validates_params(self):
+        for params in ['percentiles=2', 'percentiles=a', 'top_k=-1', 'top_k=1000']:
+            resp = self.auth_client.get('{}?{}'.format(self.url, params))
+            assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_rejects_invalid_names(self):
+        for params in ["metrics=loss') OR 1=1 --", "declarations=lr'"]:
+            resp = self.auth_client.get('{}?{}'.format(self.url, params))
+            assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_skips_non_numeric_metrics(self):
+        for value in ['NaN', 'high', None, {'value': 1}]:
+            ExperimentFactory(project=self.group.project,
+                              experiment_group=self.group,
+                              last_metric={'loss': value})
+        resp = self.auth_client.get('{}?metrics=loss'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['metrics']['loss']['count'] == 4
+        assert resp.data['metrics']['loss']['max'] == pytest.approx(0.4)
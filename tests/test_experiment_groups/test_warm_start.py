@@ -0,0 +1,252 @@
+from unittest.mock import patch
+
+import pytest
+
+from marshmallow import ValidationError
+
+from db.models.experiment_groups import ExperimentGroup
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from factories.factory_experiments import ExperimentFactory
+from hpsearch.schemas import (
+    BOIterationConfig,
+    HyperbandIterationConfig,
+    get_warm_start_config
+)
+from hpsearch.schemas.warm_start import WarmStartConfig
+from hpsearch.search_managers import BOSearchManager, HyperbandSearchManager
+from hpsearch.warm_start import get_matching_declarations, get_warm_start_observations
+from schemas.hptuning import HPTuningConfig
+from tests.utils import BaseTest
+
+MATRIX = {
+    'feature1': {'values': [1, 2, 3]},
+    'feature2': {'uniform': [0, 1]},
+    'feature3': {'values': ['a', 'b']},
+}
+
+
+def get_bo_hptuning(**kwargs):
+    hptuning = {
+        'concurrency': 2,
+        'bo': {
+            'n_iterations': 5,
+            'n_initial_trials': 4,
+            'metric': {'name': 'loss', 'optimization': 'minimize'},
+            'utility_function': {
+                'acquisition_function': 'ucb',
+                'kappa': 1.2,
+                'gaussian_process': {
+                    'kernel': 'matern',
+                    'length_scale': 1.0,
+                    'nu': 1.9,
+                    'n_restarts_optimizer': 0
+                },
+                'n_warmup': 1,
+                'n_iter': 1
+            }
+        },
+        'matrix': MATRIX
+    }
+    hptuning.update(kwargs)
+    return hptuning
+
+
+@pytest.mark.experiment_groups_mark
+class TestWarmStartConfig(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_warm_start_config(self):
+        config = {'experiment_groups': [1, 2], 'query': 'metric.loss:<0.5', 'n_experiments': 10}
+        assert WarmStartConfig.from_dict(config).to_dict() == config
+
+        config = WarmStartConfig.from_dict({'experiment_groups': [1]})
+        assert config.n_experiments == 500
+        assert config.query is None
+
+        with self.assertRaises(ValidationError):
+            WarmStartConfig.from_dict({'n_experiments': 10})
+
+    def test_get_warm_start_config(self):
+        assert get_warm_start_config(get_bo_hptuning()) is None
+        config = get_warm_start_config(get_bo_hptuning(warm_start={'experiment_groups': [1]}))
+        assert config.experiment_groups == [1]
+
+    def test_get_matching_declarations(self):
+        matrix = HPTuningConfig.from_dict(get_bo_hptuning()).matrix
+        assert get_matching_declarations(None, matrix) is None
+        # Missing key
+        assert get_matching_declarations({'feature1': 1, 'feature2': 0.5}, matrix) is None
+        # Values outside of the space
+        assert get_matching_declarations(
+            {'feature1': 4, 'feature2': 0.5, 'feature3': 'a'}, matrix) is None
+        assert get_matching_declarations(
+            {'feature1': 1, 'feature2': 1.5, 'feature3': 'a'}, matrix) is None
+        assert get_matching_declarations(
+            {'feature1': 1, 'feature2': 0.5, 'feature3': 'c'}, matrix) is None
+        # Extra keys are dropped
+        assert get_matching_declarations(
+            {'feature1': 1, 'feature2': 0.5, 'feature3': 'a', 'lr': 0.1},
+            matrix) == {'feature1': 1, 'feature2': 0.5, 'feature3': 'a'}
+
+    def test_get_matching_declarations_pvalues(self):
+        matrix = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'hyperband': {
+                'max_iter': 9,
+                'eta': 3,
+                'resource': {'name': 'steps', 'type': 'int'},
+                'metric': {'name': 'loss', 'optimization': 'minimize'}
+            },
+            'matrix': {'feature1': {'pvalues': [(1, 0.3), (2, 0.7)]}}
+        }).matrix
+        assert get_matching_declarations({'feature1': 2}, matrix) == {'feature1': 2}
+        assert get_matching_declarations({'feature1': 3}, matrix) is None
+
+
+@pytest.mark.experiment_groups_mark
+class TestWarmStartSearchManagers(BaseTest):
+    DISABLE_RUNNER = True
+
+    observations = [
+        [{'feature1': 1, 'feature2': 0.1, 'feature3': 'a'}, 0.9],
+        [{'feature1': 2, 'feature2': 0.5, 'feature3': 'b'}, 0.2],
+        [{'feature1': 3, 'feature2': 0.9, 'feature3': 'a'}, 0.5],
+    ]
+
+    def test_bo_warm_start_reduces_initial_trials(self):
+        hptuning_config = HPTuningConfig.from_dict(get_bo_hptuning())
+        manager = BOSearchManager(hptuning_config=hptuning_config,
+                                  warm_start_observations=self.observations)
+        assert len(manager.get_suggestions()) == 1
+
+        manager = BOSearchManager(hptuning_config=hptuning_config,
+                                  warm_start_observations=self.observations * 2)
+        with patch('hpsearch.search_managers.bayesian_optimization.manager.'
+                   'BOOptimizer.add_observations') as mock_fct:
+            manager.get_suggestions()
+        assert mock_fct.call_count == 1
+        assert len(mock_fct.call_args[1]['configs']) == 6
+
+    def test_bo_warm_start_observations_are_added_to_iterations(self):
+        hptuning_config = HPTuningConfig.from_dict(get_bo_hptuning())
+        manager = BOSearchManager(hptuning_config=hptuning_config,
+                                  warm_start_observations=self.observations)
+        iteration_config = BOIterationConfig.from_dict({
+            'iteration': 1,
+            'experiment_ids': [1],
+            'experiments_configs': [[1, {'feature1': 2, 'feature2': 0.3, 'feature3': 'a'}]],
+            'experiments_metrics': [[1, 0.3]],
+        })
+        with patch('hpsearch.search_managers.bayesian_optimization.manager.'
+                   'BOOptimizer.add_observations') as mock_fct:
+            manager.get_suggestions(iteration_config=iteration_config)
+        assert len(mock_fct.call_args[1]['configs']) == 4
+        assert mock_fct.call_args[1]['metrics'] == [0.9, 0.2, 0.5, 0.3]
+
+    def test_hyperband_warm_start_suggestions(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'hyperband': {
+                'max_iter': 9,
+                'eta': 3,
+                'resource': {'name': 'steps', 'type': 'int'},
+                'resume': False,
+                'metric': {'name': 'loss', 'optimization': 'minimize'}
+            },
+            'matrix': MATRIX
+        })
+        manager = HyperbandSearchManager(hptuning_config=hptuning_config,
+                                         warm_start_observations=self.observations)
+        iteration_config = HyperbandIterationConfig(iteration=0, bracket_iteration=0)
+        n_configs = manager.get_n_configs(bracket=manager.get_bracket(iteration=0))
+        suggestions = manager.get_suggestions(iteration_config=iteration_config)
+        assert len(suggestions) == n_configs
+        # The best previous configs are used first
+        assert suggestions[0] == {'feature1': 2, 'feature2': 0.5, 'feature3': 'b', 'steps': 1}
+        assert suggestions[1] == {'feature1': 3, 'feature2': 0.9, 'feature3': 'a', 'steps': 1}
+        assert all(suggestion['steps'] == 1 for suggestion in suggestions)
+
+
+@pytest.mark.experiment_groups_mark
+class TestWarmStartObservations(BaseTest):
+    DISABLE_RUNNER = True
+
+    @patch('scheduler.tasks.experiment_groups.experiments_group_create.apply_async')
+    def test_get_warm_start_observations(self, _):
+        previous_group = ExperimentGroupFactory()
+        project = previous_group.project
+        declarations = {'feature1': 1, 'feature2': 0.5, 'feature3': 'a', 'lr': 0.1}
+        ExperimentFactory(project=project,
+                          experiment_group=previous_group,
+                          declarations=declarations,
+                          last_metric={'loss': 0.4})
+        # Not matching the space
+        ExperimentFactory(project=project,
+                          experiment_group=previous_group,
+                          declarations={'feature1': 1},
+                          last_metric={'loss': 0.1})
+        # Without the search metric
+        ExperimentFactory(project=project,
+                          experiment_group=previous_group,
+                          declarations=declarations,
+                          last_metric={'accuracy': 0.1})
+        # Another project
+        ExperimentFactory(declarations=declarations, last_metric={'loss': 0.1})
+
+        experiment_group = ExperimentGroupFactory(
+            project=project,
+            content=None,
+            hptuning=get_bo_hptuning(warm_start={'experiment_groups': [previous_group.id]}))
+        assert experiment_group.warm_start.experiment_groups == [previous_group.id]
+        assert get_warm_start_observations(experiment_group) == [
+            [{'feature1': 1, 'feature2': 0.5, 'feature3': 'a'}, 0.4]]
+        assert experiment_group.search_manager.warm_start_observations == [
+            [{'feature1': 1, 'feature2': 0.5, 'feature3': 'a'}, 0.4]]
+
+        # Using a query
+        experiment_group = ExperimentGroupFactory(
+            project=project,
+            content=None,
+            hptuning=get_bo_hptuning(warm_start={'query': 'metric.loss:<0.3'}))
+        assert get_warm_start_observations(experiment_group) == []
+
+        # No warm start
+        experiment_group = ExperimentGroupFactory(project=project,
+                                                  content=None,
+                                                  hptuning=get_bo_hptuning())
+        assert get_warm_start_observations(experiment_group) is None
+
+    @patch('scheduler.tasks.experiment_groups.experiments_group_create.apply_async')
+    def test_warm_start_observations_are_stored_with_the_iterations(self, _):
+        previous_group = ExperimentGroupFactory()
+        project = previous_group.project
+        ExperimentFactory(project=project,
+                          experiment_group=previous_group,
+                          declarations={'feature1': 1, 'feature2': 0.5, 'feature3': 'a'},
+                          last_metric={'loss': 0.4})
+        experiment_group = ExperimentGroupFactory(
+            project=project,
+            content=None,
+            hptuning=get_bo_hptuning(warm_start={'experiment_groups': [previous_group.id]}))
+        observations = [[{'feature1': 1, 'feature2': 0.5, 'feature3': 'a'}, 0.4]]
+
+        iteration = experiment_group.iteration_manager.create_iteration(experiment_ids=[],
+                                                                        experiments_configs=[])
+        assert iteration.data['warm_start_observations'] == observations
+        iteration = experiment_group.iteration_manager.create_iteration(experiment_ids=[],
+                                                                        experiments_configs=[])
+        assert iteration.data['warm_start_observations'] == observations
+
+        # The search manager reads the observations from the iteration
+        experiment_group = ExperimentGroup.objects.get(id=experiment_group.id)
+        with patch('hpsearch.warm_start.get_warm_start_observations') as mock_observations:
+            assert experiment_group.search_manager.warm_start_observations == observations
+        assert mock_observations.call_count == 0
+
+        # Without a warm start, the iterations do not have observations
+        experiment_group = ExperimentGroupFactory(project=project,
+                                                  content=None,
+                                                  hptuning=get_bo_hptuning())
+        iteration = experiment_group.iteration_manager.create_iteration(experiment_ids=[],
+                                                                        experiments_configs=[])
+        assert 'warm_start_observations' not in iteration.data
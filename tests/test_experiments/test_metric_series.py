@@ -0,0 +1,93 @@
+import datetime
+
+from unittest.mock import patch
+
+import pytest
+
+from django.utils import timezone
+
+from constants.metrics import MetricSeriesX
+from db.models.experiments import ExperimentMetric
+from db.models.metric_series import ExperimentMetricSeries
+from factories.factory_experiments import ExperimentFactory
+from scheduler.tasks.experiments import experiments_set_metrics
+from tests.utils import BaseTest
+
+
+@pytest.mark.experiments_mark
+class TestExperimentMetricSeries(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.experiment = ExperimentFactory()
+        self.created_at = timezone.now()
+
+    def create_metrics(self, n_metrics, start=0):
+        experiments_set_metrics(experiment_id=self.experiment.id, data=[{
+            'created_at': self.created_at + datetime.timedelta(seconds=i),
+            'step': i,
+            'values': {'loss': 1. / (i + 1), 'accuracy': i / 10., 'tag': 'foo'}
+        } for i in range(start, start + n_metrics)])
+
+    def test_new_metric_is_appended_to_the_series(self):
+        ExperimentMetric.objects.create(experiment=self.experiment,
+                                        values={'loss': 0.5, 'flag': True})
+        assert ExperimentMetricSeries.get_names(self.experiment.id) == ['loss']
+        xs, ys = ExperimentMetricSeries.get_series(self.experiment.id, 'loss')
+        assert ys.tolist() == [0.5]
+        # No step was reported
+        xs, ys = ExperimentMetricSeries.get_series(self.experiment.id, 'loss',
+                                                   x=MetricSeriesX.STEP)
+        assert ys.tolist() == []
+
+    @patch.object(ExperimentMetricSeries, 'TAIL_SIZE', 2)
+    @patch.object(ExperimentMetricSeries, 'CHUNK_SIZE', 4)
+    def test_series_chunks_and_rollups(self):
+        self.create_metrics(6)
+        self.create_metrics(3, start=6)
+
+        assert ExperimentMetricSeries.get_names(self.experiment.id) == ['accuracy', 'loss']
+        chunks = ExperimentMetricSeries.objects.filter(experiment=self.experiment, name='loss')
+        assert [chunk.count for chunk in chunks] == [4, 4, 1]
+        assert [chunk.min_step for chunk in chunks] == [0, 4, 8]
+        assert [chunk.max_step for chunk in chunks] == [3, 7, 8]
+        assert chunks[0].max_value == 1.
+        assert chunks[0].last_value == 0.25
+
+        xs, ys = ExperimentMetricSeries.get_series(self.experiment.id, 'accuracy',
+                                                   x=MetricSeriesX.STEP)
+        assert xs.tolist() == list(range(9))
+        assert ys.tolist() == [i / 10. for i in range(9)]
+
+        xs, ys = ExperimentMetricSeries.get_series(self.experiment.id, 'accuracy',
+                                                   x=MetricSeriesX.STEP, start=3, end=5)
+        assert xs.tolist() == [3, 4, 5]
+
+        start = (self.created_at + datetime.timedelta(seconds=7)).timestamp()
+        xs, ys = ExperimentMetricSeries.get_series(self.experiment.id, 'accuracy', start=start)
+        assert ys.tolist() == [0.7, 0.8]
+
+    @patch.object(ExperimentMetricSeries, 'TAIL_SIZE', 2)
+    @patch.object(ExperimentMetricSeries, 'CHUNK_SIZE', 4)
+    def test_small_appends_go_to_a_tail_chunk_and_are_compacted(self):
+        chunks = ExperimentMetricSeries.objects.filter(experiment=self.experiment, name='loss')
+        self.create_metrics(1)
+        self.create_metrics(1, start=1)
+        assert [chunk.count for chunk in chunks] == [2]
+        self.create_metrics(1, start=2)
+        assert [chunk.count for chunk in chunks] == [2, 1]
+        # The tail chunks hold a full chunk of points, they are compacted
+        self.create_metrics(1, start=3)
+        assert [chunk.count for chunk in chunks] == [4]
+        self.create_metrics(1, start=4)
+        assert [chunk.count for chunk in chunks] == [4, 1]
+
+        xs, ys = ExperimentMetricSeries.get_series(self.experiment.id, 'loss',
+                                                   x=MetricSeriesX.STEP)
+        assert xs.tolist() == list(range(5))
+        assert ys.tolist() == [1. / (i + 1) for i in range(5)]
+
+    def test_get_series_raises_for_wrong_x(self):
+        with self.assertRaises(ValueError):
+            ExperimentMetricSeries.get_series(self.experiment.id, 'loss', x='foo')
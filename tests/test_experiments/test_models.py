@@ -1,3 +1,4 @@
+import datetime
 import os
 
 from unittest.mock import patch
@@ -356,6 +357,48 @@ class TestExperimentModel(BaseTest):
 
         assert experiment.metrics.count() == 3
 
+    def test_set_many_metrics_updates_last_metric_once(self):
+        config = ExperimentSpecification.read(experiment_spec_content)
+        experiment = ExperimentFactory(config=config.parsed_data)
+        create_at = timezone.now()
+        data = [{
+            'created_at': create_at + datetime.timedelta(seconds=1),
+            'values': {'accuracy': 0.8, 'loss': 0.1}
+        }, {
+            'created_at': create_at,
+            'values': {'accuracy': 0.7, 'precision': 0.9}
+        }]
+
+        with patch('db.models.experiments.auditor.record') as auditor_record:
+            with patch.object(Experiment, 'merge_last_metric',
+                              side_effect=Experiment.merge_last_metric) as merge_last_metric:
+                experiments_set_metrics(experiment_id=experiment.id, data=data)
+
+        assert experiment.metrics.count() == 2
+        assert auditor_record.call_count == 1
+        assert merge_last_metric.call_count == 1
+        experiment.refresh_from_db()
+        # The metrics are merged in chronological order
+        assert experiment.last_metric == {'accuracy': 0.8, 'loss': 0.1, 'precision': 0.9}
+
+    def test_update_last_metric_merges_into_the_stored_last_metric(self):
+        experiment = ExperimentFactory(last_metric={'loss': 0.5, 'accuracy': 0.5})
+        stale_experiment = Experiment.objects.get(id=experiment.id)
+
+        experiment.update_last_metric(values=[{'accuracy': 0.8}])
+        # The stale instance does not override the accuracy
+        stale_experiment.update_last_metric(values=[{'loss': 0.1}, {'precision': 0.9}])
+
+        expected = {'loss': 0.1, 'accuracy': 0.8, 'precision': 0.9}
+        assert stale_experiment.last_metric == expected
+        experiment.refresh_from_db()
+        assert experiment.last_metric == expected
+
+        experiment = ExperimentFactory(last_metric=None)
+        experiment.update_last_metric(values=[{'loss': 0.3}])
+        experiment.refresh_from_db()
+        assert experiment.last_metric == {'loss': 0.3}
+
     def test_master_success_influences_other_experiment_workers_status(self):
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
             with patch.object(Experiment, 'set_status') as _:  # noqa
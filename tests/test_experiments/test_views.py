@@ -1,4 +1,6 @@
 # pylint:disable=too-many-lines
+import csv
+import io
 import os
 import time
 
@@ -182,6 +184,40 @@ class TestProjectExperimentListViewV1(BaseViewTest):
         assert len(data) == 1
         assert data == self.serializer_class(self.queryset[limit:], many=True).data
 
+    def test_cursor_pagination(self):
+        ids = list(self.queryset.order_by('-created_at', '-id').values_list('id', flat=True))
+        limit = self.num_objects - 1
+        resp = self.auth_client.get("{}?cursor=&limit={}".format(self.url, limit))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['count'] is None
+        assert resp.data['previous'] is None
+        assert [data['id'] for data in resp.data['results']] == ids[:limit]
+
+        next_page = resp.data['next']
+        assert next_page is not None
+        resp = self.auth_client.get(next_page)
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['next'] is None
+        assert [data['id'] for data in resp.data['results']] == ids[limit:]
+
+        previous_page = resp.data['previous']
+        assert previous_page is not None
+        resp = self.auth_client.get(previous_page)
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['previous'] is None
+        assert resp.data['next'] is not None
+        assert [data['id'] for data in resp.data['results']] == ids[:limit]
+
+        resp = self.auth_client.get("{}?cursor=&count=exact".format(self.url))
+        assert resp.data['count'] == self.num_objects
+        resp = self.auth_client.get("{}?cursor=&count=estimate".format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert isinstance(resp.data['count'], int)
+
+        for params in ['cursor=foo', 'cursor=&count=foo', 'cursor=&sort=created_at']:
+            resp = self.auth_client.get("{}?{}".format(self.url, params))
+            assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_get_order(self):
         resp = self.auth_client.get(self.url + '?sort=created_at,updated_at')
         assert resp.status_code == status.HTTP_200_OK
@@ -1116,6 +1152,19 @@ class TestExperimentMetricListViewV1(BaseViewTest):
         assert len(data) == 1
         assert data == self.serializer_class(self.queryset[limit:], many=True).data
 
+    def test_cursor_pagination(self):
+        limit = self.num_objects - 1
+        resp = self.auth_client.get("{}?cursor=&limit={}".format(self.url, limit))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['results'] == self.serializer_class(self.queryset[:limit],
+                                                             many=True).data
+
+        resp = self.auth_client.get(resp.data['next'])
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['next'] is None
+        assert resp.data['results'] == self.serializer_class(self.queryset[limit:],
+                                                             many=True).data
+
     def test_create(self):
         data = {}
         resp = self.auth_client.post(self.url, data)
@@ -1165,6 +1214,224 @@ class TestExperimentMetricListViewV1(BaseViewTest):
         assert last_object.values == data['values']
 
 
+@pytest.mark.experiments_mark
+class TestExperimentMetricSeriesViewV1(BaseViewTest):
+    HAS_AUTH = True
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        project = ProjectFactory(user=self.auth_client.user)
+        self.experiment = ExperimentFactory(project=project)
+        self.url = '/{}/{}/{}/experiments/{}/metrics/series/'.format(API_V1,
+                                                                     project.user.username,
+                                                                     project.name,
+                                                                     self.experiment.id)
+        for i in range(20):
+            ExperimentMetricFactory(experiment=self.experiment,
+                                    step=i,
+                                    values={'accuracy': i / 20, 'loss': 1 - i / 20})
+
+    def test_get(self):
+        with patch('auditor.record') as auditor_record:
+            resp = self.auth_client.get(self.url)
+        assert resp.status_code == status.HTTP_200_OK
+        assert auditor_record.call_count == 1
+        assert resp.data['x'] == 'timestamp'
+        assert [series['name'] for series in resp.data['series']] == ['accuracy', 'loss']
+        assert all(series['count'] == 20 for series in resp.data['series'])
+        assert all(len(series['x']) == 20 for series in resp.data['series'])
+
+    def test_get_downsampled_range(self):
+        resp = self.auth_client.get(
+            '{}?names=loss&x=step&start=5&end=14&n_points=4'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        series = resp.data['series']
+        assert len(series) == 1
+        assert series[0]['name'] == 'loss'
+        assert series[0]['count'] == 10
+        assert series[0]['x'][0] == 5
+        assert series[0]['x'][-1] == 14
+        assert len(series[0]['y']) == 4
+        assert series[0]['max'] == 1 - 5 / 20
+        assert series[0]['last'] == 1 - 14 / 20
+
+        resp = self.auth_client.get('{}?downsampling=min_max&n_points=4'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert all(len(series['x']) <= 4 for series in resp.data['series'])
+
+    def test_get_wrong_params(self):
+        for params in ['x=foo', 'downsampling=foo', 'n_points=foo', 'n_points=1', 'start=foo']:
+            resp = self.auth_client.get('{}?{}'.format(self.url, params))
+            assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.experiments_mark
+class TestProjectExperimentMetricSeriesViewV1(BaseViewTest):
+    HAS_AUTH = True
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.project = ProjectFactory(user=self.auth_client.user)
+        self.experiment_group = ExperimentGroupFactory(project=self.project)
+        self.experiments = [ExperimentFactory(project=self.project,
+                                              experiment_group=self.experiment_group)
+                            for _ in range(2)]
+        self.independent_experiment = ExperimentFactory(project=self.project)
+        self.url = '/{}/{}/{}/experiments/metrics/series/'.format(API_V1,
+                                                                  self.project.user.username,
+                                                                  self.project.name)
+        for i, experiment in enumerate(self.experiments + [self.independent_experiment]):
+            for step in range(10 * (i + 1)):
+                ExperimentMetricFactory(experiment=experiment,
+                                        step=step,
+                                        values={'loss': 1 / (step + 1), 'accuracy': step / 30})
+
+    def test_get(self):
+        resp = self.auth_client.get('{}?names=loss,accuracy&x=step&n_points=5'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['x'] == 'step'
+        assert resp.data['names'] == ['loss', 'accuracy']
+        # The grid covers the union of the series' ranges
+        assert len(resp.data['grid']) == 5
+        assert resp.data['grid'][0] < 6 < resp.data['grid'][-1]
+        assert len(resp.data['experiments']) == 3
+        for data in resp.data['experiments']:
+            assert set(data['metrics'].keys()) == {'loss', 'accuracy'}
+            assert all(len(values) == 5 for values in data['metrics'].values())
+
+        # The shorter series have no values at the end of the grid
+        experiments = {data['id']: data for data in resp.data['experiments']}
+        assert experiments[self.experiments[0].id]['metrics']['loss'][-1] is None
+        assert experiments[self.independent_experiment.id]['metrics']['loss'][-1] is not None
+
+    def test_get_defaults_to_steps(self):
+        resp = self.auth_client.get('{}?names=loss&n_points=5'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['x'] == 'step'
+        assert resp.data['grid'][0] < 6 < resp.data['grid'][-1]
+
+    def test_get_group(self):
+        resp = self.auth_client.get('{}?names=loss&x=step&group={}'.format(
+            self.url, self.experiment_group.id))
+        assert resp.status_code == status.HTTP_200_OK
+        assert {data['id'] for data in resp.data['experiments']} == {
+            experiment.id for experiment in self.experiments}
+
+        resp = self.auth_client.get('{}?names=loss&independent=true'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert [data['id'] for data in resp.data['experiments']] == [
+            self.independent_experiment.id]
+
+    def test_get_query(self):
+        resp = self.auth_client.get('{}?names=loss&x=step&query=id:{}'.format(
+            self.url, self.experiments[1].id))
+        assert resp.status_code == status.HTTP_200_OK
+        assert [data['id'] for data in resp.data['experiments']] == [self.experiments[1].id]
+
+    def test_get_range(self):
+        resp = self.auth_client.get(
+            '{}?names=loss&x=step&start=0&end=4&n_points=5'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['grid'] == pytest.approx([0.4, 1.2, 2.0, 2.8, 3.6])
+        for data in resp.data['experiments']:
+            assert all(value is not None for value in data['metrics']['loss'])
+
+    def test_get_unknown_metric(self):
+        resp = self.auth_client.get('{}?names=foo'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['grid'] == []
+        assert resp.data['experiments'] == []
+
+    def test_get_wrong_params(self):
+        for params in ['', 'names=loss&x=foo', 'names=loss&n_points=1', 'names=loss&group=1000']:
+            resp = self.auth_client.get('{}?{}'.format(self.url, params))
+            assert resp.status_code in (status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND)
+
+
+@pytest.mark.experiments_mark
+class TestProjectExperimentExportViewV1(BaseViewTest):
+    HAS_AUTH = True
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.project = ProjectFactory(user=self.auth_client.user)
+        self.experiment_group = ExperimentGroupFactory(project=self.project)
+        self.experiment1 = ExperimentFactory(project=self.project,
+                                             experiment_group=self.experiment_group,
+                                             declarations={'lr': 0.1, 'optimizer': 'adam'})
+        self.experiment2 = ExperimentFactory(project=self.project,
+                                             declarations={'lr': 0.01, 'layers': [1, 2]})
+        for step in range(3):
+            ExperimentMetricFactory(experiment=self.experiment1,
+                                    step=step,
+                                    values={'loss': 1 / (step + 1)})
+        ExperimentMetricFactory(experiment=self.experiment2, values={'accuracy': 0.9})
+        # An experiment of another project
+        ExperimentFactory(declarations={'momentum': 0.9})
+        self.url = '/{}/{}/{}/experiments/export/'.format(API_V1,
+                                                          self.project.user.username,
+                                                          self.project.name)
+
+    def get_csv_rows(self, url):
+        resp = self.auth_client.get(url)
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp['Content-Type'] == 'text/csv'
+        content = b''.join(resp.streaming_content).decode()
+        header, *rows = csv.reader(io.StringIO(content))
+        return header, [dict(zip(header, row)) for row in rows]
+
+    def test_export_experiments(self):
+        header, rows = self.get_csv_rows(self.url)
+        assert len(rows) == 2
+        assert header == [
+            'id', 'uuid', 'name', 'experiment_group', 'last_status', 'created_at',
+            'started_at', 'finished_at', 'declarations.layers', 'declarations.lr',
+            'declarations.optimizer', 'metric.accuracy', 'metric.loss']
+        rows = {int(row['id']): row for row in rows}
+        row1 = rows[self.experiment1.id]
+        assert row1['experiment_group'] == str(self.experiment_group.id)
+        assert row1['declarations.lr'] == '0.1'
+        assert row1['declarations.optimizer'] == 'adam'
+        assert row1['declarations.layers'] == ''
+        assert float(row1['metric.loss']) == pytest.approx(1 / 3)
+        assert row1['metric.accuracy'] == ''
+        row2 = rows[self.experiment2.id]
+        assert row2['experiment_group'] == ''
+        assert row2['declarations.layers'] == '[1, 2]'
+        assert float(row2['metric.accuracy']) == pytest.approx(0.9)
+
+    def test_export_filtered_experiments(self):
+        header, rows = self.get_csv_rows('{}?independent=true'.format(self.url))
+        assert [int(row['id']) for row in rows] == [self.experiment2.id]
+        assert 'declarations.optimizer' not in header
+
+    def test_export_metrics(self):
+        header, rows = self.get_csv_rows('{}?content=metrics'.format(self.url))
+        assert header == ['experiment', 'name', 'timestamp', 'step', 'value']
+        assert len(rows) == 4
+        rows1 = [row for row in rows if row['experiment'] == str(self.experiment1.id)]
+        assert [float(row['step']) for row in rows1] == [0, 1, 2]
+        rows2 = [row for row in rows if row['experiment'] == str(self.experiment2.id)]
+        assert [(row['name'], row['step']) for row in rows2] == [('accuracy', '')]
+        assert [float(row['value']) for row in rows1] == pytest.approx([1, 1 / 2, 1 / 3])
+
+    def test_export_validates_params(self):
+        for params in ['format=xlsx', 'content=jobs']:
+            resp = self.auth_client.get('{}?{}'.format(self.url, params))
+            assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_parquet(self):
+        parquet = pytest.importorskip('pyarrow.parquet')
+        resp = self.auth_client.get('{}?format=parquet'.format(self.url))
+        assert resp.status_code == status.HTTP_200_OK
+        table = parquet.read_table(io.BytesIO(b''.join(resp.streaming_content)))
+        assert table.num_rows == 2
+        assert 'declarations.lr' in table.schema.names
+
+
 @pytest.mark.experiments_mark
 class TestExperimentStatusDetailViewV1(BaseViewTest):
     serializer_class = ExperimentStatusSerializer
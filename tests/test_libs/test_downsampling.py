@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from constants.metrics import Downsampling
+from libs.downsampling import align, downsample, lttb, min_max
+from tests.utils import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestDownsampling(BaseTest):
+    def test_lttb(self):
+        x = np.arange(100, dtype=float)
+        y = np.zeros(100)
+        y[42] = 10
+        xs, ys = lttb(x, y, n_points=10)
+        assert len(xs) == len(ys) == 10
+        # The first and last points are kept
+        assert xs[0] == 0 and xs[-1] == 99
+        # The peak is kept
+        assert 42 in xs.tolist()
+        assert xs.tolist() == sorted(xs.tolist())
+
+    def test_lttb_small_series(self):
+        x = [0, 1, 2]
+        y = [1, 2, 3]
+        xs, ys = lttb(x, y, n_points=10)
+        assert xs.tolist() == x
+        assert ys.tolist() == y
+
+        xs, ys = lttb(np.arange(10), np.arange(10), n_points=2)
+        assert xs.tolist() == [0, 9]
+
+    def test_min_max(self):
+        x = np.arange(100, dtype=float)
+        y = np.sin(x)
+        y[10] = -5
+        y[80] = 5
+        xs, ys = min_max(x, y, n_points=10)
+        assert len(xs) <= 10
+        assert -5 in ys.tolist()
+        assert 5 in ys.tolist()
+        assert xs.tolist() == sorted(xs.tolist())
+
+    def test_downsample(self):
+        x = np.arange(100)
+        assert len(downsample(x, x, n_points=20)[0]) == 20
+        assert len(downsample(x, x, n_points=20, method=Downsampling.MIN_MAX)[0]) <= 20
+        with self.assertRaises(ValueError):
+            downsample(x, x, n_points=20, method='foo')
+
+    def test_align(self):
+        values = align([0, 1, 2, 5, 6, 7], [1, 3, 5, 7, 9, 11], edges=[0, 2, 4, 6])
+        # The last bucket includes the last edge, points out of the edges are ignored
+        assert values.tolist() == [2, 5, 8]
+
+        values = align([0, 3], [1, 2], edges=[0, 1, 2, 3])
+        assert values[0] == 1
+        assert np.isnan(values[1])
+        assert values[2] == 2
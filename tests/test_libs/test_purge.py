@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+import pytest
+
+from django.utils import timezone
+
+from db.models.activitylogs import ActivityLog
+from db.models.notification import Notification, NotificationEvent
+from event_manager.events.experiment import EXPERIMENT_SUCCEEDED
+from factories.factory_experiments import ExperimentFactory
+from libs.purge import delete_in_batches
+from tests.utils import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestPurge(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.experiment = ExperimentFactory()
+        self.now = timezone.now()
+
+    def create_rows(self, model, days):
+        return [model.objects.create(event_type=EXPERIMENT_SUCCEEDED,
+                                     actor_id=self.experiment.user.id,
+                                     context={},
+                                     created_at=self.now - timedelta(days=day),
+                                     content_object=self.experiment)
+                for day in days]
+
+    def test_delete_in_batches(self):
+        self.create_rows(ActivityLog, days=[0, 10, 11, 12, 13, 14])
+
+        assert delete_in_batches(model=ActivityLog,
+                                 last_date=self.now - timedelta(days=5),
+                                 batch_size=2) == 5
+        assert ActivityLog.objects.count() == 1
+        assert ActivityLog.objects.get().created_at == self.now
+
+    def test_delete_in_batches_cascades(self):
+        notification_events = self.create_rows(NotificationEvent, days=[0, 10, 11])
+        for notification_event in notification_events:
+            Notification.objects.create(user=self.experiment.user, event=notification_event)
+
+        assert delete_in_batches(model=NotificationEvent,
+                                 last_date=self.now - timedelta(days=5),
+                                 batch_size=1,
+                                 cascades=[(Notification, 'event_id')]) == 2
+        assert list(NotificationEvent.objects.all()) == [notification_events[0]]
+        assert list(Notification.objects.values_list('event_id', flat=True)) == [
+            notification_events[0].id]
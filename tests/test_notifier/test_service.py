@@ -3,6 +3,9 @@ from unittest.mock import patch
 
 import pytest
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import notifier
 
 from action_manager.actions.email import EmailAction
@@ -13,8 +16,14 @@ from action_manager.actions.webhooks.pagerduty_webhook import PagerDutyWebHookAc
 from action_manager.actions.webhooks.slack_webhook import SlackWebHookAction
 from action_manager.actions.webhooks.webhook import WebHookAction
 from db.models.notification import Notification, NotificationEvent
-from event_manager.events.experiment import EXPERIMENT_SUCCEEDED, EXPERIMENT_VIEWED
+from event_manager.events.experiment import (
+    EXPERIMENT_FAILED,
+    EXPERIMENT_SUCCEEDED,
+    EXPERIMENT_VIEWED
+)
 from factories.factory_experiments import ExperimentFactory
+from factories.factory_users import UserFactory
+from notifier.recipients import RecipientSpec
 from tests.utils import BaseTest
 
 
@@ -132,3 +141,66 @@ class NotifierTest(BaseTest):
         assert notification_event.content_object == self.experiment
         assert set(notifications.values_list('user__id', flat=True)) == {
             self.experiment.user.id, self.experiment.project.user.id}
+
+    def test_routes_the_event_types_to_the_handling_actions(self):
+        assert set(notifier.backend.get_actions(EXPERIMENT_SUCCEEDED)) == set(
+            notifier.backend.action_manager.values)
+        assert notifier.backend.get_actions(EXPERIMENT_VIEWED) == []
+
+    @patch.object(EmailAction, 'execute')
+    @patch.object(WebHookAction, 'execute')
+    def test_record_only_executes_the_actions_handling_the_event(self,
+                                                                webhook_execute,
+                                                                email_execute):
+        with patch.object(WebHookAction, 'event_types', [EXPERIMENT_FAILED]):
+            notifier.backend.build_routes()
+            try:
+                notifier.record(event_type=EXPERIMENT_SUCCEEDED,
+                                instance=self.experiment)
+            finally:
+                notifier.backend.build_routes()
+
+        assert webhook_execute.call_count == 0
+        assert email_execute.call_count == 1
+
+    @patch.object(EmailAction, '_execute')
+    def test_record_events_creates_notifications(self, email_execute):
+        other_experiment = ExperimentFactory()
+        events = [notifier.backend.get_event(event_type=EXPERIMENT_SUCCEEDED, instance=experiment)
+                  for experiment in [self.experiment, other_experiment]]
+        notifier.backend.record_events(events)
+
+        assert email_execute.call_count == 2
+        assert NotificationEvent.objects.count() == 2
+        assert Notification.objects.count() == 4
+        for experiment in [self.experiment, other_experiment]:
+            notification_event = NotificationEvent.objects.get(object_id=experiment.id)
+            assert notification_event.content_object == experiment
+            assert set(notification_event.notifications.values_list('user__id', flat=True)) == {
+                experiment.user.id, experiment.project.user.id}
+
+    def test_recipients_are_cached_and_cleared(self):
+        event = notifier.backend.get_event(event_type=EXPERIMENT_SUCCEEDED,
+                                           instance=self.experiment)
+        project = self.experiment.project
+        recipients = {RecipientSpec(self.experiment.user.id, self.experiment.user.email),
+                      RecipientSpec(project.user.id, project.user.email)}
+        assert notifier.backend.get_recipients(event) == recipients
+
+        with CaptureQueriesContext(connection) as queries:
+            assert notifier.backend.get_recipients(event) == recipients
+        assert len(queries) == 0
+
+        # Changing the project's owner clears its cached owner
+        new_owner = UserFactory()
+        project.user = new_owner
+        project.save()
+        assert notifier.backend.get_recipients(event) == {
+            RecipientSpec(self.experiment.user.id, self.experiment.user.email),
+            RecipientSpec(new_owner.id, new_owner.email)}
+
+        # Changing the user's email clears its cached email
+        new_owner.email = 'new_owner@polyaxon.com'
+        new_owner.save()
+        assert RecipientSpec(new_owner.id, 'new_owner@polyaxon.com') in (
+            notifier.backend.get_recipients(event))
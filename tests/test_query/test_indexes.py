@@ -0,0 +1,109 @@
+import pytest
+
+from django.contrib.postgres.fields.jsonb import KeyTransform
+from django.db import connection
+
+from db.models.experiments import Experiment
+from db.redis.query_keys import RedisQueryKeys
+from factories.factory_experiments import ExperimentFactory
+from query.indexes import (
+    create_json_key_index,
+    get_json_key_index_name,
+    get_json_key_index_sql,
+    get_json_key_indexes,
+    index_json_keys
+)
+from query.managers.experiment import ExperimentQueryManager
+from tests.utils import BaseTest
+
+
+@pytest.mark.query_mark
+class TestQueryIndexes(BaseTest):
+    DISABLE_RUNNER = True
+
+    def get_plan(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('EXPLAIN ' + sql, params)
+            return '\n'.join(row[0] for row in cursor.fetchall())
+
+    def test_index_name(self):
+        name = get_json_key_index_name(model=Experiment, field='last_metric', key='loss')
+        assert name.startswith('qk_db_experiment_last_metric_')
+        assert name != get_json_key_index_name(model=Experiment,
+                                               field='last_metric',
+                                               key='accuracy')
+        assert len(get_json_key_index_name(model=Experiment,
+                                           field='last_metric',
+                                           key='a' * 200)) <= 63
+
+    def test_index_sql(self):
+        sql = get_json_key_index_sql(model=Experiment, field='last_metric', key="it's")
+        assert sql.startswith('CREATE INDEX CONCURRENTLY IF NOT EXISTS')
+        assert '("project_id", ("last_metric" -> \'it\'\'s\'))' in sql
+        sql = get_json_key_index_sql(model=Experiment,
+                                     field='declarations',
+                                     key='1',
+                                     concurrently=False)
+        assert 'CONCURRENTLY' not in sql
+        assert '("declarations" -> 1)' in sql
+
+    def test_apply_records_indexed_fields(self):
+        ExperimentQueryManager.apply(query_spec='metric.loss:<0.1, declarations.lr:0.01, id:1',
+                                     queryset=Experiment.objects)
+        ExperimentQueryManager.apply(query_spec='metric.loss:>0.01',
+                                     queryset=Experiment.objects)
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='last_metric',
+                                       min_hits=1,
+                                       count=10) == ['loss']
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='last_metric',
+                                       min_hits=3,
+                                       count=10) == []
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='declarations',
+                                       min_hits=1,
+                                       count=10) == ['lr']
+
+    def test_filters_and_orderings_use_the_index(self):
+        experiment = ExperimentFactory(last_metric={'loss': 0.05})
+        queryset = Experiment.objects.filter(project=experiment.project)
+        filtered = ExperimentQueryManager.apply(query_spec='metric.loss:<0.1', queryset=queryset)
+        ordered = queryset.annotate(loss=KeyTransform('loss', 'last_metric')).order_by('-loss')
+        index_name = get_json_key_index_name(model=Experiment, field='last_metric', key='loss')
+        assert index_name not in self.get_plan(filtered)
+
+        create_json_key_index(model=Experiment,
+                              field='last_metric',
+                              key='loss',
+                              concurrently=False)
+        assert index_name in get_json_key_indexes(model=Experiment, field='last_metric')
+        assert index_name in self.get_plan(filtered)
+        assert index_name in self.get_plan(ordered)
+        assert list(filtered) == [experiment]
+
+    def test_index_json_keys(self):
+        for key, hits in [('loss', 3), ('accuracy', 2), ('precision', 1)]:
+            for _ in range(hits):
+                RedisQueryKeys.increment(table='db_experiment', field='last_metric', key=key)
+
+        assert index_json_keys(model=Experiment,
+                               field='last_metric',
+                               min_hits=2,
+                               max_keys=1,
+                               concurrently=False) == ['loss']
+        # The max number of indexes is reached
+        assert index_json_keys(model=Experiment,
+                               field='last_metric',
+                               min_hits=2,
+                               max_keys=1,
+                               concurrently=False) == []
+        assert index_json_keys(model=Experiment,
+                               field='last_metric',
+                               min_hits=2,
+                               max_keys=5,
+                               concurrently=False) == ['accuracy']
+        assert len(get_json_key_indexes(model=Experiment, field='last_metric')) == 2
+        assert get_json_key_indexes(model=Experiment, field='declarations') == set()
@@ -204,3 +204,33 @@ class TestQueryManager(BaseTest):
             ).query)
         ]
         assert str(result_queryset.query) in queries
+
+    def test_compile(self):
+        compiled_query = ExperimentQueryManager.compile(self.query1)
+        assert compiled_query.q == (Q(updated_at__lte='2020-10-10') &
+                                    Q(started_at__gt='2010-10-10') &
+                                    ~Q(started_at='2016-10-01'))
+        assert compiled_query.callbacks == ()
+        assert compiled_query.indexed_keys == ()
+        # The compiled query is cached by manager and query spec
+        assert ExperimentQueryManager.compile(self.query1) is compiled_query
+        assert ExperimentGroupQueryManager.compile(self.query1) is not compiled_query
+
+        compiled_query = ExperimentQueryManager.compile(
+            self.query2 + ', independent:true, declarations.lr:0.1')
+        assert len(compiled_query.callbacks) == 1
+        assert compiled_query.indexed_keys == (('last_metric', 'loss'), ('declarations', 'lr'))
+
+        # Invalid queries are not cached
+        with self.assertRaises(QueryError):
+            ExperimentQueryManager.compile('foo:bar')
+        with self.assertRaises(QueryError):
+            ExperimentQueryManager.compile('foo:bar')
+
+    def test_apply_single_filter(self):
+        result_queryset = ExperimentQueryManager.apply(
+            query_spec=self.query2 + ', independent:true',
+            queryset=Experiment.objects)
+        assert str(result_queryset.query) == str(Experiment.objects.filter(
+            Q(last_metric__loss__lte=0.8) & Q(status__status__in=['starting', 'running'])
+        ).filter(experiment_group__isnull=True).query)
@@ -0,0 +1,151 @@
+import pytest
+
+from rest_framework import status
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from constants.urls import API_V1
+from db.models.bookmarks import Bookmark
+from factories.factory_build_jobs import BuildJobFactory
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from factories.factory_experiments import ExperimentFactory
+from factories.factory_jobs import JobFactory
+from factories.factory_plugins import TensorboardJobFactory
+from factories.factory_projects import ProjectFactory
+from tests.utils import BaseViewTest
+
+
+@pytest.mark.query_counts_mark
+class BaseTestListQueryCount(BaseViewTest):
+    """Checks that listing a page takes the same number of queries whatever its size."""
+    DISABLE_RUNNER = True
+    num_objects = 3
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.auth_client.user
+        self.project = ProjectFactory(user=self.user)
+        self.url = self.get_url()
+
+    def get_url(self):
+        raise NotImplementedError
+
+    def create_object(self, index):
+        raise NotImplementedError
+
+    def create_objects(self):
+        for i in range(self.num_objects):
+            self.create_object(index=i)
+
+    def get_num_queries(self, num_results):
+        with CaptureQueriesContext(connection) as context:
+            resp = self.auth_client.get(self.url)
+        assert resp.status_code == status.HTTP_200_OK
+        assert len(resp.data['results']) == num_results
+        return len(context.captured_queries)
+
+    def test_num_queries_is_constant(self):
+        self.create_objects()
+        num_queries = self.get_num_queries(num_results=self.num_objects)
+        self.create_objects()
+        assert self.get_num_queries(num_results=2 * self.num_objects) == num_queries
+
+
+class TestExperimentListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/experiments/'.format(API_V1)
+
+    def create_object(self, index):
+        group = ExperimentGroupFactory(project=self.project)
+        original = ExperimentFactory(project=self.project, experiment_group=group)
+        ExperimentFactory(project=self.project, original_experiment=original)
+
+    def get_num_queries(self, num_results):
+        return super().get_num_queries(num_results=2 * num_results)
+
+
+class TestProjectExperimentListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/{}/{}/experiments/'.format(API_V1, self.user.username, self.project.name)
+
+    def create_object(self, index):
+        group = ExperimentGroupFactory(project=self.project)
+        experiment = ExperimentFactory(project=self.project, experiment_group=group)
+        if index % 2:
+            Bookmark.objects.create(user=self.user, content_object=experiment)
+
+
+class TestProjectExperimentMetricsListQueryCount(TestProjectExperimentListQueryCount):
+    def get_url(self):
+        return '{}?metrics=true'.format(super().get_url())
+
+
+class TestExperimentGroupListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/{}/{}/groups/'.format(API_V1, self.user.username, self.project.name)
+
+    def create_object(self, index):
+        group = ExperimentGroupFactory(project=self.project)
+        if index % 2:
+            Bookmark.objects.create(user=self.user, content_object=group)
+
+
+class TestProjectJobListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/{}/{}/jobs/'.format(API_V1, self.user.username, self.project.name)
+
+    def create_object(self, index):
+        job = JobFactory(project=self.project)
+        if index % 2:
+            Bookmark.objects.create(user=self.user, content_object=job)
+
+
+class TestProjectBuildListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/{}/{}/builds/'.format(API_V1, self.user.username, self.project.name)
+
+    def create_object(self, index):
+        build = BuildJobFactory(project=self.project)
+        if index % 2:
+            Bookmark.objects.create(user=self.user, content_object=build)
+
+
+class TestProjectTensorboardListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/{}/{}/tensorboards/'.format(API_V1, self.user.username, self.project.name)
+
+    def create_object(self, index):
+        TensorboardJobFactory(project=self.project)
+
+
+class TestProjectListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/{}/'.format(API_V1, self.user.username)
+
+    def create_object(self, index):
+        project = ProjectFactory(user=self.user)
+        if index % 2:
+            Bookmark.objects.create(user=self.user, content_object=project)
+
+    def get_num_queries(self, num_results):
+        # The project created in `setUp` is listed as well
+        return super().get_num_queries(num_results=num_results + 1)
+
+
+class TestExperimentBookmarkListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/bookmarks/{}/experiments/'.format(API_V1, self.user.username)
+
+    def create_object(self, index):
+        group = ExperimentGroupFactory(project=self.project)
+        experiment = ExperimentFactory(project=self.project, experiment_group=group)
+        Bookmark.objects.create(user=self.user, content_object=experiment)
+
+
+class TestJobBookmarkListQueryCount(BaseTestListQueryCount):
+    def get_url(self):
+        return '/{}/bookmarks/{}/jobs/'.format(API_V1, self.user.username)
+
+    def create_object(self, index):
+        Bookmark.objects.create(user=self.user, content_object=JobFactory(project=self.project))
@@ -0,0 +1,22 @@
+import pytest
+
+from db.redis.activity_views import RedisActivityViews
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisActivityViews(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_mark_views(self):
+        RedisActivityViews.clear(event_type='experiment.viewed', object_id=1, actor_id=1)
+        RedisActivityViews.clear(event_type='experiment.viewed', object_id=1, actor_id=2)
+
+        assert RedisActivityViews.mark_views([('experiment.viewed', 1, 1),
+                                              ('experiment.viewed', 1, 1),
+                                              ('experiment.viewed', 1, 2)], ttl=60) == [
+            True, False, True]
+        assert RedisActivityViews.mark_views([('experiment.viewed', 1, 1)], ttl=60) == [False]
+
+        RedisActivityViews.clear(event_type='experiment.viewed', object_id=1, actor_id=1)
+        assert RedisActivityViews.mark_views([('experiment.viewed', 1, 1)], ttl=60) == [True]
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+
+from db.models.experiments import ExperimentMetric
+from db.redis.group_metrics import RedisGroupMetrics
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from factories.factory_experiments import ExperimentFactory
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisGroupMetrics(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_set_get_experiments_metrics(self):
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=1, metric='loss', experiment_ids=[]) == ([], [])
+
+        RedisGroupMetrics.set_experiment_metrics(experiment_group_id=1,
+                                                 experiment_id=1,
+                                                 last_metric={'loss': 0.1})
+        RedisGroupMetrics.set_experiments_metrics(experiment_group_id=1,
+                                                  experiments_metrics=[(2, {'accuracy': 0.9}),
+                                                                       (3, {'loss': 0.3})])
+        RedisGroupMetrics.set_experiment_metrics(experiment_group_id=2,
+                                                 experiment_id=4,
+                                                 last_metric={'loss': 0.4})
+
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=1,
+            metric='loss',
+            experiment_ids=[1, 2, 3, 4]) == ([(1, 0.1), (2, None), (3, 0.3)], [4])
+
+        # Updates override the previous metrics
+        RedisGroupMetrics.set_experiment_metrics(experiment_group_id=1,
+                                                 experiment_id=1,
+                                                 last_metric={'loss': 0.05})
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=1, metric='loss', experiment_ids=[1]) == ([(1, 0.05)], [])
+
+        # Filling the cache does not override the cached metrics
+        RedisGroupMetrics.set_experiments_metrics(experiment_group_id=1,
+                                                  experiments_metrics=[(1, {'loss': 0.1})])
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=1, metric='loss', experiment_ids=[1]) == ([(1, 0.05)], [])
+
+        RedisGroupMetrics.clear(experiment_group_id=1)
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=1, metric='loss', experiment_ids=[1, 2]) == ([], [1, 2])
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=2, metric='loss', experiment_ids=[4]) == ([(4, 0.4)], [])
+
+    @patch('scheduler.tasks.experiment_groups.experiments_group_create.apply_async')
+    def test_new_metrics_update_the_group_cache(self, _):
+        experiment_group = ExperimentGroupFactory()
+        experiment1 = ExperimentFactory(experiment_group=experiment_group)
+        experiment2 = ExperimentFactory(experiment_group=experiment_group)
+        ExperimentMetric.objects.create(experiment=experiment1, values={'loss': 0.5})
+        ExperimentMetric.objects.create(experiment=experiment1, values={'accuracy': 0.8})
+
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=experiment_group.id,
+            metric='loss',
+            experiment_ids=[experiment1.id, experiment2.id]) == ([(experiment1.id, 0.5)],
+                                                                 [experiment2.id])
+
+        # The group reads the cache and only queries the missing experiments
+        experiment3 = ExperimentFactory(experiment_group=experiment_group,
+                                        last_metric={'loss': 0.2})
+        experiments_metrics = experiment_group.get_experiments_metrics(
+            metric='accuracy',
+            experiment_ids=[experiment1.id, experiment2.id, experiment3.id])
+        assert sorted(experiments_metrics) == sorted([(experiment1.id, 0.8),
+                                                      (experiment2.id, None),
+                                                      (experiment3.id, None)])
+        # The missing experiments with metrics are cached
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=experiment_group.id,
+            metric='loss',
+            experiment_ids=[experiment3.id]) == ([(experiment3.id, 0.2)], [])
+
+        experiment_group_id = experiment_group.id
+        experiment_group.delete()
+        assert RedisGroupMetrics.get_experiments_metrics(
+            experiment_group_id=experiment_group_id,
+            metric='loss',
+            experiment_ids=[experiment1.id]) == ([], [experiment1.id])
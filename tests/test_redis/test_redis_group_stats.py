@@ -0,0 +1,43 @@
+import pytest
+
+from db.redis.group_stats import RedisGroupStats
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisGroupStats(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_set_get_stats(self):
+        params = {'metrics': ['loss'], 'top_k': 1}
+        assert RedisGroupStats.get_stats(experiment_group_id=1, params=params) == (None, 0)
+
+        RedisGroupStats.set_stats(experiment_group_id=1,
+                                  params=params,
+                                  stats={'loss': 0.1},
+                                  generation=0)
+        RedisGroupStats.set_stats(experiment_group_id=2,
+                                  params=params,
+                                  stats={'loss': 0.2},
+                                  generation=0)
+        assert RedisGroupStats.get_stats(experiment_group_id=1,
+                                         params={'top_k': 1, 'metrics': ['loss']}) == (
+            {'loss': 0.1}, 0)
+        assert RedisGroupStats.get_stats(experiment_group_id=1,
+                                         params={'metrics': ['loss'], 'top_k': 2}) == (None, 0)
+
+        RedisGroupStats.clear(experiment_group_id=1)
+        assert RedisGroupStats.get_stats(experiment_group_id=1, params=params) == (None, 1)
+        assert RedisGroupStats.get_stats(experiment_group_id=2, params=params) == (
+            {'loss': 0.2}, 0)
+
+    def test_set_stats_ignores_stats_computed_before_a_clear(self):
+        params = {'metrics': ['loss'], 'top_k': 1}
+        _, generation = RedisGroupStats.get_stats(experiment_group_id=1, params=params)
+        RedisGroupStats.clear(experiment_group_id=1)
+        RedisGroupStats.set_stats(experiment_group_id=1,
+                                  params=params,
+                                  stats={'loss': 0.1},
+                                  generation=generation)
+        assert RedisGroupStats.get_stats(experiment_group_id=1, params=params) == (
+            None, generation + 1)
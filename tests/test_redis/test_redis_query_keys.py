@@ -0,0 +1,43 @@
+import pytest
+
+from db.redis.query_keys import RedisQueryKeys
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisQueryKeys(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_increment_get_keys(self):
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='last_metric',
+                                       min_hits=1,
+                                       count=10) == []
+
+        for _ in range(3):
+            RedisQueryKeys.increment(table='db_experiment', field='last_metric', key='loss')
+        RedisQueryKeys.increment(table='db_experiment', field='last_metric', key='accuracy')
+        RedisQueryKeys.increment(table='db_experiment', field='declarations', key='lr')
+
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='last_metric',
+                                       min_hits=1,
+                                       count=10) == ['loss', 'accuracy']
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='last_metric',
+                                       min_hits=2,
+                                       count=10) == ['loss']
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='last_metric',
+                                       min_hits=1,
+                                       count=1) == ['loss']
+
+        RedisQueryKeys.clear(table='db_experiment', field='last_metric')
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='last_metric',
+                                       min_hits=1,
+                                       count=10) == []
+        assert RedisQueryKeys.get_keys(table='db_experiment',
+                                       field='declarations',
+                                       min_hits=1,
+                                       count=10) == ['lr']
@@ -0,0 +1,31 @@
+import pytest
+
+from db.redis.recipients import RedisRecipients
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisRecipients(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_projects_owners(self):
+        RedisRecipients.clear_project(1)
+        RedisRecipients.clear_project(2)
+        assert RedisRecipients.get_projects_owners([1, 2]) == {}
+
+        RedisRecipients.set_projects_owners({1: 10, 2: 20})
+        assert RedisRecipients.get_projects_owners([1, 2, 3]) == {1: 10, 2: 20}
+
+        RedisRecipients.clear_project(1)
+        assert RedisRecipients.get_projects_owners([1, 2]) == {2: 20}
+
+    def test_users_emails(self):
+        RedisRecipients.clear_user(1)
+        RedisRecipients.clear_user(2)
+        assert RedisRecipients.get_users_emails([1, 2]) == {}
+
+        RedisRecipients.set_users_emails({1: 'foo@bar.com', 2: ''})
+        assert RedisRecipients.get_users_emails([1, 2, 3]) == {1: 'foo@bar.com', 2: ''}
+
+        RedisRecipients.clear_user(2)
+        assert RedisRecipients.get_users_emails([1, 2]) == {1: 'foo@bar.com'}
@@ -0,0 +1,34 @@
+import pytest
+
+from db.redis.webhooks import RedisWebHookDeadLetters
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisWebHookDeadLetters(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_add_get_letters(self):
+        RedisWebHookDeadLetters.clear()
+        assert RedisWebHookDeadLetters.get_letters() == []
+
+        RedisWebHookDeadLetters.add({'url': 'http://foo.com', 'attempts': 1})
+        RedisWebHookDeadLetters.add({'url': 'http://bar.com', 'attempts': 2})
+        assert RedisWebHookDeadLetters.get_letters() == [
+            {'url': 'http://bar.com', 'attempts': 2}, {'url': 'http://foo.com', 'attempts': 1}]
+        assert RedisWebHookDeadLetters.get_letters(limit=1) == [
+            {'url': 'http://bar.com', 'attempts': 2}]
+
+        RedisWebHookDeadLetters.clear()
+        assert RedisWebHookDeadLetters.get_letters() == []
+
+    def test_letters_are_capped(self):
+        RedisWebHookDeadLetters.clear()
+        max_size = RedisWebHookDeadLetters.MAX_SIZE
+        RedisWebHookDeadLetters.MAX_SIZE = 2
+        try:
+            for i in range(3):
+                RedisWebHookDeadLetters.add({'attempts': i})
+            assert RedisWebHookDeadLetters.get_letters() == [{'attempts': 2}, {'attempts': 1}]
+        finally:
+            RedisWebHookDeadLetters.MAX_SIZE = max_size
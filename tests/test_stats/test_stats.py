@@ -0,0 +1,92 @@
+import pytest
+
+from django.conf import settings
+from django.test import override_settings
+
+import stats
+
+from stats.base import BaseStatsBackend
+from stats.noop import NoOpStatsBackend
+from tests.utils import BaseTest
+
+
+class DummyStatsBackend(BaseStatsBackend):
+    def __init__(self, prefix=None):
+        self.stats = []
+        self.flushed = []
+        super().__init__(prefix=prefix)
+
+    def _incr(self, key, amount=1, sample_rate=1, **kwargs):
+        self.stats.append(('incr', key, amount))
+
+    def _timing(self, key, value, sample_rate=1, **kwargs):
+        self.stats.append(('timing', key, value))
+
+    def _histogram(self, key, value, sample_rate=1, **kwargs):
+        self.stats.append(('histogram', key, value))
+
+    def _gauge(self, key, value, sample_rate=1, **kwargs):
+        self.stats.append(('gauge', key, value))
+
+    def _flush(self):
+        self.flushed, self.stats = self.stats, []
+
+
+@pytest.mark.stats_mark
+class StatsTest(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_default_backend(self):
+        assert stats.get_stats_backend() == 'stats.noop.NoOpStatsBackend'
+
+    @override_settings(STATS_BACKEND=settings.STATS_BACKEND_STATSD)
+    def test_statsd_backend(self):
+        assert stats.get_stats_backend() == 'stats.statsd.StatsdStatsBackend'
+        assert set(stats.get_backend_options()) == {'host', 'port', 'batch_size', 'batch_interval'}
+
+    def test_stats_are_prefixed(self):
+        backend = DummyStatsBackend(prefix='polyaxon')
+        backend.incr('auditor.events', amount=2)
+        backend.histogram('auditor.batch_size', 10)
+        backend.gauge('auditor.buffer_size', 5)
+
+        assert backend.stats == [('incr', 'polyaxon.auditor.events', 2),
+                                 ('histogram', 'polyaxon.auditor.batch_size', 10),
+                                 ('gauge', 'polyaxon.auditor.buffer_size', 5)]
+
+    def test_timer_records_the_duration_in_milliseconds(self):
+        backend = DummyStatsBackend(prefix='')
+        with backend.timer('auditor.record'):
+            pass
+
+        assert len(backend.stats) == 1
+        stat, key, value = backend.stats[0]
+        assert stat == 'timing'
+        assert key == 'auditor.record'
+        assert 0 <= value < 1000
+
+    def test_timer_records_the_duration_of_failed_blocks(self):
+        backend = DummyStatsBackend(prefix='')
+        with pytest.raises(ValueError):
+            with backend.timer('auditor.record'):
+                raise ValueError
+
+        assert [stat for stat, _, _ in backend.stats] == ['timing']
+
+    def test_flush(self):
+        backend = DummyStatsBackend(prefix='')
+        backend.incr('auditor.events')
+        backend.flush()
+
+        assert backend.stats == []
+        assert backend.flushed == [('incr', 'auditor.events', 1)]
+
+    def test_noop_backend(self):
+        backend = NoOpStatsBackend(prefix='')
+        backend.incr('auditor.events')
+        backend.timing('auditor.record', 1)
+        backend.histogram('auditor.batch_size', 1)
+        backend.gauge('auditor.buffer_size', 1)
+        with backend.timer('auditor.record'):
+            pass
+        backend.flush()
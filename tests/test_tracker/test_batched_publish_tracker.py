@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+import pytest
+
+from db.models.clusters import Cluster
+from event_manager.events.user import USER_ACTIVATED
+from factories.factory_users import UserFactory
+from tests.utils import BaseTest
+from tracker.batched_publish_tracker import BatchedPublishTrackerService
+
+
+@pytest.mark.tracker_mark
+class BatchedPublishTrackerTest(BaseTest):
+    def setUp(self):
+        self.cluster = Cluster.load()
+        self.admin = UserFactory(is_staff=True, is_superuser=True)
+        self.user = UserFactory()
+        self.publisher = BatchedPublishTrackerService(key='key',
+                                                      buffer_size=3,
+                                                      batch_size=2,
+                                                      window=3600)
+        self.publisher.setup()
+        super().setUp()
+
+    def record(self, n_events):
+        for _ in range(n_events):
+            self.publisher.record(event_type=USER_ACTIVATED,
+                                  instance=self.user,
+                                  actor_id=self.admin.id,
+                                  actor_name=self.admin.username)
+
+    def test_record_only_buffers_the_events(self):
+        with patch('tracker.batched_publish_tracker.post') as mock_post:
+            with patch('analytics.track') as mock_track:
+                self.record(n_events=2)
+
+        assert mock_post.call_count == 0
+        assert mock_track.call_count == 0
+        assert self.publisher._queue.qsize() == 2
+
+        # The buffer only holds the serialized events
+        event_type, properties, _, traits = self.publisher._queue.get_nowait()
+        assert event_type == USER_ACTIVATED
+        assert isinstance(properties, dict)
+        assert 'actor_name' not in properties['data']
+        assert traits is None
+
+    def test_flush_uploads_the_events_in_batches(self):
+        self.record(n_events=3)
+        with patch('tracker.batched_publish_tracker.post') as mock_post:
+            self.publisher.flush(self.publisher._queue)
+
+        assert mock_post.call_count == 2
+        batches = [call[1]['batch'] for call in mock_post.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 1]
+        message = batches[0][0]
+        assert message['type'] == 'track'
+        assert message['event'] == USER_ACTIVATED
+        assert message['userId'] == self.cluster.uuid.hex
+        assert 'actor_name' not in message['properties']
+        assert self.publisher._queue.qsize() == 0
+
+    def test_record_drops_the_events_when_the_buffer_is_full(self):
+        self.record(n_events=5)
+        assert self.publisher._queue.qsize() == 3
+
+    def test_flush_drops_the_events_failing_to_upload(self):
+        self.record(n_events=3)
+        with patch('tracker.batched_publish_tracker.post',
+                   side_effect=ConnectionError) as mock_post:
+            self.publisher.flush(self.publisher._queue)
+
+        assert mock_post.call_count == 2
+        assert self.publisher._queue.qsize() == 0
@@ -18,3 +18,8 @@ class TrackerTest(BaseTest):
     def test_publisher_backend_tracker(self):
         backend = tracker.get_tracker_backend()
         assert backend == 'tracker.publish_tracker.PublishTrackerService'
+
+    @override_settings(TRACKER_BACKEND=settings.TRACKER_BACKEND_BATCHED_PUBLISHER)
+    def test_batched_publisher_backend_tracker(self):
+        backend = tracker.get_tracker_backend()
+        assert backend == 'tracker.batched_publish_tracker.BatchedPublishTrackerService'